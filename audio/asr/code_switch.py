@@ -0,0 +1,144 @@
+"""
+code_switch.py — Per-Region Language Routing for Code-Switched Audio
+--------------------------------------------------------------------
+Whisper locks one `language` for a whole transcription, which garbles
+Hindi-English (and similar) code-switched podcasts. This module splits
+the shared waveform into speech regions, detects the language of every
+region in batches, groups consecutive same-language regions into runs
+and transcribes the runs in parallel, each with its own language setting.
+Runs are views into the same decoded buffer, so nothing is decoded twice.
+"""
+
+import queue
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Tuple
+
+import numpy as np
+import torch
+import whisper
+
+from audio.audio_processing.vad import speech_regions, SAMPLE_RATE
+
+# =========================
+# CONFIG
+# =========================
+
+CODE_SWITCH_WORKERS = 2
+DETECTION_BATCH_SIZE = 16
+MIN_REGION_CONFIDENCE = 0.5  # below this a region follows the dominant language
+
+
+def detect_region_languages(model, audio: np.ndarray, regions: List[Tuple[int, int]]) -> List[Tuple[str, float]]:
+    """Detect (language, confidence) for every region, batching the encoder."""
+    results = []
+
+    for i in range(0, len(regions), DETECTION_BATCH_SIZE):
+        batch = regions[i:i + DETECTION_BATCH_SIZE]
+        mels = torch.stack([
+            whisper.log_mel_spectrogram(
+                whisper.pad_or_trim(np.asarray(audio[s:e], dtype=np.float32)),
+                n_mels=model.dims.n_mels
+            )
+            for s, e in batch
+        ]).to(model.device)
+
+        _, probs = model.detect_language(mels)
+        for p in probs:
+            lang = max(p, key=p.get)
+            results.append((lang, float(p[lang])))
+
+    return results
+
+
+def build_language_runs(
+    regions: List[Tuple[int, int]],
+    languages: List[Tuple[str, float]]
+) -> Tuple[List[Dict], str]:
+    """
+    Group consecutive regions into single-language runs.
+
+    Low-confidence regions take the episode's dominant language (weighted
+    by speech duration) so a single noisy region doesn't split a run.
+
+    Returns:
+        Tuple of (runs, dominant_language)
+    """
+    durations: Dict[str, int] = {}
+    for (s, e), (lang, conf) in zip(regions, languages):
+        if conf >= MIN_REGION_CONFIDENCE:
+            durations[lang] = durations.get(lang, 0) + (e - s)
+
+    dominant = max(durations, key=durations.get) if durations else languages[0][0]
+
+    runs = []
+    for (s, e), (lang, conf) in zip(regions, languages):
+        lang = lang if conf >= MIN_REGION_CONFIDENCE else dominant
+        if runs and runs[-1]["language"] == lang:
+            runs[-1]["end"] = e
+        else:
+            runs.append({"language": lang, "start": s, "end": e})
+
+    return runs, dominant
+
+
+def transcribe_code_switched(
+    model,
+    audio: np.ndarray,
+    model_name: str,
+    workers: int = CODE_SWITCH_WORKERS
+) -> Dict:
+    """
+    Transcribe code-switched audio with per-region language settings.
+
+    Args:
+        model: Loaded whisper model (used for detection and one worker)
+        audio: Shared 16 kHz waveform
+        model_name: Whisper model name, used to load extra worker models
+        workers: Number of runs transcribed concurrently
+
+    Returns:
+        Whisper-style result dict; every segment carries its run's language
+    """
+    regions = speech_regions(audio)
+    if not regions:
+        return {"language": "en", "segments": []}
+
+    languages = detect_region_languages(model, audio, regions)
+    runs, dominant = build_language_runs(regions, languages)
+    print(f"Code-switch mode: {len(regions)} speech regions in {len(runs)} language runs")
+
+    # Whisper's kv-cache hooks are per model, so each worker owns a model
+    workers = max(1, min(workers, len(runs)))
+    models = queue.Queue()
+    models.put(model)
+    for _ in range(workers - 1):
+        models.put(whisper.load_model(model_name))
+
+    def transcribe_run(run):
+        worker_model = models.get()
+        try:
+            result = worker_model.transcribe(
+                audio[run["start"]:run["end"]],
+                language=run["language"],
+                task="transcribe",
+                fp16=False,
+                verbose=None
+            )
+        finally:
+            models.put(worker_model)
+
+        offset = run["start"] / SAMPLE_RATE
+        return [
+            {
+                "start": seg["start"] + offset,
+                "end": seg["end"] + offset,
+                "text": seg["text"],
+                "language": run["language"]
+            }
+            for seg in result.get("segments", [])
+        ]
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        segments = [seg for run_segments in pool.map(transcribe_run, runs) for seg in run_segments]
+
+    return {"language": dominant, "segments": segments}
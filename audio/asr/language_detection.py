@@ -0,0 +1,140 @@
+"""
+language_detection.py — Sampled Whisper Language Detection
+----------------------------------------------------------
+Scores several 30-second windows spread through the episode instead of
+only the first one (which is often a music intro), stops as soon as the
+averaged confidence clears a threshold, and caches the result per audio
+fingerprint so re-processing an episode skips detection entirely. The
+cache keeps the most recently used LANGUAGE_CACHE_SIZE entries.
+"""
+
+import json
+import os
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import numpy as np
+import whisper
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+
+# =========================
+# CONFIG
+# =========================
+
+SAMPLE_RATE = 16000
+WINDOW_SECONDS = 30
+MAX_WINDOWS = 5
+EARLY_EXIT_CONFIDENCE = 0.80
+MIN_WINDOW_RMS = 0.01  # windows quieter than this carry no speech to score
+LANGUAGE_CACHE_FILE = PROJECT_ROOT / "data" / "cache" / "language_detection.json"
+LANGUAGE_CACHE_SIZE = 1000  # entries; least recently used are evicted first
+
+
+def window_offsets(n_samples: int, max_windows: int = MAX_WINDOWS) -> List[int]:
+    """
+    Start offsets of the detection windows, in probing order.
+
+    Windows are evenly spread through the file and probed middle-first,
+    then alternating outwards, so intros and outros are consulted last.
+    """
+    window = WINDOW_SECONDS * SAMPLE_RATE
+    if n_samples <= window:
+        return [0]
+
+    n_windows = min(max_windows, n_samples // window)
+    span = n_samples - window
+    starts = [int(span * (k + 0.5) / n_windows) for k in range(n_windows)]
+
+    middle = (n_windows - 1) / 2
+    order = sorted(range(n_windows), key=lambda k: (abs(k - middle), k))
+    return [starts[k] for k in order]
+
+
+def _load_cache() -> Dict[str, Dict]:
+    try:
+        with open(LANGUAGE_CACHE_FILE, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return {}
+
+
+def _save_cache(cache: Dict[str, Dict]) -> None:
+    # Entries are kept in use order, oldest first
+    for key in list(cache)[:max(len(cache) - LANGUAGE_CACHE_SIZE, 0)]:
+        del cache[key]
+
+    LANGUAGE_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = LANGUAGE_CACHE_FILE.with_suffix(f".{os.getpid()}.tmp")
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(cache, f, indent=2)
+    os.replace(temp_path, LANGUAGE_CACHE_FILE)
+
+
+def detect_language_sampled(
+    model,
+    audio: np.ndarray,
+    cache_key: Optional[str] = None,
+    max_windows: int = MAX_WINDOWS,
+    threshold: float = EARLY_EXIT_CONFIDENCE
+) -> Tuple[str, float]:
+    """
+    Detect the spoken language from several windows of the waveform.
+
+    Args:
+        model: Loaded whisper model
+        audio: 16 kHz mono waveform
+        cache_key: Identifier of the audio (e.g. fingerprint + model name);
+                   results are cached under it when given
+        max_windows: Upper bound on windows scored
+        threshold: Averaged confidence at which probing stops early
+
+    Returns:
+        Tuple of (language_code, confidence)
+    """
+    if cache_key:
+        cache = _load_cache()
+        cached = cache.pop(cache_key, None)
+        if cached:
+            # Move to the most recently used end
+            cache[cache_key] = cached
+            _save_cache(cache)
+            return cached["language"], cached["confidence"]
+
+    window = WINDOW_SECONDS * SAMPLE_RATE
+    offsets = window_offsets(len(audio), max_windows)
+
+    # Skip silent/near-silent windows unless nothing else is left
+    voiced = [
+        o for o in offsets
+        if np.sqrt(np.mean(np.square(audio[o:o + window], dtype=np.float64))) >= MIN_WINDOW_RMS
+    ]
+    offsets = voiced or offsets[:1]
+
+    totals: Dict[str, float] = {}
+    scored = 0
+
+    for offset in offsets:
+        segment = whisper.pad_or_trim(np.asarray(audio[offset:offset + window], dtype=np.float32))
+        mel = whisper.log_mel_spectrogram(segment, n_mels=model.dims.n_mels).to(model.device)
+        _, probs = model.detect_language(mel)
+
+        for lang, prob in probs.items():
+            totals[lang] = totals.get(lang, 0.0) + prob
+        scored += 1
+
+        best = max(totals, key=totals.get)
+        if totals[best] / scored >= threshold:
+            break
+
+    language = max(totals, key=totals.get)
+    confidence = round(totals[language] / scored, 4)
+    print(f"Language detection used {scored}/{len(offsets)} window(s)")
+
+    if cache_key:
+        cache = _load_cache()
+        cache.pop(cache_key, None)
+        cache[cache_key] = {"language": language, "confidence": confidence, "windows": scored}
+        _save_cache(cache)
+
+    return language, confidence
@@ -0,0 +1,206 @@
+"""
+audio_loader.py — Decode-Once Waveform Cache for LEXARA
+--------------------------------------------------------
+Decodes an episode with ffmpeg a single time into a 16 kHz mono float32
+WAV under data/waveforms. Language detection, transcription, VAD and UI
+playback all read that cache instead of decoding the upload again; large
+waveforms are memory-mapped rather than loaded into RAM.
+"""
+
+import hashlib
+import json
+import os
+import struct
+import subprocess
+from pathlib import Path
+from typing import Tuple, Union
+
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+
+# =========================
+# CONFIG
+# =========================
+
+SAMPLE_RATE = 16000  # Whisper's native rate
+WAVEFORM_CACHE_DIR = PROJECT_ROOT / "data" / "waveforms"
+MEMMAP_MIN_BYTES = 256 * 1024 * 1024  # ~70 minutes of decoded audio
+READ_CHUNK_BYTES = 1 << 20
+WAV_HEADER_BYTES = 44
+SOURCE_INDEX_FILE = "sources.json"  # upload path -> fingerprint of its waveform
+
+# (path, inode, size, mtime_ns) -> content fingerprint
+_FINGERPRINTS = {}
+
+
+def buffer_fingerprint(buffer: bytes) -> str:
+    """Cache key of in-memory audio bytes; equals audio_fingerprint of the same file."""
+    return hashlib.blake2b(buffer, digest_size=20).hexdigest()
+
+
+def audio_fingerprint(audio_path: Union[str, Path]) -> str:
+    """
+    Cache key of an audio file: blake2b hash of its content.
+
+    Rewriting identical bytes or copying the file keeps the key, any edit
+    changes it. The file is hashed in chunks and the digest is memoized
+    per (path, inode, size, mtime), so repeated lookups within a process
+    do not re-read multi-GB uploads.
+    """
+    audio_path = Path(audio_path).resolve()
+    stat = audio_path.stat()
+    stamp = (str(audio_path), stat.st_ino, stat.st_size, stat.st_mtime_ns)
+    if stamp in _FINGERPRINTS:
+        return _FINGERPRINTS[stamp]
+
+    digest = hashlib.blake2b(digest_size=20)
+    with open(audio_path, "rb") as f:
+        for chunk in iter(lambda: f.read(READ_CHUNK_BYTES), b""):
+            digest.update(chunk)
+
+    _FINGERPRINTS[stamp] = digest.hexdigest()
+    return _FINGERPRINTS[stamp]
+
+
+def cached_waveform_path(audio_path: Union[str, Path]) -> Path:
+    """Location of the decoded waveform for an audio file."""
+    return WAVEFORM_CACHE_DIR / f"{audio_fingerprint(audio_path)}.wav"
+
+
+def _record_source(audio_path: Union[str, Path], fingerprint: str) -> None:
+    """
+    Point an upload path at its newest waveform and evict the one it replaces.
+
+    The previous waveform is only deleted when no other source still maps
+    to it, so identical uploads under different names keep sharing it.
+    """
+    index_path = WAVEFORM_CACHE_DIR / SOURCE_INDEX_FILE
+    try:
+        with open(index_path, "r", encoding="utf-8") as f:
+            sources = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        sources = {}
+
+    source = str(Path(audio_path).resolve())
+    previous = sources.get(source)
+    if previous == fingerprint:
+        return
+    sources[source] = fingerprint
+
+    temp_path = index_path.with_suffix(f".{os.getpid()}.tmp")
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(sources, f, indent=2)
+    os.replace(temp_path, index_path)
+
+    if previous and previous not in sources.values():
+        (WAVEFORM_CACHE_DIR / f"{previous}.wav").unlink(missing_ok=True)
+
+
+def _float_wav_header(n_samples: int) -> bytes:
+    data_bytes = n_samples * 4
+    return (
+        b"RIFF" + struct.pack("<I", 36 + data_bytes) + b"WAVE"
+        + b"fmt " + struct.pack("<IHHIIHH", 16, 3, 1, SAMPLE_RATE, SAMPLE_RATE * 4, 4, 32)
+        + b"data" + struct.pack("<I", data_bytes)
+    )
+
+
+def decode_to_cache(audio_path: Union[str, Path]) -> Path:
+    """
+    Decode an audio file into the waveform cache (no-op if already cached).
+
+    ffmpeg output is streamed to disk in chunks, so decoding never holds
+    the whole episode in memory.
+    """
+    cache_path = cached_waveform_path(audio_path)
+    if cache_path.exists():
+        _record_source(audio_path, cache_path.stem)
+        return cache_path
+
+    cache_path.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+
+    # Same decode settings as whisper.load_audio; errors only on stderr so
+    # the pipe cannot fill up while stdout is being drained
+    cmd = [
+        "ffmpeg", "-nostdin", "-loglevel", "error", "-threads", "0", "-i", str(audio_path),
+        "-f", "s16le", "-ac", "1", "-acodec", "pcm_s16le", "-ar", str(SAMPLE_RATE), "-"
+    ]
+
+    n_samples = 0
+    process = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    try:
+        with open(temp_path, "wb") as out:
+            out.write(_float_wav_header(0))
+            leftover = b""
+            while True:
+                chunk = process.stdout.read(READ_CHUNK_BYTES)
+                if not chunk:
+                    break
+                chunk = leftover + chunk
+                usable = len(chunk) - len(chunk) % 2
+                leftover = chunk[usable:]
+                pcm = np.frombuffer(chunk[:usable], dtype=np.int16)
+                out.write((pcm.astype(np.float32) / 32768.0).tobytes())
+                n_samples += len(pcm)
+
+            stderr = process.stderr.read()
+            if process.wait() != 0:
+                raise RuntimeError(f"Failed to load audio: {stderr.decode(errors='ignore')}")
+
+            out.seek(0)
+            out.write(_float_wav_header(n_samples))
+
+        os.replace(temp_path, cache_path)
+        _record_source(audio_path, cache_path.stem)
+    finally:
+        if process.poll() is None:
+            process.kill()
+        if temp_path.exists():
+            temp_path.unlink()
+
+    return cache_path
+
+
+def load_waveform(audio_path: Union[str, Path], mmap: bool = None) -> np.ndarray:
+    """
+    Return the 16 kHz mono float32 waveform of an audio file.
+
+    Args:
+        audio_path: Path to the original upload
+        mmap: Memory-map the cached waveform instead of reading it into RAM.
+              Defaults to True when the decoded size exceeds MEMMAP_MIN_BYTES.
+
+    Returns:
+        Waveform array usable directly by whisper
+    """
+    cache_path = decode_to_cache(audio_path)
+
+    if mmap is None:
+        mmap = cache_path.stat().st_size - WAV_HEADER_BYTES >= MEMMAP_MIN_BYTES
+
+    if mmap:
+        # Copy-on-write: callers may modify the array in place (padding,
+        # normalization) like the in-RAM copy; only the pages they touch
+        # are copied and the shared cache file is never written
+        return np.memmap(cache_path, dtype=np.float32, mode="c", offset=WAV_HEADER_BYTES)
+
+    return np.fromfile(cache_path, dtype=np.float32, offset=WAV_HEADER_BYTES)
+
+
+def playback_source(audio_path: Union[str, Path]) -> Tuple[Path, str]:
+    """
+    Pick the file the UI should stream for playback.
+
+    Uses the decoded waveform when it already exists and is no larger than
+    the upload (e.g. long WAV recordings), otherwise the upload itself.
+    """
+    audio_path = Path(audio_path)
+    mime = "audio/wav" if audio_path.suffix.lower() == ".wav" else "audio/mp3"
+
+    cache_path = cached_waveform_path(audio_path)
+    if cache_path.exists() and cache_path.stat().st_size <= audio_path.stat().st_size:
+        return cache_path, "audio/wav"
+
+    return audio_path, mime
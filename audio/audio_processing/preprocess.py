@@ -1,7 +1,11 @@
 import os
-import librosa
-import soundfile as sf
+import argparse
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
 import numpy as np
+import soundfile as sf
+import soxr
 
 
 RAW_AUDIO_DIR = "data/raw_audio"
@@ -10,50 +14,240 @@ PROCESSED_AUDIO_DIR = "data/processed_audio"
 TARGET_SAMPLE_RATE = 16000
 SILENCE_TOP_DB = 30
 
+# Streaming parameters: every stage works on fixed-size blocks so peak
+# memory depends on these values, not on the length of the episode.
+BLOCK_SECONDS = 30
+N_FFT = 2048
+HOP_LENGTH = 512
+NOISE_PROFILE_FRAMES = 600  # ~19s of history for the running noise median
+TRIM_FRAME_LENGTH = 512
+
+
+class StreamingNoiseReducer:
+    """
+    Spectral-subtraction denoiser that runs block by block.
+
+    Frames are analysed with a Hann window, the noise profile is the
+    per-bin median magnitude over the last ``history`` frames, and the
+    cleaned frames are resynthesised with overlap-add. Output is delayed
+    internally so every returned sample has received full window overlap.
+    """
+
+    def __init__(self, n_fft: int = N_FFT, hop_length: int = HOP_LENGTH,
+                 history: int = NOISE_PROFILE_FRAMES):
+        if n_fft % hop_length:
+            raise ValueError("n_fft must be a multiple of hop_length")
+
+        self.n_fft = n_fft
+        self.hop_length = hop_length
+        self.history = history
+        self.overlap = n_fft // hop_length
+
+        self.window = np.hanning(n_fft + 1)[:-1].astype(np.float32)
+        window_sq = (self.window ** 2).reshape(self.overlap, hop_length).sum(axis=0)
+        self._norm = np.maximum(window_sq, 1e-8)
+
+        self._history = np.zeros((n_fft // 2 + 1, history), dtype=np.float32)
+        self._history_len = 0
+        self._history_pos = 0
+
+        # Leading zeros give the first real samples the same overlap as the rest
+        self._pending = np.zeros(n_fft - hop_length, dtype=np.float32)
+        self._ola = np.zeros(n_fft - hop_length, dtype=np.float32)
+        self._to_skip = n_fft - hop_length
+        self._samples_in = 0
+        self._samples_out = 0
+
+    def _update_profile(self, magnitude: np.ndarray) -> np.ndarray:
+        n_frames = magnitude.shape[1]
+        if n_frames >= self.history:
+            self._history[:] = magnitude[:, -self.history:]
+            self._history_pos = 0
+            self._history_len = self.history
+        else:
+            idx = (self._history_pos + np.arange(n_frames)) % self.history
+            self._history[:, idx] = magnitude
+            self._history_pos = (self._history_pos + n_frames) % self.history
+            self._history_len = min(self._history_len + n_frames, self.history)
+
+        return np.median(self._history[:, :self._history_len], axis=1, keepdims=True)
+
+    def _run(self, buffer: np.ndarray) -> np.ndarray:
+        hop = self.hop_length
+        n_frames = 0 if len(buffer) < self.n_fft else 1 + (len(buffer) - self.n_fft) // hop
+
+        if n_frames == 0:
+            self._pending = buffer
+            return np.zeros(0, dtype=np.float32)
+
+        frames = np.lib.stride_tricks.sliding_window_view(buffer, self.n_fft)[::hop][:n_frames]
+        spectrum = np.fft.rfft(frames * self.window, axis=1).T
+
+        magnitude = np.abs(spectrum)
+        phase = np.exp(1j * np.angle(spectrum))
+        noise_profile = self._update_profile(magnitude)
+        reduced = np.maximum(magnitude - noise_profile, 0) * phase
+
+        synth = np.fft.irfft(reduced.T, n=self.n_fft, axis=1).astype(np.float32) * self.window
+
+        # Overlap-add: each frame covers `overlap` hops, so sum shifted hop planes
+        out = np.zeros((n_frames + self.overlap - 1) * hop, dtype=np.float32)
+        out[:len(self._ola)] += self._ola
+        chunks = synth.reshape(n_frames, self.overlap, hop)
+        for k in range(self.overlap):
+            out[k * hop:(k + n_frames) * hop] += chunks[:, k, :].reshape(-1)
+
+        ready = out[:n_frames * hop].reshape(n_frames, hop) / self._norm
+        self._ola = out[n_frames * hop:]
+        self._pending = buffer[n_frames * hop:]
+
+        return self._emit(ready.reshape(-1))
+
+    def _emit(self, samples: np.ndarray) -> np.ndarray:
+        if self._to_skip:
+            skipped = min(self._to_skip, len(samples))
+            samples = samples[skipped:]
+            self._to_skip -= skipped
+
+        remaining = self._samples_in - self._samples_out
+        samples = samples[:remaining]
+        self._samples_out += len(samples)
+        return samples
+
+    def process(self, block: np.ndarray) -> np.ndarray:
+        """Feed a block of mono samples; returns the samples that are final."""
+        block = np.asarray(block, dtype=np.float32)
+        self._samples_in += len(block)
+        return self._run(np.concatenate([self._pending, block]))
+
+    def flush(self) -> np.ndarray:
+        """Drain the remaining samples at the end of the stream."""
+        tail = np.zeros(self.n_fft, dtype=np.float32)
+        return self._run(np.concatenate([self._pending, tail]))
+
 
 def reduce_noise(audio: np.ndarray) -> np.ndarray:
-    stft = librosa.stft(audio)
-    magnitude, phase = librosa.magphase(stft)
+    reducer = StreamingNoiseReducer()
+    return np.concatenate([reducer.process(audio), reducer.flush()])
+
+
+def _frame_rms(samples: np.ndarray, remainder: np.ndarray, frame_length: int = TRIM_FRAME_LENGTH):
+    """RMS of every complete frame, carrying partial frames between blocks."""
+    samples = np.concatenate([remainder, samples])
+    n_frames = len(samples) // frame_length
+    frames = samples[:n_frames * frame_length].reshape(n_frames, frame_length)
+    rms = np.sqrt(np.mean(frames ** 2, axis=1)) if n_frames else np.zeros(0)
+    return rms, samples[n_frames * frame_length:]
+
+
+def _denoise_to_file(input_path: str, temp_path: str, block_seconds: int):
+    """Pass 1: decode, downmix, resample and denoise into a float temp file."""
+    info = sf.info(input_path)
+    blocksize = int(info.samplerate * block_seconds)
+
+    resampler = soxr.ResampleStream(info.samplerate, TARGET_SAMPLE_RATE, 1, dtype="float32")
+    reducer = StreamingNoiseReducer()
+
+    peak = 0.0
+    max_rms = 0.0
+    remainder = np.zeros(0, dtype=np.float32)
+
+    with sf.SoundFile(temp_path, "w", TARGET_SAMPLE_RATE, 1, subtype="FLOAT") as out:
+        def write(cleaned):
+            nonlocal peak, max_rms, remainder
+            if not len(cleaned):
+                return
+            out.write(cleaned)
+            peak = max(peak, float(np.max(np.abs(cleaned))))
+            rms, remainder = _frame_rms(cleaned, remainder)
+            if len(rms):
+                max_rms = max(max_rms, float(rms.max()))
+
+        for block in sf.blocks(input_path, blocksize=blocksize, dtype="float32", always_2d=True):
+            mono = block.mean(axis=1)
+            write(reducer.process(resampler.resample_chunk(mono, last=False)))
+
+        write(reducer.process(resampler.resample_chunk(np.zeros(0, dtype=np.float32), last=True)))
+        write(reducer.flush())
 
-    noise_profile = np.median(magnitude, axis=1, keepdims=True)
-    reduced_magnitude = np.maximum(magnitude - noise_profile, 0)
+    return peak, max_rms
 
-    reduced_stft = reduced_magnitude * phase
-    return librosa.istft(reduced_stft)
 
+def _find_trim_bounds(temp_path: str, max_rms: float, block_seconds: int):
+    """Pass 2: locate the first and last non-silent frames."""
+    threshold = max_rms * 10 ** (-SILENCE_TOP_DB / 20)
+    blocksize = TARGET_SAMPLE_RATE * block_seconds
 
-def preprocess_audio(filename: str):
+    first = last = None
+    frame_offset = 0
+    remainder = np.zeros(0, dtype=np.float32)
+
+    for block in sf.blocks(temp_path, blocksize=blocksize, dtype="float32"):
+        rms, remainder = _frame_rms(block, remainder)
+        loud = np.flatnonzero(rms > threshold)
+        if len(loud):
+            if first is None:
+                first = frame_offset + int(loud[0])
+            last = frame_offset + int(loud[-1])
+        frame_offset += len(rms)
+
+    if first is None:
+        return 0, 0
+
+    return first * TRIM_FRAME_LENGTH, (last + 1) * TRIM_FRAME_LENGTH
+
+
+def preprocess_audio(filename: str, block_seconds: int = BLOCK_SECONDS):
     input_path = os.path.join(RAW_AUDIO_DIR, filename)
     base_name = os.path.splitext(filename)[0]
     output_path = os.path.join(PROCESSED_AUDIO_DIR, base_name + ".wav")
 
     print(f"🔊 Processing: {filename}")
 
-    audio, sr = librosa.load(
-        input_path,
-        sr=TARGET_SAMPLE_RATE,
-        mono=True
-    )
+    fd, temp_path = tempfile.mkstemp(suffix=".wav", dir=PROCESSED_AUDIO_DIR)
+    os.close(fd)
+
+    try:
+        peak, max_rms = _denoise_to_file(input_path, temp_path, block_seconds)
+        start, end = _find_trim_bounds(temp_path, max_rms, block_seconds)
+        gain = 1.0 / peak if peak > 0 else 1.0
 
-    audio = reduce_noise(audio)
+        # Pass 3: peak-normalize and write only the trimmed span
+        with sf.SoundFile(output_path, "w", TARGET_SAMPLE_RATE, 1, subtype="PCM_16") as out:
+            for block in sf.blocks(temp_path, blocksize=TARGET_SAMPLE_RATE * block_seconds,
+                                   dtype="float32", start=start, stop=end):
+                out.write(block * gain)
+    finally:
+        os.remove(temp_path)
 
-    audio = librosa.util.normalize(audio)
+    print(f"[SUCCESS] Saved cleaned audio to: {output_path}")
+    return output_path
 
-    audio, _ = librosa.effects.trim(
-        audio,
-        top_db=SILENCE_TOP_DB
-    )
 
-    sf.write(output_path, audio, TARGET_SAMPLE_RATE)
+def preprocess_directory(workers: int = 1, block_seconds: int = BLOCK_SECONDS):
+    """Preprocess every MP3/WAV in RAW_AUDIO_DIR, optionally in a process pool."""
+    os.makedirs(PROCESSED_AUDIO_DIR, exist_ok=True)
 
-    print(f"[SUCCESS] Saved cleaned audio to: {output_path}")
+    files = [
+        file for file in sorted(os.listdir(RAW_AUDIO_DIR))
+        if file.lower().endswith((".mp3", ".wav"))
+    ]
+
+    if workers <= 1:
+        return [preprocess_audio(file, block_seconds) for file in files]
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(preprocess_audio, files, [block_seconds] * len(files)))
 
 
 if __name__ == "__main__":
-    os.makedirs(PROCESSED_AUDIO_DIR, exist_ok=True)
+    parser = argparse.ArgumentParser(description="Stream-preprocess raw podcast audio")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Number of files processed in parallel (default: 1)")
+    parser.add_argument("--block-seconds", type=int, default=BLOCK_SECONDS,
+                        help=f"Audio block size in seconds (default: {BLOCK_SECONDS})")
 
-    for file in os.listdir(RAW_AUDIO_DIR):
-        if file.lower().endswith((".mp3", ".wav")):
-            preprocess_audio(file)
+    args = parser.parse_args()
+    preprocess_directory(args.workers, args.block_seconds)
 
-    print("[SUCCESS] Audio preprocessing completed (no chunking).")
+    print("[SUCCESS] Audio preprocessing completed (streaming).")
@@ -0,0 +1,78 @@
+"""
+vad.py — Energy-Based Speech Region Detection
+---------------------------------------------
+Splits a 16 kHz waveform (usually the shared buffer from audio_loader)
+into speech regions separated by pauses. Frame energies are computed in
+fixed-size chunks so memory-mapped episodes are never copied whole.
+"""
+
+from typing import List, Tuple
+
+import numpy as np
+
+# =========================
+# CONFIG
+# =========================
+
+SAMPLE_RATE = 16000
+FRAME_MS = 30
+CHUNK_SECONDS = 60
+SPEECH_TOP_DB = 35        # frames this far below the loudest frame are silence
+MIN_SILENCE_SECONDS = 0.5
+MIN_SPEECH_SECONDS = 0.3
+MAX_REGION_SECONDS = 30   # one whisper window
+
+
+def frame_energies(audio: np.ndarray, sample_rate: int = SAMPLE_RATE) -> np.ndarray:
+    """RMS of every non-overlapping FRAME_MS frame, computed chunk by chunk."""
+    frame = sample_rate * FRAME_MS // 1000
+    chunk = frame * (CHUNK_SECONDS * 1000 // FRAME_MS)
+    n_frames = len(audio) // frame
+
+    energies = np.empty(n_frames, dtype=np.float32)
+    for start in range(0, n_frames * frame, chunk):
+        block = np.asarray(audio[start:min(start + chunk, n_frames * frame)], dtype=np.float32)
+        frames = block.reshape(-1, frame)
+        energies[start // frame:start // frame + len(frames)] = np.sqrt(np.mean(frames ** 2, axis=1))
+
+    return energies
+
+
+def speech_regions(audio: np.ndarray, sample_rate: int = SAMPLE_RATE) -> List[Tuple[int, int]]:
+    """
+    Detect speech regions as (start_sample, end_sample) pairs.
+
+    Pauses shorter than MIN_SILENCE_SECONDS are bridged, blips shorter
+    than MIN_SPEECH_SECONDS are dropped and long regions are split so
+    none exceeds MAX_REGION_SECONDS.
+    """
+    energies = frame_energies(audio, sample_rate)
+    if not len(energies) or energies.max() <= 0:
+        return []
+
+    frame = sample_rate * FRAME_MS // 1000
+    threshold = energies.max() * 10 ** (-SPEECH_TOP_DB / 20)
+    voiced = np.concatenate([[False], energies > threshold, [False]])
+
+    edges = np.flatnonzero(np.diff(voiced.astype(np.int8)))
+    starts, ends = edges[::2], edges[1::2]
+
+    min_gap = MIN_SILENCE_SECONDS * 1000 / FRAME_MS
+    min_len = MIN_SPEECH_SECONDS * 1000 / FRAME_MS
+    max_len = MAX_REGION_SECONDS * 1000 // FRAME_MS
+
+    merged = []
+    for s, e in zip(starts, ends):
+        if merged and s - merged[-1][1] < min_gap:
+            merged[-1][1] = e
+        else:
+            merged.append([s, e])
+
+    regions = []
+    for s, e in merged:
+        if e - s < min_len:
+            continue
+        for chunk_start in range(s, e, max_len):
+            regions.append((int(chunk_start * frame), int(min(chunk_start + max_len, e) * frame)))
+
+    return regions
@@ -12,6 +12,7 @@ from datetime import datetime, timedelta
 PROJECT_ROOT = Path(__file__).parent.resolve()
 DATA_DIR = PROJECT_ROOT / "data"
 OUTPUTS_DIR = PROJECT_ROOT / "outputs"
+WAVEFORMS_DIR = DATA_DIR / "waveforms"
 
 # Default cleanup policy: remove files older than 7 days
 DEFAULT_AGE_DAYS = 7
@@ -43,6 +44,9 @@ def cleanup_processed_data(age_days: int = DEFAULT_AGE_DAYS):
     # Clean data directory (uploaded audio files)
     data_removed = cleanup_old_files(DATA_DIR, age_days)
     
+    # Clean decoded waveform cache
+    data_removed += cleanup_old_files(WAVEFORMS_DIR, age_days)
+    
     # Clean outputs directory (processed JSON files)
     outputs_removed = cleanup_old_files(OUTPUTS_DIR, age_days)
     
@@ -83,6 +87,16 @@ def dry_run(age_days: int = DEFAULT_AGE_DAYS):
     else:
         print("  No old files found")
     
+    # Check decoded waveform cache
+    old_waveform_files = list_old_files(WAVEFORMS_DIR, age_days)
+    print(f"\nWaveform cache ({WAVEFORMS_DIR}):")
+    if old_waveform_files:
+        for file_path in old_waveform_files:
+            age = (time.time() - file_path.stat().st_mtime) / (24 * 60 * 60)
+            print(f"  {file_path.name} (age: {age:.1f} days)")
+    else:
+        print("  No old files found")
+    
     # Check outputs directory
     old_output_files = list_old_files(OUTPUTS_DIR, age_days)
     print(f"\nOutputs directory ({OUTPUTS_DIR}):")
@@ -0,0 +1,87 @@
+"""
+benchmark_columnar_artifact.py — JSON vs Columnar Episode Loading
+-----------------------------------------------------------------
+Writes synthetic episodes as segmented_output.json and as a columnar
+artifact, then times loading each. A 3-hour episode is roughly 3000
+sentences in 60 topics.
+"""
+
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from pipeline.columnar_artifact import (
+    load_segmented_artifact,
+    transcription_output,
+    write_segmented_artifact
+)
+
+SENTENCE_COUNTS = [1000, 3000, 10000]
+SENTENCES_PER_TOPIC = 50
+WORDS = ["the", "dual", "form", "verb", "plural", "noun", "case", "ending", "we", "see", "here", "again"]
+
+
+def synthetic_episode(n, rng):
+    topics = []
+    for tid in range(n // SENTENCES_PER_TOPIC):
+        sentences = []
+        for i in range(SENTENCES_PER_TOPIC):
+            t = float(tid * SENTENCES_PER_TOPIC + i) * 3.6
+            text = " ".join(rng.choice(WORDS) for _ in range(18)) + "."
+            sentences.append({"text": text, "translation": text, "source_text": text,
+                              "language": "en", "start": t, "end": t + 3.6})
+        topics.append({
+            "topic_id": tid, "segment_id": f"seg_{tid + 1:03d}",
+            "start": sentences[0]["start"], "end": sentences[-1]["end"],
+            "topic_title": "Topic", "summary": "Summary.", "keywords": ["dual form", "plural"],
+            "text": " ".join(s["text"] for s in sentences), "sentences": sentences,
+            "sentiment": "NEUTRAL", "sentiment_score": 0.0, "boundary_confidence": 0.5,
+        })
+    track = {
+        "start": [i * 3.6 for i in range(n)],
+        "end": [(i + 1) * 3.6 for i in range(n)],
+        "topic_id": [i // SENTENCES_PER_TOPIC for i in range(n)],
+        "sentiment": [round(rng.uniform(-1, 1), 3) for _ in range(n)],
+        "keyword_hits": [rng.randint(0, 3) for _ in range(n)],
+        "words_per_minute": [round(rng.uniform(100, 180), 1) for _ in range(n)],
+    }
+    data = {"Project_Title": "LEXARA", "topics": topics,
+            "Transcription_Output": transcription_output(topics), "sentence_track": track}
+    return data
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main():
+    rng = random.Random(0)
+    print(f"{'sentences':>10}{'JSON MB':>9}{'JSON s':>9}{'Arrow s':>9}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for n in SENTENCE_COUNTS:
+            data = synthetic_episode(n, rng)
+            json_path = Path(tmp) / f"episode_{n}.json"
+            with open(json_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+            artifact = write_segmented_artifact(Path(tmp) / f"episode_{n}.arrow", data)
+
+            loaded, json_time = timed(lambda: json.loads(json_path.read_text(encoding="utf-8")))
+            restored, arrow_time = timed(lambda: load_segmented_artifact(artifact, track_arrays=True))
+            assert restored["topics"] == loaded["topics"], "artifact disagrees with JSON"
+
+            size = json_path.stat().st_size / 1e6
+            print(f"{n:>10}{size:>9.1f}{json_time:>9.3f}{arrow_time:>9.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,67 @@
+"""
+benchmark_corpus_idf.py — Corpus IDF Store Scaling
+--------------------------------------------------
+Builds document frequency stores of growing vocabulary size, then times
+adding one more episode, saving, loading from disk and looking up the
+vocabulary of one episode.
+"""
+
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from topic_intelligence.indexing.idf_store import IDFStore
+
+VOCABULARY_SIZES = [10000, 100000, 1000000]
+EPISODE_TOPICS = 30
+TERMS_PER_TOPIC = 400
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def synthetic_store(path, n_terms, rng):
+    """Store with n_terms random hashed terms, without hashing n_terms strings."""
+    store = IDFStore(path)
+    store.terms = np.unique(rng.integers(0, 2 ** 63, size=n_terms, dtype=np.uint64))
+    store.counts = rng.integers(1, 1000, size=len(store.terms), dtype=np.uint32)
+    store.episodes = np.unique(rng.integers(0, 2 ** 63, size=n_terms // 100, dtype=np.uint64))
+    store.n_documents = len(store.episodes) * EPISODE_TOPICS
+    return store
+
+
+def main():
+    rng = np.random.default_rng(0)
+    words = random.Random(0)
+    print(f"one episode = {EPISODE_TOPICS} topics x {TERMS_PER_TOPIC} terms\n")
+    print(f"{'terms':>9}{'add ms':>9}{'save ms':>9}{'load ms':>9}{'lookup ms':>11}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for n_terms in VOCABULARY_SIZES:
+            store = synthetic_store(Path(tmp) / f"idf_{n_terms}.bin", n_terms, rng)
+            episode = [[f"term{words.randrange(50000)}" for _ in range(TERMS_PER_TOPIC)] for _ in range(EPISODE_TOPICS)]
+
+            _, add_time = timed(lambda: store.add_episode(f"episode{n_terms}.wav", episode))
+            _, save_time = timed(store.save)
+            loaded, load_time = timed(lambda: IDFStore.load(store.path))
+            vocabulary = sorted({t for doc in episode for t in doc})
+            _, lookup_time = timed(lambda: loaded.idf(vocabulary))
+
+            assert loaded.has_episode(f"episode{n_terms}.wav")
+            print(f"{len(loaded):>9}{add_time * 1000:>9.1f}{save_time * 1000:>9.1f}"
+                  f"{load_time * 1000:>9.1f}{lookup_time * 1000:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,71 @@
+"""
+benchmark_keyword_engine.py — Episode-Level Keyword Extraction
+--------------------------------------------------------------
+Compares per-topic TfidfVectorizer fits (extract_phrases on one document,
+where IDF is constant) with one KeywordEngine fit per episode, timing both
+and measuring how many chosen keywords are episode-wide terms that appear
+in every topic rather than terms specific to the topic.
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from topic_intelligence.topic_segmentation.keywords import extract_keywords, KeywordEngine
+
+TOPIC_COUNTS = [10, 50, 200]
+WORDS_PER_TOPIC = 200
+LETTERS = "bcdfghjkmnpqrstvwxz"
+
+
+def random_word(rng):
+    return "".join(rng.choice(LETTERS) + rng.choice("aeiou") for _ in range(4))
+
+
+def synthetic_topics(n, rng):
+    episode_terms = [random_word(rng) for _ in range(8)]
+    topics = []
+    for _ in range(n):
+        specific = [random_word(rng) for _ in range(15)]
+        # Episode-wide terms are frequent everywhere, topic terms only here
+        words = [rng.choice(episode_terms) if rng.random() < 0.45 else rng.choice(specific)
+                 for _ in range(WORDS_PER_TOPIC)]
+        topics.append(" ".join(words))
+    return topics, set(episode_terms)
+
+
+def episode_share(keyword_lists, episode_terms):
+    """Share of keywords made only of episode-wide terms."""
+    chosen = [k for keywords in keyword_lists for k in keywords]
+    generic = [k for k in chosen if set(k.split()) <= episode_terms]
+    return len(generic) / max(len(chosen), 1)
+
+
+def main():
+    rng = random.Random(0)
+    print(f"{WORDS_PER_TOPIC} words per topic\n")
+    print(f"{'topics':>7}{'per-topic s':>13}{'engine s':>10}{'generic kw (per-topic)':>24}{'generic kw (engine)':>21}")
+
+    for n in TOPIC_COUNTS:
+        texts, episode_terms = synthetic_topics(n, rng)
+
+        start = time.perf_counter()
+        per_topic = [extract_keywords(text) for text in texts]
+        per_topic_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        engine = KeywordEngine().fit(texts)
+        episode = [extract_keywords(text, engine=engine) for text in texts]
+        engine_time = time.perf_counter() - start
+
+        print(f"{n:>7}{per_topic_time:>13.3f}{engine_time:>10.3f}"
+              f"{episode_share(per_topic, episode_terms):>24.0%}{episode_share(episode, episode_terms):>21.0%}")
+
+
+if __name__ == "__main__":
+    main()
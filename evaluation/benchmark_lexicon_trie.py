@@ -0,0 +1,65 @@
+"""
+benchmark_lexicon_trie.py — Lexicon Romanization Scaling
+--------------------------------------------------------
+Compares the per-entry `str.replace` loop with the longest-match trie as
+the lexicon grows toward realistic vocabulary sizes.
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from language_adaptation.lexicon_trie import LexiconTrie
+
+CJK_START = 0x4E00
+CJK_SIZE = 0x5000
+LEXICON_SIZES = [15, 1000, 10000, 100000]
+TEXT_WORDS = 5000
+
+
+def random_word(rng):
+    return "".join(chr(CJK_START + rng.randrange(CJK_SIZE)) for _ in range(rng.randint(1, 4)))
+
+
+def replace_loop(text, lexicon):
+    for source, target in lexicon.items():
+        text = text.replace(source, target)
+    return text
+
+
+def timed(fn):
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main():
+    rng = random.Random(0)
+    print(f"Text of {TEXT_WORDS} words\n")
+    print(f"{'entries':>8}{'replace loop ms':>18}{'trie build ms':>16}{'trie ms':>10}")
+
+    for size in LEXICON_SIZES:
+        lexicon = {random_word(rng): f"w{i}" for i in range(size)}
+        words = list(lexicon)
+        text = "".join(rng.choice(words) if rng.random() < 0.7 else random_word(rng)
+                       for _ in range(TEXT_WORDS))
+
+        trie = None
+
+        def build():
+            nonlocal trie
+            trie = LexiconTrie(lexicon)
+
+        build_time = timed(build)
+        loop_time = timed(lambda: replace_loop(text, lexicon))
+        trie_time = timed(lambda: trie.transliterate(text))
+        print(f"{size:>8}{loop_time * 1000:>18.1f}{build_time * 1000:>16.1f}{trie_time * 1000:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
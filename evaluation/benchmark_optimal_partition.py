@@ -0,0 +1,134 @@
+"""
+benchmark_optimal_partition.py — Optimal-Partition Segmentation Scaling
+-----------------------------------------------------------------------
+Runs the prefix-sum DP of segment_optimal_partition on synthetic long
+transcripts (clustered embeddings with planted topic boundaries) and
+compares it with a DP that recomputes every segment centroid and with a
+greedy adjacent-window threshold scan, reporting time and boundary F1.
+"""
+
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from topic_intelligence.topic_segmentation.algorithms.segment_optimal_partition import (
+    optimal_boundaries,
+    _normalize,
+    MIN_TOPIC_SIZE,
+    MAX_TOPIC_SIZE,
+    PENALTY_FACTOR
+)
+
+DIM = 384                 # all-MiniLM-L6-v2
+SENTENCE_COUNTS = [500, 2000, 10000]
+NAIVE_MAX_SENTENCES = 2000  # recomputing centroids gets too slow beyond this
+NOISE = 2.5               # within-topic spread relative to the centroid norm
+TOLERANCE = 2             # a predicted boundary within this many sentences counts as a hit
+
+
+def synthetic_transcript(n, rng):
+    """Sentence embeddings drawn around one centroid per topic."""
+    boundaries = []
+    position = 0
+    while True:
+        position += int(rng.integers(8, MAX_TOPIC_SIZE))
+        if position >= n - MIN_TOPIC_SIZE:
+            break
+        boundaries.append(position)
+
+    embeddings = np.empty((n, DIM))
+    for start, end in zip([0] + boundaries, boundaries + [n]):
+        centroid = rng.normal(size=DIM)
+        embeddings[start:end] = centroid + NOISE * np.linalg.norm(centroid) / np.sqrt(DIM) * rng.normal(size=(end - start, DIM))
+    return embeddings, boundaries
+
+
+def naive_boundaries(embeddings, min_size=MIN_TOPIC_SIZE, max_size=MAX_TOPIC_SIZE):
+    """Same objective, but every candidate segment's centroid is recomputed."""
+    x = _normalize(embeddings)
+    n = len(x)
+    total = ((x - x.mean(axis=0)) ** 2).sum()
+    penalty = PENALTY_FACTOR * total / n
+
+    best = np.full(n + 1, np.inf)
+    best[0] = 0.0
+    back = np.zeros(n + 1, dtype=np.int64)
+    for end in range(min_size, n + 1):
+        for start in range(max(0, end - max_size), end - min_size + 1):
+            block = x[start:end]
+            cost = best[start] + ((block - block.mean(axis=0)) ** 2).sum() + penalty
+            if cost < best[end]:
+                best[end], back[end] = cost, start
+
+    boundaries = []
+    end = n
+    while end > 0:
+        end = int(back[end])
+        if end > 0:
+            boundaries.append(end)
+    return boundaries[::-1]
+
+
+def greedy_boundaries(embeddings, window=3, threshold=0.5):
+    """Single-threshold scan like the existing algorithms."""
+    x = _normalize(embeddings)
+    boundaries = []
+    last = 0
+    for i in range(window, len(x) - window + 1):
+        left = x[i - window:i].mean(axis=0)
+        right = x[i:i + window].mean(axis=0)
+        sim = left @ right / (np.linalg.norm(left) * np.linalg.norm(right))
+        if sim < threshold and i - last >= MIN_TOPIC_SIZE:
+            boundaries.append(i)
+            last = i
+    return boundaries
+
+
+def boundary_f1(predicted, truth, tolerance=TOLERANCE):
+    if not predicted or not truth:
+        return 0.0
+    truth_arr = np.array(truth)
+    hits = sum(np.abs(truth_arr - b).min() <= tolerance for b in predicted)
+    precision = hits / len(predicted)
+    recall = sum(np.abs(np.array(predicted) - b).min() <= tolerance for b in truth) / len(truth)
+    return 0.0 if precision + recall == 0 else 2 * precision * recall / (precision + recall)
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main():
+    rng = np.random.default_rng(0)
+    print(f"Embedding dim {DIM}, topics of 8-{MAX_TOPIC_SIZE} sentences\n")
+    print(f"{'sentences':>10}{'prefix DP ms':>14}{'F1':>6}{'naive DP ms':>13}{'greedy ms':>11}{'F1':>6}")
+
+    for n in SENTENCE_COUNTS:
+        embeddings, truth = synthetic_transcript(n, rng)
+
+        fast, fast_time = timed(lambda: optimal_boundaries(embeddings))
+        greedy, greedy_time = timed(lambda: greedy_boundaries(embeddings))
+
+        if n <= NAIVE_MAX_SENTENCES:
+            naive, naive_time = timed(lambda: naive_boundaries(embeddings))
+            assert naive == fast, "prefix-sum DP disagrees with the naive DP"
+            naive_col = f"{naive_time * 1000:>13.0f}"
+        else:
+            naive_col = f"{'-':>13}"
+
+        print(
+            f"{n:>10}{fast_time * 1000:>14.0f}{boundary_f1(fast, truth):>6.2f}"
+            f"{naive_col}{greedy_time * 1000:>11.0f}{boundary_f1(greedy, truth):>6.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+benchmark_pipeline_validation.py — Contract Validation Time and Memory
+---------------------------------------------------------------------
+Validates synthetic indexed outputs against the indexed output contract
+with the json reader and the streaming (ijson) reader, reporting time and
+peak Python memory per artifact, then validates a batch of artifacts
+serially and across all CPUs, as a nightly audit would. A 3-hour episode
+is roughly 3000 sentences.
+"""
+
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+import pipeline.pipeline_validation_core as validation
+from topic_intelligence.topic_segmentation.segmented_output import compact_output
+from topic_intelligence.topic_segmentation.utils.segment_mapper import build_sentence_data
+
+SENTENCE_COUNTS = [1000, 3000, 10000]
+SENTENCES_PER_TOPIC = 50
+BATCH_SIZE = 48
+WORDS = ["the", "dual", "form", "verb", "plural", "noun", "case", "ending", "we", "see", "here", "again"]
+
+
+def synthetic_indexed(n, rng):
+    sentences = []
+    for i in range(n):
+        text = " ".join(rng.choice(WORDS) for _ in range(18)) + "."
+        segment = {"text": text, "translation": text, "language": "en", "translation_state": "not_needed"}
+        sentences.append(build_sentence_data(text, segment, i * 3.6, (i + 1) * 3.6))
+
+    topics = []
+    for tid in range(n // SENTENCES_PER_TOPIC):
+        topic_sentences = sentences[tid * SENTENCES_PER_TOPIC:(tid + 1) * SENTENCES_PER_TOPIC]
+        topics.append({
+            "topic_id": tid, "segment_id": f"seg_{tid + 1:03d}",
+            "start": topic_sentences[0]["start"], "end": topic_sentences[-1]["end"],
+            "topic_title": "Topic", "summary": "Summary.", "keywords": ["dual form", "plural"],
+            "text": " ".join(s["text"] for s in topic_sentences), "sentences": topic_sentences,
+        })
+    data = compact_output({"audio_file": "episode.wav", "topics": topics})
+    data["search_index"] = {word: list(range(len(topics))) for word in WORDS}
+    data["keyword_idf"] = {"dual form": 1.2, "plural": 1.4}
+    data["metadata"] = {"total_topics": len(topics)}
+    return data
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def measured(fn):
+    result, seconds = timed(fn)
+    tracemalloc.start()  # second run: tracing slows the first one down
+    fn()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return result, seconds, peak / 1e6
+
+
+def main():
+    rng = random.Random(0)
+    has_ijson = validation.USE_IJSON
+    validation.load_contract()  # contract compiled once, outside the timings
+
+    with tempfile.TemporaryDirectory() as tmp:
+        print(f"{'sentences':>10}{'MB':>7}{'json s':>9}{'json peak MB':>14}{'stream s':>10}{'stream peak MB':>16}")
+        for n in SENTENCE_COUNTS:
+            path = Path(tmp) / f"indexed_{n}.json"
+            path.write_text(json.dumps(synthetic_indexed(n, rng), indent=2), encoding="utf-8")
+
+            loaded, json_time, json_peak = measured(lambda: validation.file_errors(path, stream=False))
+            assert not loaded, loaded[:3]
+            if has_ijson:
+                streamed, stream_time, stream_peak = measured(lambda: validation.file_errors(path, stream=True))
+                assert streamed == loaded
+                stream = f"{stream_time:>10.3f}{stream_peak:>16.1f}"
+            else:
+                stream = f"{'-':>10}{'-':>16}"  # ijson not installed
+            print(f"{n:>10}{path.stat().st_size / 1e6:>7.1f}{json_time:>9.3f}{json_peak:>14.1f}{stream}")
+
+        paths = [Path(tmp) / f"indexed_{SENTENCE_COUNTS[1]}.json"] * BATCH_SIZE
+        cpus = os.cpu_count() or 1
+        _, serial_time = timed(lambda: validation.validate_files(paths, workers=1))
+        _, parallel_time = timed(lambda: validation.validate_files(paths, workers=cpus))
+        print(f"\n{BATCH_SIZE} artifacts: serial {serial_time:.2f}s, {cpus} workers {parallel_time:.2f}s")
+
+
+if __name__ == "__main__":
+    main()
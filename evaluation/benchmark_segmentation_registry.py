@@ -0,0 +1,78 @@
+"""
+benchmark_segmentation_registry.py — Side-by-Side Segmenter Benchmark
+---------------------------------------------------------------------
+Runs every registered segmentation algorithm on the same shared features.
+Without arguments a synthetic transcript with planted topic boundaries is
+used (topic-specific vocabulary and clustered embeddings) and boundary F1
+is reported; given a pipeline_output.json the real sentences are encoded
+once and only timings, boundary counts and confidences are shown.
+
+Usage:
+    python evaluation/benchmark_segmentation_registry.py [pipeline_output.json]
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from topic_intelligence.topic_segmentation.registry import SegmentationFeatures, benchmark
+from evaluation.benchmark_optimal_partition import boundary_f1
+
+SYNTHETIC_SENTENCES = 2000
+DIM = 384
+WORDS_PER_TOPIC = 40
+WORDS_PER_SENTENCE = 12
+
+
+def synthetic_features(n, rng):
+    boundaries = []
+    position = 0
+    while True:
+        position += int(rng.integers(8, 40))
+        if position >= n - 3:
+            break
+        boundaries.append(position)
+
+    sentences, embeddings = [], np.empty((n, DIM))
+    for topic, (start, end) in enumerate(zip([0] + boundaries, boundaries + [n])):
+        vocab = [f"topic{topic}word{j}" for j in range(WORDS_PER_TOPIC)]
+        centroid = rng.normal(size=DIM)
+        for i in range(start, end):
+            sentences.append(" ".join(rng.choice(vocab, WORDS_PER_SENTENCE)) + ".")
+            embeddings[i] = centroid + 1.5 * rng.normal(size=DIM)
+
+    timestamps = [(4.0 * i, 4.0 * i + 4.0) for i in range(n)]
+    return SegmentationFeatures(sentences, timestamps, embeddings=embeddings), boundaries
+
+
+def artifact_features(path):
+    from topic_intelligence.topic_segmentation.topic_segmentation_core import sentence_features
+
+    with open(path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+    return sentence_features(data["segments"])
+
+
+def main():
+    if len(sys.argv) > 1:
+        features, truth = artifact_features(sys.argv[1]), None
+        print(f"{Path(sys.argv[1]).name}: {len(features)} sentences\n")
+    else:
+        features, truth = synthetic_features(SYNTHETIC_SENTENCES, np.random.default_rng(0))
+        print(f"Synthetic transcript: {len(features)} sentences, {len(truth)} planted boundaries\n")
+
+    print(f"{'algorithm':<20}{'ms':>9}{'boundaries':>12}{'mean conf':>11}{'F1':>7}")
+    for name, result in benchmark(features).items():
+        mean_conf = np.mean(result.confidences) if result.confidences else 0.0
+        f1 = f"{boundary_f1(result.boundaries, truth):>7.2f}" if truth is not None else f"{'-':>7}"
+        print(f"{name:<20}{result.seconds * 1000:>9.1f}{len(result.boundaries):>12}{mean_conf:>11.2f}{f1}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+benchmark_segmented_output.py — v2 vs v3 Segmented Output Size and Parse Time
+-----------------------------------------------------------------------------
+Builds synthetic episodes the way topic_segmentation_core does (Whisper
+segments matched to sentences, 50 sentences per topic), then compares the
+size and json.loads time of the v2 file with the v3 (referenced text)
+file, and the cost of materializing v3 back into the v2 shape. A 3-hour
+episode is roughly 3000 sentences.
+"""
+
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from topic_intelligence.topic_segmentation.segmented_output import compact_output, materialize, transcription_output
+from topic_intelligence.topic_segmentation.utils.segment_mapper import build_sentence_data
+
+SENTENCE_COUNTS = [1000, 3000, 10000]
+SENTENCES_PER_TOPIC = 50
+NON_ENGLISH_SHARE = 0.3
+WORDS = ["the", "dual", "form", "verb", "plural", "noun", "case", "ending", "we", "see", "here", "again"]
+
+
+def synthetic_episode(n, rng):
+    sentences = []
+    for i in range(n):
+        text = " ".join(rng.choice(WORDS) for _ in range(18)) + "."
+        if rng.random() < NON_ENGLISH_SHARE:
+            segment = {"text": text.upper(), "translation": text, "language": "hi", "translation_state": "done"}
+        else:
+            segment = {"text": text, "translation": text, "language": "en", "translation_state": "not_needed"}
+        sentences.append(build_sentence_data(text, segment, i * 3.6, (i + 1) * 3.6))
+
+    topics = []
+    for tid in range(n // SENTENCES_PER_TOPIC):
+        topic_sentences = sentences[tid * SENTENCES_PER_TOPIC:(tid + 1) * SENTENCES_PER_TOPIC]
+        topics.append({
+            "topic_id": tid, "segment_id": f"seg_{tid + 1:03d}",
+            "start": topic_sentences[0]["start"], "end": topic_sentences[-1]["end"],
+            "topic_title": "Topic", "summary": "Summary.", "keywords": ["dual form", "plural"],
+            "text": " ".join(s["text"] for s in topic_sentences), "sentences": topic_sentences,
+            "sentiment": "NEUTRAL", "sentiment_score": 0.0, "boundary_confidence": 0.5,
+        })
+    return {"Project_Title": "LEXARA", "audio_file": "episode.wav", "topics": topics,
+            "Transcription_Output": transcription_output(topics), "3D_Animation_Output": []}
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main():
+    rng = random.Random(0)
+    print(f"{'sentences':>10}{'v2 MB':>8}{'v3 MB':>8}{'v2 parse s':>12}{'v3 parse s':>12}{'materialize s':>15}")
+
+    for n in SENTENCE_COUNTS:
+        data = synthetic_episode(n, rng)
+        v2 = json.dumps(data, indent=2, ensure_ascii=False)
+        v3 = json.dumps(compact_output(data), indent=2, ensure_ascii=False)
+
+        _, v2_time = timed(lambda: json.loads(v2))
+        compact, v3_time = timed(lambda: json.loads(v3))
+        restored, materialize_time = timed(lambda: materialize(compact))
+        assert restored == data, "materialized v3 differs from v2"
+
+        print(f"{n:>10}{len(v2.encode()) / 1e6:>8.2f}{len(v3.encode()) / 1e6:>8.2f}"
+              f"{v2_time:>12.3f}{v3_time:>12.3f}{materialize_time:>15.3f}")
+
+
+if __name__ == "__main__":
+    main()
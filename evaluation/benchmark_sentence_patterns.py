@@ -0,0 +1,88 @@
+"""
+benchmark_sentence_patterns.py — Sentence Cleaner and Flag Throughput
+---------------------------------------------------------------------
+Times the original per-pattern re.sub/re.search cleaner and classifiers
+against the compiled single-pass versions, cold (first segmentation pass)
+and warm (the repeat lookups from topic_text and later passes).
+"""
+
+import random
+import re
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from topic_intelligence.topic_segmentation.sentence_patterns import (
+    FILLERS,
+    ANCHORS,
+    DEF_PATTERNS,
+    EX_PATTERNS,
+    clean_text,
+    sentence_flags
+)
+
+SENTENCE_COUNTS = [10000, 50000]
+WORDS_PER_SENTENCE = 18
+
+
+def legacy_pass(sentences):
+    out = []
+    for sentence in sentences:
+        t = sentence.lower()
+        for f in FILLERS:
+            t = re.sub(f, " ", t)
+        t = re.sub(r"\b(\w+)\s+\1\b", r"\1", t)
+        t = re.sub(r"\s+", " ", t).strip()
+        s = sentence.lower()
+        is_def = not any(re.search(p, s) for p in EX_PATTERNS) and any(re.search(p, s) for p in DEF_PATTERNS)
+        out.append((t, is_def, any(re.search(p, s) for p in ANCHORS)))
+    return out
+
+
+def compiled_pass(sentences):
+    out = []
+    for sentence in sentences:
+        flags = sentence_flags(sentence)
+        out.append((clean_text(sentence), flags.is_definition, flags.anchor))
+    return out
+
+
+def synthetic_sentences(n, rng):
+    phrases = [p.replace(r"\b", "") for p in FILLERS + ANCHORS + DEF_PATTERNS + EX_PATTERNS]
+    words = [f"word{i}" for i in range(500)]
+    return [
+        " ".join(rng.choice(phrases) if rng.random() < 0.1 else rng.choice(words) for _ in range(WORDS_PER_SENTENCE)) + "."
+        for _ in range(n)
+    ]
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main():
+    rng = random.Random(0)
+    print(f"{WORDS_PER_SENTENCE} words per sentence\n")
+    print(f"{'sentences':>10}{'legacy s':>10}{'compiled s':>12}{'cached s':>10}")
+
+    for n in SENTENCE_COUNTS:
+        sentences = synthetic_sentences(n, rng)
+        sentence_flags.cache_clear()
+        clean_text.cache_clear()
+
+        legacy, legacy_time = timed(lambda: legacy_pass(sentences))
+        compiled, compiled_time = timed(lambda: compiled_pass(sentences))
+        _, cached_time = timed(lambda: compiled_pass(sentences))
+        assert legacy == compiled, "compiled patterns disagree"
+
+        print(f"{n:>10}{legacy_time:>10.2f}{compiled_time:>12.2f}{cached_time:>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+benchmark_sentiment.py — Sentence-Level Sentiment Throughput
+------------------------------------------------------------
+Scores every sentence of synthetic episodes with one TextBlob per
+sentence and with the shared analyzer of the batched scorer, checking
+the polarities agree. A 3-hour episode is roughly 3000 sentences.
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from topic_intelligence.topic_segmentation.sentiment import score_texts
+
+SENTENCE_COUNTS = [1000, 3000, 10000]
+WORDS_PER_SENTENCE = 18
+
+
+def synthetic_sentences(n, rng):
+    from textblob.en import sentiment as pattern_lexicon
+    sentiment_words = list(pattern_lexicon.keys())
+    filler = ["the", "we", "this", "word", "form", "is", "not", "very", "really", "and", "it"]
+    return [
+        " ".join(rng.choice(sentiment_words) if rng.random() < 0.2 else rng.choice(filler)
+                 for _ in range(WORDS_PER_SENTENCE)) + rng.choice([".", "!", "?"])
+        for _ in range(n)
+    ]
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main():
+    from textblob import TextBlob
+
+    rng = random.Random(0)
+    print(f"{'sentences':>10}{'TextBlob s':>12}{'batched s':>11}")
+
+    for n in SENTENCE_COUNTS:
+        sentences = synthetic_sentences(n, rng)
+        legacy, legacy_time = timed(lambda: [TextBlob(s).sentiment.polarity for s in sentences])
+        scores, batch_time = timed(lambda: score_texts(sentences))
+        assert scores.tolist() == legacy, "batched sentiment disagrees with TextBlob"
+        print(f"{n:>10}{legacy_time:>12.2f}{batch_time:>11.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,85 @@
+"""
+benchmark_texttiling.py — Sparse TextTiling Scaling
+---------------------------------------------------
+Compares the original per-position TextTiling (re-joined window text,
+fresh Counters, pure-Python cosine) with the sparse term-matrix version,
+checks both produce the same topics, and times depth scoring.
+"""
+
+import math
+import random
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from topic_intelligence.topic_segmentation.algorithms.segment_texttiling import segment, _tokenize
+
+SEGMENT_COUNTS = [1000, 10000, 100000]
+LEGACY_MAX_SEGMENTS = 100000
+WORDS_PER_SEGMENT = 12
+
+
+def legacy_segment(segments, window_size=2, threshold=0.25):
+    def cosine(a, b):
+        numerator = sum(a[x] * b[x] for x in set(a) & set(b))
+        denominator = math.sqrt(sum(v ** 2 for v in a.values())) * math.sqrt(sum(v ** 2 for v in b.values()))
+        return numerator / denominator if denominator else 0.0
+
+    if len(segments) <= window_size:
+        return [segments]
+    topics, current = [], list(segments[:window_size])
+    for i in range(window_size, len(segments)):
+        left = Counter(_tokenize(" ".join(s["text"] for s in segments[i - window_size:i])))
+        if cosine(left, Counter(_tokenize(segments[i]["text"]))) < threshold:
+            topics.append(current)
+            current = [segments[i]]
+        else:
+            current.append(segments[i])
+    return topics + [current]
+
+
+def synthetic_segments(n, rng):
+    segments = []
+    topic = 0
+    while len(segments) < n:
+        vocab = [f"topic{topic}word{i}" for i in range(30)] + [f"common{i}" for i in range(20)]
+        for _ in range(rng.randint(5, 30)):
+            segments.append({"text": " ".join(rng.choice(vocab) for _ in range(WORDS_PER_SEGMENT)) + "."})
+        topic += 1
+    return segments[:n]
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main():
+    rng = random.Random(0)
+    print(f"{WORDS_PER_SEGMENT} words per segment\n")
+    print(f"{'segments':>9}{'legacy s':>10}{'sparse s':>10}{'depth s':>9}{'topics':>8}{'depth topics':>14}")
+
+    for n in SEGMENT_COUNTS:
+        segments = synthetic_segments(n, rng)
+
+        topics, sparse_time = timed(lambda: segment(segments))
+        depth_topics, depth_time = timed(lambda: segment(segments, window_size=3, method="depth"))
+
+        if n <= LEGACY_MAX_SEGMENTS:
+            legacy, legacy_time = timed(lambda: legacy_segment(segments))
+            assert [len(t) for t in legacy] == [len(t["segments"]) for t in topics], "sparse TextTiling disagrees"
+            legacy_col = f"{legacy_time:>10.2f}"
+        else:
+            legacy_col = f"{'-':>10}"
+
+        print(f"{n:>9}{legacy_col}{sparse_time:>10.2f}{depth_time:>9.2f}{len(topics):>8}{len(depth_topics):>14}")
+
+
+if __name__ == "__main__":
+    main()
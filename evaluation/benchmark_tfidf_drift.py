@@ -0,0 +1,80 @@
+"""
+benchmark_tfidf_drift.py — TF-IDF Drift Segmentation Scaling
+------------------------------------------------------------
+Compares the per-position slice/mean/cosine_similarity loop of the
+original drift segmenter with the window-sum version (single scale and
+a multi-scale window set), checking the single-scale topics are equal.
+"""
+
+import random
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.metrics.pairwise import cosine_similarity
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from topic_intelligence.topic_segmentation.algorithms.segment_tfidf_drift import segment
+
+SEGMENT_COUNTS = [1000, 5000, 20000, 100000]
+LEGACY_MAX_SEGMENTS = 20000
+WINDOW_SIZES = (2, 3, 5, 8)
+WORDS_PER_SEGMENT = 12
+
+
+def legacy_boundaries(tfidf, window_size=3, threshold=0.25):
+    boundaries = []
+    for i in range(window_size, tfidf.shape[0]):
+        prev_vec = np.asarray(tfidf[i - window_size:i].mean(axis=0)).reshape(1, -1)
+        next_vec = np.asarray(tfidf[i:i + window_size].mean(axis=0)).reshape(1, -1)
+        if cosine_similarity(prev_vec, next_vec)[0][0] < threshold:
+            boundaries.append(i)
+    return boundaries
+
+
+def synthetic_segments(n, rng):
+    segments = []
+    topic = 0
+    while len(segments) < n:
+        vocab = [f"topic{topic}word{i}" for i in range(30)] + [f"common{i}" for i in range(20)]
+        for _ in range(rng.randint(5, 30)):
+            segments.append({"text": " ".join(rng.choice(vocab) for _ in range(WORDS_PER_SEGMENT))})
+        topic += 1
+    return segments[:n]
+
+
+def timed(fn):
+    start = time.perf_counter()
+    result = fn()
+    return result, time.perf_counter() - start
+
+
+def main():
+    rng = random.Random(0)
+    print(f"window_size 3, multi-scale {WINDOW_SIZES}\n")
+    print(f"{'segments':>9}{'legacy s':>10}{'window-sum s':>14}{'multi-scale s':>15}")
+
+    for n in SEGMENT_COUNTS:
+        segments = synthetic_segments(n, rng)
+        tfidf = TfidfVectorizer(stop_words="english", max_features=5000).fit_transform([s["text"] for s in segments])
+
+        topics, fast_time = timed(lambda: segment(segments, tfidf=tfidf))
+        _, multi_time = timed(lambda: segment(segments, tfidf=tfidf, window_sizes=WINDOW_SIZES))
+
+        if n <= LEGACY_MAX_SEGMENTS:
+            legacy, legacy_time = timed(lambda: legacy_boundaries(tfidf))
+            assert legacy == np.cumsum([len(t["segments"]) for t in topics])[:-1].tolist(), "drift boundaries differ"
+            legacy_col = f"{legacy_time:>10.2f}"
+        else:
+            legacy_col = f"{'-':>10}"
+
+        print(f"{n:>9}{legacy_col}{fast_time:>14.3f}{multi_time:>15.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,118 @@
+"""
+lazy_romanization.py — On-Demand Romanization of Episode Artifacts
+------------------------------------------------------------------
+ASR no longer romanizes segments up front; romanized text is only needed
+when a user turns localization on. These helpers fill the missing
+`romanized` fields of an artifact when first requested (batched per
+language through the shared RomanizationEngine) and persist them back,
+so later loads of the same episode read them straight from disk. A
+segmented output with a columnar artifact is romanized in the artifact,
+and its JSON is re-exported from it.
+"""
+
+import json
+import os
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Iterable, List, Union
+
+from language_adaptation.romanizer import romanize_batch
+from language_adaptation.romanization_engine import DEFAULT_SCHEME
+
+try:
+    from pipeline.columnar_artifact import (
+        MANIFEST_FILE,
+        artifact_path,
+        export_json,
+        load_segmented_artifact,
+        write_segmented_artifact
+    )
+    USE_COLUMNAR_ARTIFACT = True
+except ImportError:
+    USE_COLUMNAR_ARTIFACT = False
+
+
+def _artifact_rows(data: Dict) -> List[Dict]:
+    """Sentence/segment dicts of a pipeline or segmented artifact."""
+    rows = list(data.get("segments", []))
+    # v3 segmented output: sentences matched to a segment share its romanized text
+    rows.extend(s for s in data.get("sentences", []) if "segment" not in s)
+    for topic in data.get("topics", []):
+        rows.extend(topic.get("sentences", []))
+    return rows
+
+
+def ensure_romanized(rows: Iterable[Dict]) -> int:
+    """
+    Fill `romanized` on every row that does not have it yet (in place).
+
+    Rows are segments (`text` in the source script) or topic sentences
+    (English `text` plus the segment's `source_text`). English rows keep
+    their text unchanged. The persisted form uses DEFAULT_SCHEME; other
+    schemes are served from the engine's memo.
+
+    Args:
+        rows: Segment or sentence dicts with `language`
+
+    Returns:
+        Number of rows that were romanized
+    """
+    pending = defaultdict(list)
+    for row in rows:
+        if "romanized" in row:
+            continue
+        pending[row.get("language", "en")].append(row)
+
+    for lang, lang_rows in pending.items():
+        sources = [row.get("source_text") or row.get("text", "") for row in lang_rows]
+        try:
+            romanized = romanize_batch(sources, lang, DEFAULT_SCHEME)
+        except Exception as e:
+            print(f"[WARNING] Romanization failed for '{lang}': {e}")
+            romanized = sources
+        for row, value in zip(lang_rows, romanized):
+            row["romanized"] = value
+
+    return sum(len(lang_rows) for lang_rows in pending.values())
+
+
+def romanize_artifact(input_path: Union[str, Path]) -> Dict:
+    """
+    Load an artifact, romanize what is missing and persist the result.
+
+    The file is only rewritten when something new was computed, and the
+    write goes through a temp file so readers never see a partial JSON.
+    A segmented output with a columnar artifact is updated in the
+    artifact and exported back to the JSON.
+
+    Args:
+        input_path: pipeline_output.json or segmented_output.json
+
+    Returns:
+        The artifact data with `romanized` filled in
+    """
+    input_path = Path(input_path)
+
+    artifact = artifact_path(input_path) if USE_COLUMNAR_ARTIFACT else None
+    if artifact is not None and (artifact / MANIFEST_FILE).exists():
+        data = load_segmented_artifact(artifact)
+        computed = ensure_romanized(_artifact_rows(data))
+        if computed:
+            write_segmented_artifact(artifact, data)
+            export_json(artifact, input_path)
+            print(f"[INFO] Romanized {computed} rows in {artifact.name}")
+        return data
+
+    with open(input_path, "r", encoding="utf-8") as f:
+        data = json.load(f)
+
+    computed = ensure_romanized(_artifact_rows(data))
+
+    if computed:
+        temp_path = input_path.with_suffix(f".{os.getpid()}.tmp")
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(data, f, indent=2, ensure_ascii=False)
+        os.replace(temp_path, input_path)
+        print(f"[INFO] Romanized {computed} rows in {input_path.name}")
+
+    return data
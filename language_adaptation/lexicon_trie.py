@@ -0,0 +1,153 @@
+"""
+lexicon_trie.py — Longest-Match Lexicon Transliteration
+-------------------------------------------------------
+Dictionary-driven romanization for scripts without a rule-based scheme
+(Arabic, Chinese). Lexicon entries are compiled into a character trie and
+text is rewritten in a single left-to-right scan, always taking the
+longest entry that matches at the current position. Cost grows with the
+text length (bounded by the longest entry), not with lexicon size, so
+lexicons with hundreds of thousands of entries can be loaded from TSV.
+"""
+
+import unicodedata
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple, Union
+
+# =========================
+# CONFIG
+# =========================
+
+LEXICON_DIR = Path(__file__).resolve().parent / "lexicons"
+
+# Languages whose romanization goes through a lexicon, with transliterate()
+# options: Arabic separates words with spaces, so entries only replace
+# whole words; Chinese does not, so entries match anywhere and are set
+# apart from the neighbouring text
+LEXICON_OPTIONS = {
+    "ar": {"whole_words": True},
+    "zh": {"separator": " "},
+}
+
+_TERMINAL = ""  # trie key holding an entry's replacement (never a text character)
+
+
+class LexiconTrie:
+    """Character trie mapping source words to their romanization."""
+
+    def __init__(self, entries: Optional[Dict[str, str]] = None):
+        self._root: Dict[str, dict] = {}
+        self.size = 0
+        self.max_length = 0
+        if entries:
+            self.update(entries.items())
+
+    def add(self, source: str, target: str) -> None:
+        """Add or overwrite one lexicon entry."""
+        if not source:
+            return
+        node = self._root
+        for ch in source:
+            node = node.setdefault(ch, {})
+        if _TERMINAL not in node:
+            self.size += 1
+        node[_TERMINAL] = target
+        self.max_length = max(self.max_length, len(source))
+
+    def update(self, entries: Iterable[Tuple[str, str]]) -> None:
+        for source, target in entries:
+            self.add(source, target)
+
+    def load(self, path: Union[str, Path]) -> "LexiconTrie":
+        """
+        Merge a TSV lexicon (`source<TAB>romanization` per line).
+
+        Blank lines and lines starting with '#' are ignored; later entries
+        overwrite earlier ones.
+        """
+        with open(path, "r", encoding="utf-8") as f:
+            for line in f:
+                line = line.rstrip("\n")
+                if not line or line.startswith("#") or "\t" not in line:
+                    continue
+                source, target = line.split("\t", 1)
+                self.add(source, target)
+        return self
+
+    def __len__(self) -> int:
+        return self.size
+
+    def transliterate(self, text: str, whole_words: bool = False, separator: str = "") -> str:
+        """
+        Replace every longest lexicon match; other characters pass through.
+
+        Args:
+            text: Text to transliterate
+            whole_words: Only replace matches not preceded or followed by a
+                         letter, digit or combining mark (no partial words)
+            separator: Inserted between a replacement and an adjacent
+                       letter or replacement, so consecutive words stay apart
+
+        Returns:
+            Transliterated text
+        """
+        if not self.size or not text:
+            return text
+
+        root = self._root
+        out = []
+        i = 0
+        n = len(text)
+        pending_separator = False
+        while i < n:
+            node = root.get(text[i])
+            if whole_words and i > 0 and _is_word_char(text[i - 1]):
+                node = None
+
+            match_end, match = -1, None
+            j = i
+            while node is not None:
+                j += 1
+                if _TERMINAL in node and not (whole_words and j < n and _is_word_char(text[j])):
+                    match_end, match = j, node[_TERMINAL]
+                if j == n:
+                    break
+                node = node.get(text[j])
+
+            if match is None:
+                if pending_separator and _is_word_char(text[i]):
+                    out.append(separator)
+                pending_separator = False
+                out.append(text[i])
+                i += 1
+            else:
+                if separator and (pending_separator or (i > 0 and _is_word_char(text[i - 1]))):
+                    out.append(separator)
+                out.append(match)
+                pending_separator = bool(separator)
+                i = match_end
+
+        return "".join(out)
+
+
+def _is_word_char(ch: str) -> bool:
+    return ch.isalnum() or unicodedata.category(ch).startswith("M")
+
+
+@lru_cache(maxsize=None)
+def get_lexicon(lang: str) -> LexiconTrie:
+    """Trie for a language built from LEXICON_DIR/<lang>.tsv (empty if absent)."""
+    trie = LexiconTrie()
+    path = LEXICON_DIR / f"{lang}.tsv"
+    if path.exists():
+        trie.load(path)
+    return trie
+
+
+def load_lexicon(lang: str, path: Union[str, Path]) -> LexiconTrie:
+    """Merge an additional (e.g. large, externally built) lexicon for a language."""
+    if lang not in LEXICON_OPTIONS:
+        raise ValueError(
+            f"No lexicon romanization for '{lang}'; supported: {', '.join(sorted(LEXICON_OPTIONS))}"
+        )
+    return get_lexicon(lang).load(path)
@@ -0,0 +1,268 @@
+"""
+romanization_engine.py — Unified, Memoized Romanization Service
+---------------------------------------------------------------
+Single romanization service behind `romanizer` and `romanized_adapter`.
+Indic scripts are transliterated into a selectable scheme (IAST, ITRANS,
+ISO or simplified ASCII) with precompiled indic-transliteration tables;
+other scripts go through unidecode, Arabic and Chinese after their
+bundled lexicons. Batches of same-language segments are transliterated
+in a single pass and results are memoized per (language, scheme, text
+hash) in a bounded LRU, so UI reruns and additional schemes of an
+already romanized text are cheap.
+"""
+
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+try:
+    from indic_transliteration import sanscript
+    from indic_transliteration.sanscript import SCHEMES, SchemeMap, transliterate
+    USE_INDIC = True
+except ImportError:
+    USE_INDIC = False
+
+from unidecode import unidecode
+
+from language_adaptation.lexicon_trie import LEXICON_OPTIONS, get_lexicon
+
+# =========================
+# CONFIG
+# =========================
+
+SUPPORTED_ROMANIZATION_LANGS = {
+    "hi", "mr", "sa", "te", "ta", "kn", "ml", "bn", "gu", "mni",
+    "ar", "ru", "ja", "zh", "ko", "pa", "ur"
+}
+
+# Mapping specific languages to indic-transliteration constants
+INDIC_SCRIPT_MAP = {
+    "hi": sanscript.DEVANAGARI,
+    "mr": sanscript.DEVANAGARI,
+    "sa": sanscript.DEVANAGARI,
+    "te": sanscript.TELUGU,
+    "ta": sanscript.TAMIL,
+    "kn": sanscript.KANNADA,
+    "ml": sanscript.MALAYALAM,
+    "bn": sanscript.BENGALI,
+    "gu": sanscript.GUJARATI,
+    "pa": sanscript.GURMUKHI
+} if USE_INDIC else {}
+
+# "ascii" is IAST with diacritics folded, derived from the cached IAST output
+ROMANIZATION_SCHEMES = ("iast", "itrans", "iso", "ascii")
+DEFAULT_SCHEME = "iast"
+
+SCHEME_TARGETS = {
+    "iast": sanscript.IAST,
+    "itrans": sanscript.ITRANS,
+    "iso": sanscript.ISO
+} if USE_INDIC else {}
+
+# Lexicons applied before unidecode: unidecode drops Arabic short vowels
+# and spells Chinese one syllable at a time; characters without an entry
+# still fall through to unidecode
+LEXICON_LANGS = set(LEXICON_OPTIONS)
+
+ROMANIZATION_CACHE_SIZE = 20000  # memoized (lang, scheme, text) results
+BATCH_SEPARATOR = "\n"           # passes through every transliteration table unchanged
+
+_SPACE_RUN = re.compile(" {2,}")
+
+
+def _text_key(lang: str, scheme: str, text: str) -> Tuple[str, str, bytes]:
+    return lang, scheme, hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+
+
+class RomanizationEngine:
+    """
+    Romanizer with precompiled scheme maps, batching and an LRU memo.
+
+    Indic languages are transliterated into the requested scheme, falling
+    back to unidecode when transliteration changes nothing. Every other
+    supported language is romanized with its lexicon (if any) and
+    unidecode, identically for all schemes.
+    """
+
+    def __init__(self, cache_size: int = ROMANIZATION_CACHE_SIZE):
+        self.cache_size = cache_size
+        self._cache: "OrderedDict[Tuple[str, str, bytes], str]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+        # One compiled table per (script, scheme), built on the scheme's first use
+        self._scheme_maps: Dict[Tuple[str, str], "SchemeMap"] = {}
+
+    # -------------------------
+    # Memo
+    # -------------------------
+
+    def _lookup(self, key: Tuple[str, str, bytes]) -> Optional[str]:
+        with self._lock:
+            value = self._cache.get(key)
+            if value is None:
+                self.misses += 1
+                return None
+            self._cache.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def _store(self, key: Tuple[str, str, bytes], value: str) -> None:
+        with self._lock:
+            self._cache[key] = value
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def clear_cache(self) -> None:
+        with self._lock:
+            self._cache.clear()
+            self.hits = self.misses = 0
+
+    # -------------------------
+    # Romanization
+    # -------------------------
+
+    def _scheme_map(self, lang: str, scheme: str):
+        script = INDIC_SCRIPT_MAP[lang]
+        key = (script, scheme)
+        if key not in self._scheme_maps:
+            self._scheme_maps[key] = SchemeMap(SCHEMES[script], SCHEMES[SCHEME_TARGETS[scheme]])
+        return self._scheme_maps[key]
+
+    @staticmethod
+    def _unidecode(text: str) -> str:
+        try:
+            romanized = unidecode(text)
+            return romanized.strip() if romanized else text
+        except Exception:
+            return text
+
+    def _transliterate_many(self, texts: List[str], scheme_map) -> List[Optional[str]]:
+        """Transliterate every text in one pass; None where it failed."""
+        joined = BATCH_SEPARATOR.join(texts)
+
+        try:
+            output = transliterate(joined, scheme_map=scheme_map)
+        except Exception as e:
+            print(f"Indic-transliteration error: {e}")
+            return [None] * len(texts)
+
+        lines = output.split(BATCH_SEPARATOR)
+        if len(lines) != len(joined.split(BATCH_SEPARATOR)):
+            # Separator was not preserved; fall back to one call per text
+            return [self._transliterate_one(t, scheme_map) for t in texts]
+
+        results = []
+        pos = 0
+        for text in texts:
+            n_lines = text.count(BATCH_SEPARATOR) + 1
+            results.append(BATCH_SEPARATOR.join(lines[pos:pos + n_lines]))
+            pos += n_lines
+        return results
+
+    @staticmethod
+    def _transliterate_one(text: str, scheme_map) -> Optional[str]:
+        try:
+            return transliterate(text, scheme_map=scheme_map)
+        except Exception as e:
+            print(f"Indic-transliteration error: {e}")
+            return None
+
+    def _romanize_uncached(self, texts: List[str], lang: str, scheme: str) -> List[str]:
+        if scheme == "ascii":
+            # Fold the (memoized) IAST output instead of transliterating again
+            return [self._unidecode(t) for t in self.romanize_batch(texts, lang, "iast")]
+
+        if lang not in INDIC_SCRIPT_MAP:
+            if lang in LEXICON_LANGS:
+                lexicon = get_lexicon(lang)
+                texts = [lexicon.transliterate(t, **LEXICON_OPTIONS[lang]) for t in texts]
+                # unidecode ends each Han syllable with a space; one is enough
+                return [_SPACE_RUN.sub(" ", self._unidecode(t)) for t in texts]
+            return [self._unidecode(t) for t in texts]
+
+        scheme_map = self._scheme_map(lang, scheme)
+        results = []
+        for text, romanized in zip(texts, self._transliterate_many(texts, scheme_map)):
+            if romanized and romanized != text:
+                results.append(romanized)
+            else:
+                results.append(self._unidecode(text))
+        return results
+
+    def romanize_batch(self, texts: Sequence[str], lang: str, scheme: str = DEFAULT_SCHEME) -> List[str]:
+        """
+        Romanize many texts of the same language.
+
+        Cache misses are deduplicated and transliterated together in a
+        single pass; empty texts and unsupported languages pass through.
+
+        Args:
+            texts: Texts to romanize
+            lang: Language code shared by all texts
+            scheme: One of ROMANIZATION_SCHEMES
+
+        Returns:
+            Romanized texts in input order
+        """
+        if scheme not in ROMANIZATION_SCHEMES:
+            raise ValueError(f"Unknown romanization scheme '{scheme}', expected one of {ROMANIZATION_SCHEMES}")
+
+        results = list(texts)
+        if lang == "en" or lang not in SUPPORTED_ROMANIZATION_LANGS:
+            return results
+
+        pending: Dict[Tuple[str, str, bytes], List[int]] = {}
+        for i, text in enumerate(texts):
+            if not text or not text.strip():
+                continue
+            key = _text_key(lang, scheme, text)
+            if key in pending:
+                pending[key].append(i)
+                continue
+            cached = self._lookup(key)
+            if cached is not None:
+                results[i] = cached
+            else:
+                pending[key] = [i]
+
+        if pending:
+            keys = list(pending)
+            missing = [texts[pending[key][0]] for key in keys]
+            for key, romanized in zip(keys, self._romanize_uncached(missing, lang, scheme)):
+                self._store(key, romanized)
+                for i in pending[key]:
+                    results[i] = romanized
+
+        return results
+
+    def romanize(self, text: str, lang: str, scheme: str = DEFAULT_SCHEME) -> str:
+        """Romanize a single text (memoized)."""
+        return self.romanize_batch([text], lang, scheme)[0]
+
+    def romanize_schemes(
+        self,
+        text: str,
+        lang: str,
+        schemes: Iterable[str] = ROMANIZATION_SCHEMES
+    ) -> Dict[str, str]:
+        """Romanize one text into several schemes (e.g. for side-by-side display)."""
+        return {scheme: self.romanize(text, lang, scheme) for scheme in schemes}
+
+
+_DEFAULT_ENGINE = None
+_DEFAULT_ENGINE_LOCK = threading.Lock()
+
+
+def get_engine() -> RomanizationEngine:
+    """Process-wide engine, built on first use."""
+    global _DEFAULT_ENGINE
+    if _DEFAULT_ENGINE is None:
+        with _DEFAULT_ENGINE_LOCK:
+            if _DEFAULT_ENGINE is None:
+                _DEFAULT_ENGINE = RomanizationEngine()
+    return _DEFAULT_ENGINE
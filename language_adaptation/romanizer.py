@@ -2,38 +2,25 @@
 
 
 
-try:
-    from indic_transliteration import sanscript
-    from indic_transliteration.sanscript import transliterate
-    USE_INDIC = True
-except ImportError:
-    USE_INDIC = False
+from typing import Dict, Iterable, List, Sequence
 
-from unidecode import unidecode
+from language_adaptation.romanization_engine import (
+    USE_INDIC,
+    SUPPORTED_ROMANIZATION_LANGS,
+    INDIC_SCRIPT_MAP,
+    ROMANIZATION_SCHEMES,
+    DEFAULT_SCHEME,
+    get_engine
+)
 
-SUPPORTED_ROMANIZATION_LANGS = {
-    "hi", "mr", "sa", "te", "ta", "kn", "ml", "bn", "gu", "mni",
-    "ar", "ru", "ja", "zh", "ko", "pa"
-}
 
-# Mapping specific languages to indic-transliteration constants
-INDIC_SCRIPT_MAP = {
-    "hi": sanscript.DEVANAGARI,
-    "mr": sanscript.DEVANAGARI,
-    "sa": sanscript.DEVANAGARI,
-    "te": sanscript.TELUGU,
-    "ta": sanscript.TAMIL,
-    "kn": sanscript.KANNADA,
-    "ml": sanscript.MALAYALAM,
-    "bn": sanscript.BENGALI,
-    "gu": sanscript.GUJARATI,
-    "pa": sanscript.GURMUKHI
-}
-
-def romanize_text(text: str, lang: str) -> str:
+def romanize_text(text: str, lang: str, scheme: str = DEFAULT_SCHEME) -> str:
     """
-    Romanize text using indic-transliteration for Indic scripts (IAST format) 
-    and unidecode for others.
+    Romanize text using indic-transliteration for Indic scripts (IAST format
+    by default, or ITRANS / ISO / ASCII) and unidecode for others.
+
+    Results are memoized by the shared RomanizationEngine, so re-romanizing
+    the same text (e.g. on a UI rerun) is a cache lookup.
     """
     if not text or not text.strip():
         return text
@@ -44,21 +31,14 @@ def romanize_text(text: str, lang: str) -> str:
     if lang not in SUPPORTED_ROMANIZATION_LANGS:
         return text
 
-    # Use indic-transliteration for Indic languages if available
-    if USE_INDIC and lang in INDIC_SCRIPT_MAP:
-        try:
-            source_script = INDIC_SCRIPT_MAP[lang]
-            # Convert to IAST (International Alphabet of Sanskrit Transliteration)
-            # This provides high-quality, readable romanization with diacritics
-            romanized = transliterate(text, source_script, sanscript.IAST)
-            if romanized and romanized != text:
-                return romanized
-        except Exception as e:
-            print(f"Indic-transliteration error: {e}")
-            # Fallback to unidecode
+    return get_engine().romanize(text, lang, scheme)
 
-    try:
-        romanized = unidecode(text)
-        return romanized.strip() if romanized else text
-    except Exception:
-        return text
+
+def romanize_batch(texts: Sequence[str], lang: str, scheme: str = DEFAULT_SCHEME) -> List[str]:
+    """Romanize many same-language texts in one transliteration pass."""
+    return get_engine().romanize_batch(texts, lang, scheme)
+
+
+def romanize_schemes(text: str, lang: str, schemes: Iterable[str] = ROMANIZATION_SCHEMES) -> Dict[str, str]:
+    """Romanize one text into several schemes, sharing cached work between them."""
+    return get_engine().romanize_schemes(text, lang, schemes)
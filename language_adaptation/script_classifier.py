@@ -0,0 +1,214 @@
+"""
+script_classifier.py — Fast Unicode Script Classification
+---------------------------------------------------------
+Classifies characters by Unicode block using a sorted range table instead
+of building a `unicodedata.name()` string per character. Whole texts (or
+all segments of an episode at once) are classified with a single
+`numpy.searchsorted` over their codepoints.
+"""
+
+from bisect import bisect_right
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+# =========================
+# TABLES
+# =========================
+
+SCRIPT_LANGUAGE_MAP = {
+    "DEVANAGARI": "hi",
+    "TELUGU": "te",
+    "TAMIL": "ta",
+    "KANNADA": "kn",
+    "MALAYALAM": "ml",
+    "BENGALI": "bn",
+    "GUJARATI": "gu",
+    "MEETEI": "mni",
+    "ARABIC": "ar",
+    "CYRILLIC": "ru",
+    "HIRAGANA": "ja",
+    "KATAKANA": "ja",
+    "CJK": "zh",
+    "HANGUL": "ko"
+}
+
+# Unicode blocks of the scripts above, sorted by first codepoint
+SCRIPT_RANGES = [
+    (0x0400, 0x052F, "CYRILLIC"),
+    (0x0600, 0x06FF, "ARABIC"),
+    (0x0750, 0x077F, "ARABIC"),
+    (0x0870, 0x08FF, "ARABIC"),
+    (0x0900, 0x097F, "DEVANAGARI"),
+    (0x0980, 0x09FF, "BENGALI"),
+    (0x0A80, 0x0AFF, "GUJARATI"),
+    (0x0B80, 0x0BFF, "TAMIL"),
+    (0x0C00, 0x0C7F, "TELUGU"),
+    (0x0C80, 0x0CFF, "KANNADA"),
+    (0x0D00, 0x0D7F, "MALAYALAM"),
+    (0x1100, 0x11FF, "HANGUL"),
+    (0x1C80, 0x1C8F, "CYRILLIC"),
+    (0x2DE0, 0x2DFF, "CYRILLIC"),
+    (0x2E80, 0x2FDF, "CJK"),
+    (0x3040, 0x309F, "HIRAGANA"),
+    (0x30A0, 0x30FF, "KATAKANA"),
+    (0x3130, 0x318F, "HANGUL"),
+    (0x31C0, 0x31EF, "CJK"),
+    (0x31F0, 0x31FF, "KATAKANA"),
+    (0x3400, 0x4DBF, "CJK"),
+    (0x4E00, 0x9FFF, "CJK"),
+    (0xA640, 0xA69F, "CYRILLIC"),
+    (0xA8E0, 0xA8FF, "DEVANAGARI"),
+    (0xA960, 0xA97F, "HANGUL"),
+    (0xAAE0, 0xAAFF, "MEETEI"),
+    (0xABC0, 0xABFF, "MEETEI"),
+    (0xAC00, 0xD7FF, "HANGUL"),
+    (0xF900, 0xFAFF, "CJK"),
+    (0xFB50, 0xFDFF, "ARABIC"),
+    (0xFE70, 0xFEFF, "ARABIC"),
+    (0x11FC0, 0x11FFF, "TAMIL"),
+    (0x1B000, 0x1B16F, "KATAKANA"),
+    (0x1EE00, 0x1EEFF, "ARABIC"),
+    (0x20000, 0x2FA1F, "CJK"),
+]
+
+# Column order of count matrices
+SCRIPTS = list(SCRIPT_LANGUAGE_MAP)
+
+_STARTS = np.array([start for start, _, _ in SCRIPT_RANGES], dtype=np.uint32)
+_ENDS = np.array([end for _, end, _ in SCRIPT_RANGES], dtype=np.uint32)
+_RANGE_SCRIPT_IDS = np.array([SCRIPTS.index(script) for _, _, script in SCRIPT_RANGES])
+_STARTS_LIST = _STARTS.tolist()
+
+# Column order of language count matrices
+LANGUAGES = list(dict.fromkeys(SCRIPT_LANGUAGE_MAP.values()))
+
+_SCRIPT_LANGUAGE_MATRIX = np.zeros((len(SCRIPTS), len(LANGUAGES)), dtype=np.int64)
+for _i, _script in enumerate(SCRIPTS):
+    _SCRIPT_LANGUAGE_MATRIX[_i, LANGUAGES.index(SCRIPT_LANGUAGE_MAP[_script])] = 1
+_KANA_COLUMNS = [SCRIPTS.index("HIRAGANA"), SCRIPTS.index("KATAKANA")]
+_JA = LANGUAGES.index("ja")
+_ZH = LANGUAGES.index("zh")
+
+# Below this length a bisect loop beats the numpy call overhead
+VECTORIZE_MIN_CHARS = 512
+
+
+def _codepoints(text: str) -> np.ndarray:
+    return np.frombuffer(text.encode("utf-32-le", errors="surrogatepass"), dtype=np.uint32)
+
+
+def _script_ids(codepoints: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Map codepoints to script column ids; returns (ids, mask_of_classified)."""
+    idx = np.searchsorted(_STARTS, codepoints, side="right") - 1
+    clipped = np.maximum(idx, 0)
+    mask = (idx >= 0) & (codepoints <= _ENDS[clipped])
+    return _RANGE_SCRIPT_IDS[clipped], mask
+
+
+def classify_char(ch: str) -> Optional[str]:
+    """Script of a single character, or None for ASCII/unlisted scripts."""
+    cp = ord(ch)
+    idx = bisect_right(_STARTS_LIST, cp) - 1
+    if idx >= 0 and cp <= SCRIPT_RANGES[idx][1]:
+        return SCRIPT_RANGES[idx][2]
+    return None
+
+
+def script_counts(text: str) -> Dict[str, int]:
+    """Number of characters per script in a text (unlisted scripts omitted)."""
+    if not text or text.isascii():
+        return {}
+
+    if len(text) < VECTORIZE_MIN_CHARS:
+        counts: Dict[str, int] = {}
+        for ch in text:
+            if ch.isascii():
+                continue
+            script = classify_char(ch)
+            if script:
+                counts[script] = counts.get(script, 0) + 1
+        return counts
+
+    ids, mask = _script_ids(_codepoints(text))
+    counts = np.bincount(ids[mask], minlength=len(SCRIPTS))
+    return {SCRIPTS[i]: int(c) for i, c in enumerate(counts) if c}
+
+
+def dominant_script(text: str) -> Tuple[Optional[str], Dict[str, int]]:
+    """Most frequent script in a text together with all script counts."""
+    counts = script_counts(text)
+    if not counts:
+        return None, counts
+    return max(counts, key=counts.get), counts
+
+
+def script_counts_bulk(texts: Sequence[str]) -> np.ndarray:
+    """
+    Script counts for many texts in one vectorized pass.
+
+    Returns:
+        Integer matrix of shape (len(texts), len(SCRIPTS)); columns follow SCRIPTS
+    """
+    counts = np.zeros((len(texts), len(SCRIPTS)), dtype=np.int64)
+    if not texts:
+        return counts
+
+    codepoints = _codepoints("".join(texts))
+    lengths = np.fromiter((len(t) for t in texts), dtype=np.int64, count=len(texts))
+    owners = np.repeat(np.arange(len(texts)), lengths)
+
+    ids, mask = _script_ids(codepoints)
+    flat = owners[mask] * len(SCRIPTS) + ids[mask]
+    counts += np.bincount(flat, minlength=counts.size).reshape(counts.shape)
+    return counts
+
+
+def language_counts(counts: np.ndarray) -> np.ndarray:
+    """
+    Characters per language from a script count matrix.
+
+    Han characters count as Japanese in texts that also contain kana, since
+    Japanese writes kanji alongside hiragana/katakana; otherwise they count
+    as Chinese.
+
+    Args:
+        counts: Matrix of shape (n, len(SCRIPTS)) from script_counts_bulk
+
+    Returns:
+        Integer matrix of shape (n, len(LANGUAGES)); columns follow LANGUAGES
+    """
+    languages = counts @ _SCRIPT_LANGUAGE_MATRIX
+    has_kana = counts[:, _KANA_COLUMNS].sum(axis=1) > 0
+    languages[has_kana, _JA] += languages[has_kana, _ZH]
+    languages[has_kana, _ZH] = 0
+    return languages
+
+
+def _pick_languages(counts: np.ndarray, fallback: str) -> List[str]:
+    # argmax keeps the first maximum, so ties resolve in LANGUAGES order
+    languages = language_counts(counts)
+    best = languages.argmax(axis=1)
+    has_script = languages.max(axis=1) > 0
+    return [LANGUAGES[b] if found else fallback for b, found in zip(best, has_script)]
+
+
+def detect_languages_bulk(texts: Sequence[str], fallback: str) -> List[str]:
+    """Language of every text from its dominant script (fallback if none)."""
+    return _pick_languages(script_counts_bulk(texts), fallback)
+
+
+def detect_language_from_script(text: str, fallback: str) -> str:
+    """Language of a text from its dominant non-Latin script."""
+    counts = script_counts(text)
+    if not counts:
+        return fallback
+
+    totals = dict.fromkeys(LANGUAGES, 0)
+    for script, count in counts.items():
+        totals[SCRIPT_LANGUAGE_MAP[script]] += count
+    if counts.get("HIRAGANA") or counts.get("KATAKANA"):
+        totals["ja"] += totals["zh"]
+        totals["zh"] = 0
+    # max keeps the first maximum, the same LANGUAGES order as the bulk path
+    return max(totals, key=totals.get)
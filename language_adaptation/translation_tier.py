@@ -0,0 +1,185 @@
+"""
+translation_tier.py — Policy-Driven Segment Translation
+-------------------------------------------------------
+Moves English translation out of the ASR job. Every segment carries a
+`translation_state` in the artifact and is translated according to the
+episode's policy:
+
+- "eager":        translate inside process_audio (previous behaviour)
+- "segmentation": translate when topic segmentation needs English text
+- "deferred":     translate in a background thread or on request from the UI
+
+Until a segment is translated its `translation` holds the source text, so
+every consumer keeps working on a valid artifact. Identical texts are
+translated once and requests run concurrently.
+"""
+
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Union
+
+from language_adaptation.translator import translate_auto
+
+# =========================
+# CONFIG
+# =========================
+
+TRANSLATION_POLICIES = ("eager", "segmentation", "deferred")
+DEFAULT_TRANSLATION_POLICY = "segmentation"
+TRANSLATION_TARGET = "en"
+TRANSLATION_WORKERS = 8  # translation is network-bound
+
+# translation_state values
+STATE_NOT_NEEDED = "not_needed"  # segment already in the target language
+STATE_PENDING = "pending"
+STATE_DONE = "done"
+STATE_FAILED = "failed"          # a backend error; retried on the next request
+
+_ARTIFACT_LOCKS: Dict[Path, threading.Lock] = {}
+_ARTIFACT_LOCKS_GUARD = threading.Lock()
+
+
+def init_translation_state(segments: Iterable[Dict], target_lang: str = TRANSLATION_TARGET) -> None:
+    """Mark segments as pending (or not needed) with the source text as placeholder."""
+    for seg in segments:
+        if "translation_state" in seg:
+            continue
+        seg.setdefault("translation", seg.get("text", ""))
+        if seg.get("language", target_lang) == target_lang:
+            seg["translation_state"] = STATE_NOT_NEEDED
+        else:
+            seg["translation_state"] = STATE_PENDING
+
+
+def needs_translation(segments: Iterable[Dict]) -> bool:
+    """Whether any segment still waits for its translation."""
+    return any(seg.get("translation_state") in (STATE_PENDING, STATE_FAILED) for seg in segments)
+
+
+def translate_segments(
+    segments: List[Dict],
+    target_lang: str = TRANSLATION_TARGET,
+    indices: Optional[Iterable[int]] = None,
+    workers: int = TRANSLATION_WORKERS
+) -> int:
+    """
+    Translate pending segments in place.
+
+    Args:
+        segments: Pipeline segments (with `text`, `language`, `translation_state`)
+        target_lang: Language to translate into
+        indices: Restrict to these segment positions (e.g. what the UI shows)
+        workers: Concurrent translation requests
+
+    Returns:
+        Number of segments that were translated
+    """
+    init_translation_state(segments, target_lang)
+
+    positions = range(len(segments)) if indices is None else indices
+    todo = [
+        segments[i] for i in positions
+        if segments[i].get("translation_state") in (STATE_PENDING, STATE_FAILED)
+    ]
+    if not todo:
+        return 0
+
+    # Repeated phrases (intros, sponsor reads) are requested once
+    unique = {}
+    for seg in todo:
+        unique.setdefault((seg.get("language", "auto"), seg["text"]), None)
+
+    def translate(key):
+        lang, text = key
+        try:
+            return translate_auto(text, lang, target_lang, raise_errors=True)
+        except Exception as e:
+            print(f"[WARNING] Translation failed ({lang} -> {target_lang}): {e}")
+            return None
+
+    with ThreadPoolExecutor(max_workers=max(1, min(workers, len(unique)))) as pool:
+        for key, translation in zip(unique, pool.map(translate, list(unique))):
+            unique[key] = translation
+
+    translated = 0
+    for seg in todo:
+        translation = unique[(seg.get("language", "auto"), seg["text"])]
+        if translation is None:
+            # Keep the source text as placeholder until a retry succeeds
+            seg["translation_state"] = STATE_FAILED
+            continue
+        # Names, numbers and loanwords legitimately translate to themselves
+        seg["translation"] = translation
+        seg["translation_state"] = STATE_DONE
+        translated += 1
+
+    return translated
+
+
+def _artifact_lock(path: Path) -> threading.Lock:
+    with _ARTIFACT_LOCKS_GUARD:
+        return _ARTIFACT_LOCKS.setdefault(path.resolve(), threading.Lock())
+
+
+def translate_artifact(
+    input_path: Union[str, Path],
+    indices: Optional[Iterable[int]] = None,
+    target_lang: str = TRANSLATION_TARGET
+) -> Dict:
+    """
+    Translate the pending segments of a pipeline artifact and persist them.
+
+    Args:
+        input_path: pipeline_output.json
+        indices: Restrict to these segment positions
+        target_lang: Language to translate into
+
+    Returns:
+        The updated artifact data
+    """
+    input_path = Path(input_path)
+
+    with _artifact_lock(input_path):
+        with open(input_path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+
+        segments = data.get("segments", [])
+        before = [seg.get("translation_state") for seg in segments]
+        translated = translate_segments(segments, target_lang, indices)
+
+        if before != [seg.get("translation_state") for seg in segments]:
+            temp_path = input_path.with_suffix(f".{os.getpid()}.tmp")
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+            os.replace(temp_path, input_path)
+            print(f"[INFO] Translated {translated} segments in {input_path.name}")
+
+    return data
+
+
+def start_background_translation(
+    input_path: Union[str, Path],
+    on_complete: Optional[Callable[[Dict], None]] = None
+) -> threading.Thread:
+    """
+    Translate all pending segments of an artifact in a daemon thread.
+
+    Args:
+        input_path: pipeline_output.json
+        on_complete: Called with the updated artifact once translation has
+                     been persisted, e.g. to re-segment on the English text
+
+    Returns:
+        The started thread
+    """
+    def run():
+        data = translate_artifact(input_path)
+        if on_complete is not None:
+            on_complete(data)
+
+    thread = threading.Thread(target=run, name="lexara-translation", daemon=True)
+    thread.start()
+    return thread
@@ -9,7 +9,11 @@ try:
 except ImportError:
     USE_DEEP_TRANSLATOR = False
 
-from transformers import MarianMTModel, MarianTokenizer
+try:
+    from transformers import MarianMTModel, MarianTokenizer
+    USE_MARIAN = True
+except ImportError:
+    USE_MARIAN = False
 
 _MODEL_CACHE = {}
 
@@ -67,10 +71,14 @@ def chunk_text(text: str, max_chars: int = 4500) -> list[str]:
         
     return chunks
 
-def translate_auto(text: str, source_lang: str, target_lang: str) -> str:
+def translate_auto(text: str, source_lang: str, target_lang: str, raise_errors: bool = False) -> str:
     """
     Translate text from source language to target language.
     Uses deep-translator (Google Translate) with chunking support.
+
+    When every backend fails the original text is returned, or a
+    RuntimeError is raised with raise_errors=True so callers can tell a
+    failure from a text whose translation is identical.
     """
     if not text.strip():
         return text
@@ -128,6 +136,11 @@ def translate_auto(text: str, source_lang: str, target_lang: str) -> str:
             pass  # Fall through to Helsinki-NLP
     
     # Fallback to Helsinki-NLP
+    if not USE_MARIAN:
+        if raise_errors:
+            raise RuntimeError(f"No translation backend available for {source_lang} -> {target_lang}")
+        return text
+
     try:
         tokenizer, model = _load_model(source_lang, target_lang)
         # Handle chunking for local model too (max 512 tokens -> approx 2000 chars safe bet)
@@ -141,7 +154,11 @@ def translate_auto(text: str, source_lang: str, target_lang: str) -> str:
             if out:
                 translated_chunks.append(out.strip())
                 
-        return " ".join(translated_chunks) if translated_chunks else text
+        if not translated_chunks:
+            raise RuntimeError("Local model returned no translation")
+        return " ".join(translated_chunks)
     except Exception:
         # If both fail, return original
+        if raise_errors:
+            raise
         return text
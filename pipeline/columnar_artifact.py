@@ -0,0 +1,366 @@
+"""
+columnar_artifact.py — Columnar Episode Artifact (Arrow IPC)
+------------------------------------------------------------
+Binary, column-oriented form of a segmented episode. Topic segmentation
+writes it as its output, indexing and the UI read it; segmented_output.json
+(v3 schema) is only produced from it by export_json.
+
+An artifact is a directory (segmented_output.arrow/) of Arrow IPC files,
+one per table:
+
+    topics.arrow          one row per topic (without its sentences)
+    sentences.arrow       one row per topic sentence, with topic_id
+    segments.arrow        pipeline segments the topics were built from
+    sentence_track.arrow  per-sentence feature columns
+    embeddings.arrow      segmentation sentences and their embeddings
+    manifest.json         format version, table list, top-level fields
+
+Tables are memory-mapped on read. Numeric tables (sentence_track,
+embeddings) are returned as zero-copy numpy views; topics, sentences and
+segments are decoded into dicts once per load. Fields outside a table's
+typed columns (lazily added romanized or translation_state values,
+explicit nulls) are kept per row as JSON in an "extra" column, so the
+materialized JSON shape (self-contained topics, see
+segmented_output.materialize) is restored exactly.
+
+Usage:
+    python pipeline/columnar_artifact.py export <artifact_dir> <output.json>
+"""
+
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
+import pyarrow as pa
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from topic_intelligence.topic_segmentation.segmented_output import (
+    compact_output,
+    load_segmented_output,
+    transcription_output
+)
+
+# =========================
+# CONFIG
+# =========================
+
+ARTIFACT_FORMAT = "lexara-columnar"
+ARTIFACT_VERSION = 1
+ARTIFACT_SUFFIX = ".arrow"
+MANIFEST_FILE = "manifest.json"
+EXTRA_COLUMN = "extra"
+
+SEGMENT_COLUMNS = {
+    "segment_id": pa.int64(),
+    "start": pa.float64(),
+    "end": pa.float64(),
+    "text": pa.string(),
+    "translation": pa.string(),
+    "language": pa.string(),
+    "translation_state": pa.string(),
+}
+
+TOPIC_COLUMNS = {
+    "topic_id": pa.int64(),
+    "segment_id": pa.string(),
+    "start": pa.float64(),
+    "end": pa.float64(),
+    "topic_title": pa.string(),
+    "summary": pa.string(),
+    "keywords": pa.list_(pa.string()),
+    "text": pa.string(),
+    "sentiment": pa.string(),
+    "sentiment_score": pa.float64(),
+    "boundary_confidence": pa.float64(),
+}
+
+SENTENCE_COLUMNS = {
+    "topic_id": pa.int64(),
+    "text": pa.string(),
+    "translation": pa.string(),
+    "source_text": pa.string(),
+    "language": pa.string(),
+    "start": pa.float64(),
+    "end": pa.float64(),
+}
+
+# Derived from topics on export, never stored
+DERIVED_FIELDS = ("Transcription_Output",)
+TABLE_FIELDS = ("topics", "sentence_track")
+# Written by segmentation only; kept when an episode's artifact is updated
+STAGE_TABLES = ("segments", "embeddings")
+
+
+def artifact_path(json_path) -> Path:
+    """Artifact directory stored next to a JSON output."""
+    return Path(json_path).with_suffix(ARTIFACT_SUFFIX)
+
+
+# =========================
+# RECORDS <-> TABLES
+# =========================
+
+def _type_matches(value, dtype: pa.DataType) -> bool:
+    if pa.types.is_floating(dtype):
+        return isinstance(value, float)
+    if pa.types.is_integer(dtype):
+        return isinstance(value, int) and not isinstance(value, bool)
+    if pa.types.is_string(dtype):
+        return isinstance(value, str)
+    if pa.types.is_list(dtype):
+        return isinstance(value, list) and all(isinstance(v, str) for v in value)
+    return False
+
+
+def records_table(records: List[Dict], columns: Dict[str, pa.DataType]) -> pa.Table:
+    """
+    Table with one typed column per entry of `columns`, plus "extra".
+
+    A typed column holds a row's value when the key is present with a
+    value of that type; anything else (other keys, explicit None, values
+    of another type) goes into the row's extra JSON.
+    """
+    data = {name: [] for name in columns}
+    extra = []
+    for record in records:
+        rest = {}
+        for key, value in record.items():
+            if key in columns and value is not None and _type_matches(value, columns[key]):
+                continue
+            rest[key] = value
+        for name, dtype in columns.items():
+            value = record.get(name)
+            data[name].append(value if name not in rest and value is not None else None)
+        extra.append(json.dumps(rest, ensure_ascii=False) if rest else None)
+
+    arrays = [pa.array(data[name], type=dtype) for name, dtype in columns.items()]
+    arrays.append(pa.array(extra, type=pa.string()))
+    return pa.Table.from_arrays(arrays, names=list(columns) + [EXTRA_COLUMN])
+
+
+def table_records(table: pa.Table) -> List[Dict]:
+    """Rows of a records_table back as dicts, in the original shape."""
+    names = [n for n in table.column_names if n != EXTRA_COLUMN]
+    columns = [table.column(n).to_pylist() for n in names]
+    extras = table.column(EXTRA_COLUMN).to_pylist() if EXTRA_COLUMN in table.column_names else [None] * table.num_rows
+
+    records = []
+    for i, extra in enumerate(extras):
+        record = {name: column[i] for name, column in zip(names, columns) if column[i] is not None}
+        if extra:
+            record.update(json.loads(extra))
+        records.append(record)
+    return records
+
+
+# =========================
+# WRITE
+# =========================
+
+def _write_table(path: Path, table: pa.Table) -> None:
+    temp_path = path.with_suffix(f".{os.getpid()}.tmp")
+    with pa.OSFile(str(temp_path), "wb") as sink:
+        with pa.ipc.new_file(sink, table.schema) as writer:
+            writer.write_table(table)
+    os.replace(temp_path, path)
+
+
+def write_segmented_artifact(
+    path,
+    output_data: Dict,
+    segments: Optional[List[Dict]] = None,
+    embeddings: Optional[np.ndarray] = None,
+    embedded_sentences: Optional[Sequence[str]] = None
+) -> Path:
+    """
+    Write a segmented episode as a columnar artifact.
+
+    Args:
+        path: Artifact directory (see artifact_path)
+        output_data: segmented_output.json content, materialized
+        segments: Pipeline segments the topics were built from
+        embeddings: Sentence embeddings, one row per segmentation sentence
+        embedded_sentences: The sentences `embeddings` were computed for
+
+    Returns:
+        The artifact directory. Without `segments` the call is an update
+        of an existing episode (e.g. lazy romanization) and its stage
+        tables (segments, embeddings) are kept.
+    """
+    path = Path(path)
+    path.mkdir(parents=True, exist_ok=True)
+
+    topics = output_data.get("topics", [])
+    sentences = [
+        {"topic_id": topic.get("topic_id"), **sentence}
+        for topic in topics
+        for sentence in topic.get("sentences", [])
+    ]
+
+    tables = {
+        "topics": records_table([{k: v for k, v in t.items() if k != "sentences"} for t in topics], TOPIC_COLUMNS),
+        "sentences": records_table(sentences, SENTENCE_COLUMNS),
+    }
+    if segments is not None:
+        tables["segments"] = records_table(segments, SEGMENT_COLUMNS)
+    if output_data.get("sentence_track"):
+        tables["sentence_track"] = pa.table(output_data["sentence_track"])
+    if embeddings is not None and len(embeddings):
+        emb = np.ascontiguousarray(embeddings, dtype=np.float32)
+        tables["embeddings"] = pa.table({
+            "text": pa.array(list(embedded_sentences), type=pa.string()),
+            "embedding": pa.FixedSizeListArray.from_arrays(pa.array(emb.ravel()), emb.shape[1])
+        })
+
+    kept = []
+    if segments is None and (path / MANIFEST_FILE).exists():
+        kept = [
+            name for name in read_manifest(path)["tables"]
+            if name in STAGE_TABLES and name not in tables and (path / f"{name}.arrow").exists()
+        ]
+
+    for name, table in tables.items():
+        _write_table(path / f"{name}.arrow", table)
+
+    # Manifest last: a reader never sees a table list ahead of its files
+    manifest = {
+        "format": ARTIFACT_FORMAT,
+        "version": ARTIFACT_VERSION,
+        "tables": sorted(list(tables) + kept),
+        "derived": [k for k in DERIVED_FIELDS if k in output_data],
+        "metadata": {
+            k: v for k, v in output_data.items()
+            if k not in TABLE_FIELDS and k not in DERIVED_FIELDS
+        },
+    }
+    temp_path = path / f"{MANIFEST_FILE}.{os.getpid()}.tmp"
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(manifest, f, ensure_ascii=False)
+    os.replace(temp_path, path / MANIFEST_FILE)
+    return path
+
+
+# =========================
+# READ
+# =========================
+
+def read_manifest(path) -> Dict:
+    with open(Path(path) / MANIFEST_FILE, "r", encoding="utf-8") as f:
+        manifest = json.load(f)
+    if manifest.get("format") != ARTIFACT_FORMAT:
+        raise ValueError(f"Not a columnar episode artifact: {path}")
+    return manifest
+
+
+def read_table(path, name: str) -> pa.Table:
+    """Memory-mapped table of an artifact (buffers are not copied)."""
+    source = pa.memory_map(str(Path(path) / f"{name}.arrow"), "r")
+    return pa.ipc.open_file(source).read_all()
+
+
+def read_embeddings(path, sentences: Optional[Sequence[str]] = None) -> Optional[np.ndarray]:
+    """
+    Stored sentence embeddings as a zero-copy (n, dim) float32 view.
+
+    Args:
+        path: Artifact directory
+        sentences: Only return embeddings computed for exactly these sentences
+
+    Returns:
+        The embeddings, or None when none are stored (or for other sentences)
+    """
+    manifest_path = Path(path) / MANIFEST_FILE
+    if not manifest_path.exists() or "embeddings" not in read_manifest(path)["tables"]:
+        return None
+
+    table = read_table(path, "embeddings")
+    if sentences is not None and table.column("text").to_pylist() != list(sentences):
+        return None
+    column = table.column("embedding").combine_chunks()
+    flat = column.values.to_numpy(zero_copy_only=True)
+    return flat.reshape(len(column), column.type.list_size)
+
+
+def load_segments(path) -> List[Dict]:
+    """Pipeline segments stored with the artifact (empty if not stored)."""
+    if "segments" not in read_manifest(path)["tables"]:
+        return []
+    return table_records(read_table(path, "segments"))
+
+
+def load_segmented_artifact(path, track_arrays: bool = False) -> Dict:
+    """
+    segmented_output.json content rebuilt from an artifact.
+
+    Args:
+        path: Artifact directory
+        track_arrays: Return sentence_track columns as numpy arrays
+            (zero-copy views) instead of lists
+
+    Returns:
+        Dict in the segmented_output.json shape
+    """
+    manifest = read_manifest(path)
+    tables = set(manifest["tables"])
+
+    topics = table_records(read_table(path, "topics"))
+    by_topic: Dict[int, List[Dict]] = {}
+    for sentence in table_records(read_table(path, "sentences")):
+        by_topic.setdefault(sentence.pop("topic_id", None), []).append(sentence)
+    for topic in topics:
+        topic["sentences"] = by_topic.get(topic.get("topic_id"), [])
+
+    data = dict(manifest["metadata"])
+    data["topics"] = topics
+    if "Transcription_Output" in manifest.get("derived", []):
+        data["Transcription_Output"] = transcription_output(topics)
+    if "sentence_track" in tables:
+        track = read_table(path, "sentence_track")
+        data["sentence_track"] = {
+            name: (track.column(name).to_numpy() if track_arrays else track.column(name).to_pylist())
+            for name in track.column_names
+        }
+    return data
+
+
+def load_segmented(path, track_arrays: bool = False) -> Dict:
+    """
+    Segmented episode in the v2 shape, from its artifact when there is one.
+
+    Args:
+        path: Artifact directory, or segmented_output.json (its artifact
+              is used when present, else the JSON itself)
+        track_arrays: See load_segmented_artifact
+
+    Returns:
+        Dict in the segmented_output.json shape
+    """
+    path = Path(path)
+    artifact = path if path.suffix == ARTIFACT_SUFFIX else artifact_path(path)
+    if (artifact / MANIFEST_FILE).exists():
+        return load_segmented_artifact(artifact, track_arrays=track_arrays)
+    return load_segmented_output(path)
+
+
+def export_json(path, json_path) -> Path:
+    """Write an artifact out as segmented_output.json (v3 schema)."""
+    json_path = Path(json_path)
+    temp_path = json_path.with_suffix(f".{os.getpid()}.tmp")
+    with open(temp_path, "w", encoding="utf-8") as f:
+        json.dump(compact_output(load_segmented_artifact(path)), f, indent=2, ensure_ascii=False)
+    os.replace(temp_path, json_path)
+    return json_path
+
+
+if __name__ == "__main__":
+    if len(sys.argv) != 4 or sys.argv[1] != "export":
+        print("Usage: python pipeline/columnar_artifact.py export <artifact_dir> <output.json>")
+        sys.exit(1)
+
+    print(f"[SUCCESS] Exported {export_json(sys.argv[2], sys.argv[3])}")
@@ -0,0 +1,362 @@
+"""
+live_pipeline.py — Near-Real-Time Live Podcast Mode
+---------------------------------------------------
+Ingests a live stream (a local file that is still being appended to, or a
+named pipe) through ffmpeg, transcribes it in rolling windows with the
+previous text carried over as Whisper's prompt, and feeds the segments to
+the online topic segmenter. Segments, finalized topics, the open topic
+and animation states are written to outputs/live_output.json after every
+window, which the UI's live view polls. Committed segments and finalized
+topics are encoded once and appended to the snapshot, not re-serialized
+every window.
+
+Usage:
+    python pipeline/live_pipeline.py <stream_path> [language_code] [--realtime]
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+import numpy as np
+import whisper
+
+from language_adaptation.script_classifier import detect_languages_bulk
+from language_adaptation.translation_tier import init_translation_state, translate_segments
+from topic_intelligence.topic_segmentation.online_segmentation import OnlineTopicSegmenter
+from topic_intelligence.animation.animation_state import generate_animation_states
+
+# =========================
+# CONFIG
+# =========================
+
+WHISPER_MODEL = "small"
+SAMPLE_RATE = 16000
+WINDOW_SECONDS = 10          # audio per transcription call (~3-5 s on CPU with "small")
+TAIL_GUARD_SECONDS = 1.0     # segments ending this close to the window edge wait for more audio
+MAX_CARRY_SECONDS = 20       # held-back audio beyond this is committed even mid-segment
+PROMPT_CHARS = 200           # previous transcript passed as initial_prompt
+READ_CHUNK_BYTES = 64 * 1024
+IDLE_TIMEOUT_SECONDS = 15    # a growing file is finished after this long without new data
+LIVE_OUTPUT = PROJECT_ROOT / "outputs" / "live_output.json"
+
+
+def _feed_source(source: Path, stdin, stop: threading.Event, idle_timeout: float) -> None:
+    """
+    Copy a growing file or named pipe into ffmpeg's stdin.
+
+    Regular files are tailed until no new bytes arrive for idle_timeout
+    seconds; a named pipe ends when its writer closes it.
+    """
+    is_pipe = source.is_fifo()
+    try:
+        with open(source, "rb") as f:
+            last_data = time.monotonic()
+            while not stop.is_set():
+                chunk = f.read(READ_CHUNK_BYTES)
+                if chunk:
+                    stdin.write(chunk)
+                    last_data = time.monotonic()
+                elif is_pipe or time.monotonic() - last_data > idle_timeout:
+                    break
+                else:
+                    time.sleep(0.2)
+    except (BrokenPipeError, OSError):
+        pass
+    finally:
+        try:
+            stdin.close()
+        except OSError:
+            pass
+
+
+class LiveTranscriber:
+    """
+    Rolling-window transcription state.
+
+    Audio that ends inside the tail guard of a window is held back and
+    transcribed again with the next window, so words are not cut at window
+    edges; committed text is carried over as the next window's prompt.
+    """
+
+    def __init__(self, model, language: Optional[str] = None):
+        self.model = model
+        self.language = language
+        self.buffer = np.zeros(0, dtype=np.float32)
+        self.buffer_offset = 0.0   # stream time of buffer[0], seconds
+        self.held_samples = 0      # held-back audio already seen by the last window
+        self.prompt = ""
+        self.segment_count = 0
+
+    def push(self, pcm: np.ndarray) -> None:
+        self.buffer = np.concatenate([self.buffer, pcm])
+
+    def ready(self) -> bool:
+        """A full window of new audio has arrived since the last call."""
+        return len(self.buffer) - self.held_samples >= WINDOW_SECONDS * SAMPLE_RATE
+
+    def transcribe_window(self, final: bool = False) -> List[Dict]:
+        """Transcribe held-back plus new audio and return newly committed segments."""
+        if not len(self.buffer):
+            return []
+
+        window = self.buffer
+        window_seconds = len(window) / SAMPLE_RATE
+
+        result = self.model.transcribe(
+            window,
+            language=self.language,
+            task="transcribe",
+            initial_prompt=self.prompt or None,
+            condition_on_previous_text=False,
+            fp16=False,
+            verbose=None
+        )
+        if self.language is None:
+            self.language = result.get("language", "en")
+            print(f"[INFO] Live language: {self.language}")
+
+        raw = [s for s in result.get("segments", []) if s["text"].strip()]
+        committed = raw if final else [s for s in raw if s["end"] <= window_seconds - TAIL_GUARD_SECONDS]
+        if not committed and raw and window_seconds >= MAX_CARRY_SECONDS + WINDOW_SECONDS:
+            committed = raw
+
+        # Drop what was committed (or silence with no speech at all)
+        if committed:
+            consumed = committed[-1]["end"]
+        elif not raw:
+            consumed = max(window_seconds - TAIL_GUARD_SECONDS, 0.0)
+        else:
+            consumed = 0.0
+        consumed_samples = min(int(consumed * SAMPLE_RATE), len(self.buffer))
+
+        segments = []
+        for seg in committed:
+            segments.append({
+                "segment_id": self.segment_count,
+                "start": round(self.buffer_offset + float(seg["start"]), 2),
+                "end": round(self.buffer_offset + float(seg["end"]), 2),
+                "text": seg["text"].strip()
+            })
+            self.segment_count += 1
+
+        self.buffer = self.buffer[consumed_samples:]
+        self.buffer_offset += consumed_samples / SAMPLE_RATE
+        self.held_samples = len(self.buffer)
+        if segments:
+            self.prompt = (self.prompt + " " + " ".join(s["text"] for s in segments))[-PROMPT_CHARS:]
+
+        return segments
+
+
+def _dumps(value) -> str:
+    return json.dumps(value, ensure_ascii=False)
+
+
+class SnapshotEncoder:
+    """
+    Incremental JSON encoding of the live snapshot.
+
+    Committed segments and finalized topics never change, so each one is
+    encoded once and later snapshots reuse the cached text. Animation
+    states are regenerated only when a topic was finalized: the spiral
+    layout depends on the topic count, so every node moves when one is
+    added, but windows without a new topic reuse the previous states.
+    """
+
+    def __init__(self):
+        self.segment_json: List[str] = []
+        self.topic_json: List[str] = []
+        self.animation_states: List[Dict] = []
+        self.animation_json = "[]"
+
+    def encode(self, header: Dict, segments: List[Dict], topics: List[Dict], open_topic: Optional[Dict]) -> str:
+        """
+        Encode a snapshot; segments and topics are append-only lists.
+
+        Args:
+            header: Status fields written ahead of the segments
+            segments: All committed segments so far
+            topics: All finalized topics so far
+            open_topic: The group the segmenter is still extending
+
+        Returns:
+            The snapshot as JSON text
+        """
+        if len(topics) != len(self.topic_json):
+            self.animation_states = generate_animation_states(topics)
+            self.animation_json = _dumps(self.animation_states)
+        self.segment_json.extend(_dumps(seg) for seg in segments[len(self.segment_json):])
+        self.topic_json.extend(_dumps(topic) for topic in topics[len(self.topic_json):])
+
+        fields = [f"{_dumps(key)}: {_dumps(value)}" for key, value in header.items()]
+        fields.append('"segments": [\n' + ",\n".join(self.segment_json) + "\n]")
+        fields.append('"topics": [\n' + ",\n".join(self.topic_json) + "\n]")
+        fields.append(f'"open_topic": {_dumps(open_topic)}')
+        fields.append(f'"3D_Animation_Output": {self.animation_json}')
+        return "{\n" + ",\n".join(fields) + "\n}\n"
+
+
+def _write_snapshot(text: str) -> None:
+    LIVE_OUTPUT.parent.mkdir(parents=True, exist_ok=True)
+    temp_path = LIVE_OUTPUT.with_suffix(f".{os.getpid()}.tmp")
+    with open(temp_path, "w", encoding="utf-8") as f:
+        f.write(text)
+    os.replace(temp_path, LIVE_OUTPUT)
+
+
+def _drain(stream, lines: List[str]) -> None:
+    """Collect ffmpeg's stderr so the pipe never fills up."""
+    for line in iter(stream.readline, b""):
+        lines.append(line.decode(errors="ignore").rstrip())
+
+
+def run_live(
+    source: str,
+    source_lang: str = "auto",
+    realtime: bool = False,
+    idle_timeout: float = IDLE_TIMEOUT_SECONDS
+) -> Dict:
+    """
+    Run live mode until the stream ends.
+
+    Args:
+        source: Growing audio file or named pipe
+        source_lang: Language code, or 'auto' to detect from the first window
+        realtime: Pace processing at 1x audio speed (replaying a recorded file)
+        idle_timeout: Seconds without new data before a growing file is finished
+
+    Returns:
+        The final live snapshot
+
+    Raises:
+        RuntimeError: If ffmpeg exits with an error; the segments committed
+                      until then are kept in a "failed" snapshot
+    """
+    source = Path(source)
+    if not source.exists():
+        raise FileNotFoundError(f"Stream not found: {source}")
+
+    model = whisper.load_model(WHISPER_MODEL)
+    transcriber = LiveTranscriber(model, None if source_lang in ("auto", None) else source_lang)
+    segmenter = OnlineTopicSegmenter()
+    encoder = SnapshotEncoder()
+
+    segments: List[Dict] = []
+    topics: List[Dict] = []
+    started = time.monotonic()
+
+    cmd = [
+        "ffmpeg", "-loglevel", "error", "-i", "pipe:0",
+        "-f", "s16le", "-ac", "1", "-acodec", "pcm_s16le", "-ar", str(SAMPLE_RATE), "-"
+    ]
+    process = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+    stop = threading.Event()
+    feeder = threading.Thread(
+        target=_feed_source, args=(source, process.stdin, stop, idle_timeout), daemon=True
+    )
+    feeder.start()
+    ffmpeg_errors: List[str] = []
+    stderr_reader = threading.Thread(target=_drain, args=(process.stderr, ffmpeg_errors), daemon=True)
+    stderr_reader.start()
+
+    def snapshot(status: str, error: Optional[str] = None) -> Dict:
+        audio_seconds = transcriber.buffer_offset + len(transcriber.buffer) / SAMPLE_RATE
+        header = {
+            "status": status,
+            "audio_source": source.name,
+            "language_detected": transcriber.language,
+            "audio_seconds": round(audio_seconds, 2),
+            "transcribed_seconds": round(transcriber.buffer_offset, 2),
+            "updated_at": datetime.now().isoformat()
+        }
+        if error:
+            header["error"] = error
+        open_topic = segmenter.open_group()
+        _write_snapshot(encoder.encode(header, segments, topics, open_topic))
+        return {
+            **header,
+            "segments": segments,
+            "topics": topics,
+            "open_topic": open_topic,
+            "3D_Animation_Output": encoder.animation_states
+        }
+
+    def process_window(final: bool = False) -> None:
+        new_segments = transcriber.transcribe_window(final=final)
+        if not new_segments:
+            return
+
+        # Per-segment language, then English for the segmenter
+        script_langs = detect_languages_bulk([s["text"] for s in new_segments], fallback=None)
+        for seg, script_lang in zip(new_segments, script_langs):
+            seg["language"] = script_lang or transcriber.language
+        init_translation_state(new_segments)
+        translate_segments(new_segments)
+
+        segments.extend(new_segments)
+        topics.extend(segmenter.add_segments(new_segments))
+
+    snapshot("live")
+    leftover = b""
+    try:
+        while True:
+            chunk = process.stdout.read(READ_CHUNK_BYTES)
+            if not chunk:
+                break
+            chunk = leftover + chunk
+            usable = len(chunk) - len(chunk) % 2
+            leftover = chunk[usable:]
+            transcriber.push(np.frombuffer(chunk[:usable], dtype=np.int16).astype(np.float32) / 32768.0)
+
+            if transcriber.ready():
+                if realtime:
+                    # Do not run ahead of the (simulated) speaker
+                    audio_end = transcriber.buffer_offset + len(transcriber.buffer) / SAMPLE_RATE
+                    delay = audio_end - (time.monotonic() - started)
+                    if delay > 0:
+                        time.sleep(delay)
+
+                process_window()
+                snapshot("live")
+
+        returncode = process.wait()
+        stderr_reader.join()
+
+        process_window(final=True)
+        topics.extend(segmenter.flush())
+
+        if returncode != 0:
+            error = "\n".join(ffmpeg_errors) or f"exit status {returncode}"
+            snapshot("failed", error=error)
+            raise RuntimeError(f"ffmpeg failed on the live stream: {error}")
+        return snapshot("finished")
+    finally:
+        stop.set()
+        if process.poll() is None:
+            process.kill()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Live podcast transcription and topic segmentation")
+    parser.add_argument("source", help="Growing audio file or named pipe")
+    parser.add_argument("language", nargs="?", default="auto", help="Language code or 'auto'")
+    parser.add_argument("--realtime", action="store_true", help="Replay a recorded file at 1x speed")
+    parser.add_argument("--idle-timeout", type=float, default=IDLE_TIMEOUT_SECONDS,
+                        help="Seconds without new data before a growing file is finished")
+    args = parser.parse_args()
+
+    result = run_live(args.source, args.language, realtime=args.realtime, idle_timeout=args.idle_timeout)
+    print(f"[SUCCESS] Live session finished: {len(result['segments'])} segments, {len(result['topics'])} topics")
+    print(f"Live output saved to {LIVE_OUTPUT}")
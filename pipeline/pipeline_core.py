@@ -7,136 +7,125 @@ if str(PROJECT_ROOT) not in sys.path:
 
 import whisper
 import json
-import unicodedata
 
-from language_adaptation.translator import translate_auto
-from language_adaptation.romanizer import romanize_text
+from language_adaptation.translation_tier import (
+    init_translation_state,
+    translate_segments,
+    TRANSLATION_POLICIES,
+    DEFAULT_TRANSLATION_POLICY
+)
+from language_adaptation.script_classifier import detect_languages_bulk
+from audio.audio_processing.audio_loader import load_waveform, audio_fingerprint
+from audio.asr.language_detection import detect_language_sampled
+from audio.asr.code_switch import transcribe_code_switched
 
 
 WHISPER_MODEL = "small"  # Small model (244M params) - good balance of accuracy and speed
 USER_PREFERRED_LANGUAGE = "en"
 
 
-SCRIPT_LANGUAGE_MAP = {
-    "DEVANAGARI": "hi",
-    "TELUGU": "te",
-    "TAMIL": "ta",
-    "KANNADA": "kn",
-    "MALAYALAM": "ml",
-    "BENGALI": "bn",
-    "GUJARATI": "gu",
-    "MEETEI": "mni",
-    "ARABIC": "ar",
-    "CYRILLIC": "ru",
-    "HIRAGANA": "ja",
-    "KATAKANA": "ja",
-    "CJK": "zh",
-    "HANGUL": "ko"
-}
-
-
-def detect_language_from_script(text: str, fallback: str) -> str:
-    for ch in text:
-        if ch.isascii():
-            continue
-        try:
-            script = unicodedata.name(ch).split()[0]
-        except ValueError:
-            continue
-
-        if script in SCRIPT_LANGUAGE_MAP:
-            return SCRIPT_LANGUAGE_MAP[script]
-
-    return fallback
-
-
-def process_audio(audio_path: str, source_lang: str = "auto") -> dict:
+def process_audio(
+    audio_path: str,
+    source_lang: str = "auto",
+    translation_policy: str = DEFAULT_TRANSLATION_POLICY
+) -> dict:
     """Process audio file and transcribe it.
     
     Args:
         audio_path: Path to the audio file
-        source_lang: Language code ('auto' for auto-detect, or specific code like 'te', 'hi', etc.)
+        source_lang: Language code ('auto' for auto-detect, 'mixed' for code-switched
+                     audio, or specific code like 'te', 'hi', etc.)
+        translation_policy: 'eager' translates here; 'segmentation' (default) and
+                            'deferred' leave segments pending for a later stage
     """
     audio_path = Path(audio_path)
 
     if not audio_path.exists():
         raise FileNotFoundError(f"Audio file not found: {audio_path}")
 
+    if translation_policy not in TRANSLATION_POLICIES:
+        raise ValueError(f"Unknown translation policy: {translation_policy}")
+
     model = whisper.load_model(WHISPER_MODEL)
 
+    # Decode once; detection and transcription share the same waveform
+    audio = load_waveform(audio_path)
+    fingerprint = audio_fingerprint(audio_path)
+
     # Determine transcription language
-    if source_lang and source_lang != "auto":
+    if source_lang == "mixed":
+        # Code-switched audio: language is decided per speech region below
+        detected_lang = None
+        print("Using code-switch mode (per-region language)")
+    elif source_lang and source_lang != "auto":
         # Use user-specified language (for when auto-detect fails)
         detected_lang = source_lang
         print(f"Using user-specified language: {detected_lang}")
     else:
-        # Auto-detect language from audio
-        audio = whisper.load_audio(str(audio_path))
-        audio_30s = whisper.pad_or_trim(audio)  # Use first 30 seconds for detection
-        mel = whisper.log_mel_spectrogram(audio_30s, n_mels=model.dims.n_mels).to(model.device)
-        
-        _, probs = model.detect_language(mel)
-        detected_lang = max(probs, key=probs.get)
-        print(f"Auto-detected language: {detected_lang} (confidence: {probs[detected_lang]:.2f})")
-
-    # Transcribe with determined language
-    result = model.transcribe(
-        str(audio_path),
-        language=detected_lang,  # Use determined language for accurate transcription
-        task="transcribe",  # Transcribe in native language, do NOT translate to English
-        fp16=False,
-        verbose=False
-    )
+        # Auto-detect language from windows sampled across the whole file
+        cache_key = f"{fingerprint}:{WHISPER_MODEL}"
+        detected_lang, confidence = detect_language_sampled(model, audio, cache_key=cache_key)
+        print(f"Auto-detected language: {detected_lang} (confidence: {confidence:.2f})")
+
+    if detected_lang is None:
+        result = transcribe_code_switched(model, audio, WHISPER_MODEL)
+    else:
+        # Transcribe with determined language
+        result = model.transcribe(
+            audio,
+            language=detected_lang,  # Use determined language for accurate transcription
+            task="transcribe",  # Transcribe in native language, do NOT translate to English
+            fp16=False,
+            verbose=False
+        )
 
     detected_lang = result.get("language", "en")
+    segments = result.get("segments", [])
     segments_out = []
 
-    for idx, seg in enumerate(result.get("segments", [])):
-        text = seg["text"].strip()
-        segment_lang = detect_language_from_script(text, detected_lang)
-
-        if segment_lang != USER_PREFERRED_LANGUAGE:
-            try:
-                translation = translate_auto(text, segment_lang, USER_PREFERRED_LANGUAGE)
-            except Exception:
-                translation = text
-        else:
-            translation = text
-
-        if segment_lang != "en":
-            try:
-                romanized = romanize_text(text, segment_lang)
-            except Exception:
-                romanized = text
-        else:
-            romanized = text
+    # Script-based language of every segment in one pass
+    texts = [seg["text"].strip() for seg in segments]
+    script_langs = detect_languages_bulk(texts, fallback=None)
+
+    segment_langs = [
+        script_lang or seg.get("language", detected_lang)
+        for seg, script_lang in zip(segments, script_langs)
+    ]
 
+    for idx, (seg, text, segment_lang) in enumerate(zip(segments, texts, segment_langs)):
         segments_out.append({
             "segment_id": idx,
             "start": float(seg["start"]),
             "end": float(seg["end"]),
             "text": text,
-            "language": segment_lang,
-            "translation": translation,
-            "romanized": romanized
+            "language": segment_lang
         })
 
+    # Translation runs here only for the eager policy
+    init_translation_state(segments_out, USER_PREFERRED_LANGUAGE)
+    if translation_policy == "eager":
+        translate_segments(segments_out, USER_PREFERRED_LANGUAGE)
+
     return {
         "audio_file": audio_path.name,
+        "audio_fingerprint": fingerprint,
         "language_detected": detected_lang,
+        "translation_policy": translation_policy,
         "segments": segments_out
     }
 
 
 if __name__ == "__main__":
     if len(sys.argv) < 2:
-        print("Usage: python pipeline_core.py <audio_file> [language_code]")
-        print("       language_code: 'auto' (default), 'te', 'hi', 'ta', 'en', etc.")
+        print("Usage: python pipeline_core.py <audio_file> [language_code] [translation_policy]")
+        print("       language_code: 'auto' (default), 'mixed' (code-switched), 'te', 'hi', 'ta', 'en', etc.")
+        print("       translation_policy: 'segmentation' (default), 'eager', 'deferred'")
         sys.exit(1)
 
     audio_file = sys.argv[1]
     source_lang = sys.argv[2] if len(sys.argv) > 2 else "auto"
-    output = process_audio(audio_file, source_lang)
+    translation_policy = sys.argv[3] if len(sys.argv) > 3 else DEFAULT_TRANSLATION_POLICY
+    output = process_audio(audio_file, source_lang, translation_policy)
 
     OUTPUT_FILE = PROJECT_ROOT / "outputs" / "pipeline_output.json"
     OUTPUT_FILE.parent.mkdir(exist_ok=True)
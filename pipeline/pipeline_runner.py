@@ -8,7 +8,7 @@ import sys
 PYTHON = sys.executable
 
 PIPELINE_OUTPUT = PROJECT_ROOT / "pipeline_output.json"
-SEGMENTED_OUTPUT = PROJECT_ROOT / "segmented_output.json"
+SEGMENTED_ARTIFACT = PROJECT_ROOT / "segmented_output.arrow"
 INDEXED_OUTPUT = PROJECT_ROOT / "indexed_output.json"
 
 
@@ -45,7 +45,7 @@ if __name__ == "__main__":
 
     run_step(
         "indexing_core",
-        [str(PYTHON), "-m", "topic_intelligence.indexing.indexing_core", str(SEGMENTED_OUTPUT)]
+        [str(PYTHON), "-m", "topic_intelligence.indexing.indexing_core", str(SEGMENTED_ARTIFACT)]
     )
 
     run_step(
@@ -1,73 +1,435 @@
+"""
+pipeline_validation_core.py — Artifact Validation against the JSON Schema Contracts
+-----------------------------------------------------------------------------------
+Checks pipeline artifacts against the contracts in contracts/
+(indexed_output_schema.json by default, pipeline_schema.json for
+pipeline_output.json) and reports every violation with its JSON path.
+
+Validators are built once per contract and split per top-level section.
+With fastjsonschema installed, each section is also compiled to Python
+code that accepts valid values quickly; jsonschema then only runs on the
+values it rejects, to list every error. With ijson installed, large artifacts are streamed: every item of a
+top-level array (topics, sentences, segments) and every entry of a
+top-level map (search_index) is validated as soon as it is parsed and
+then dropped, so memory stays flat however long the episode. Smaller
+files (and all files without ijson) are loaded with json and checked
+the same way. Sentence/segment references of v3 artifacts are checked
+against the section lengths.
+
+Usage:
+    python pipeline/pipeline_validation_core.py <artifact.json> [more.json ...]
+        [--schema contracts/pipeline_schema.json] [--workers N]
+"""
+
 import json
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
 
+from jsonschema.validators import validator_for
 
-REQUIRED_TOP_LEVEL_KEYS = {
-    "audio_file": str,
-    "topics": list
-}
+try:
+    import fastjsonschema
+    USE_FASTJSONSCHEMA = True
+except ImportError:
+    USE_FASTJSONSCHEMA = False
 
-REQUIRED_TOPIC_KEYS = {
-    "topic_id": int,
-    "start": (int, float),
-    "end": (int, float),
-    "summary": str,
-    "keywords": list,
-    "text": str,
-    "sentences": list
-}
+try:
+    import ijson
+    USE_IJSON = True
+    _PARSE_ERRORS = (ValueError, ijson.JSONError)
+except ImportError:
+    USE_IJSON = False
+    _PARSE_ERRORS = (ValueError,)
 
-REQUIRED_SENTENCE_KEYS = {
-    "text": str,
-    "translation": str,
-    "romanized": str,
-    "language": str,
-    "start": (int, float),
-    "end": (int, float)
+# =========================
+# CONFIG
+# =========================
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+CONTRACTS_DIR = PROJECT_ROOT / "contracts"
+PIPELINE_SCHEMA = CONTRACTS_DIR / "pipeline_schema.json"
+INDEXED_OUTPUT_SCHEMA = CONTRACTS_DIR / "indexed_output_schema.json"
+
+# Smaller files parse faster with json.load than event by event
+STREAM_MIN_BYTES = 16 * 1024 * 1024
+
+# (section, field) -> section its values index into (v3 segmented/indexed output)
+REFERENCES = {
+    ("sentences", "segment"): "segments",
+    ("topics", "sentence_ids"): "sentences"
 }
 
+_DEPTH = {"start_map": 1, "start_array": 1, "end_map": -1, "end_array": -1}
+
+
+class SchemaError(NamedTuple):
+    """One contract violation: JSON path ($.topics[3].start) and message."""
+    path: str
+    message: str
+
+    def __str__(self) -> str:
+        return f"{self.path}: {self.message}"
+
+
+def format_path(parts: Iterable) -> str:
+    """JSON path of a value from its keys and indices."""
+    return "$" + "".join(f"[{p}]" if isinstance(p, int) else f".{p}" for p in parts)
+
+
+# =========================
+# CONTRACTS
+# =========================
+
+class SectionValidator(NamedTuple):
+    """jsonschema validator of one section, with its compiled fast path."""
+    full: object
+    fast: Optional[Callable]
+
+
+class Contract:
+    """
+    Validators of one JSON Schema contract, built once per process.
+
+    The root schema is split per top-level property so that array items
+    and map entries can be validated one at a time; the remaining
+    keywords (required, if/then, minItems, ...) are checked on shells
+    holding only keys and lengths.
+    """
+
+    def __init__(self, schema: Dict):
+        cls = validator_for(schema)
+        cls.check_schema(schema)
+        self.schema = schema
+        self._root = cls(schema)
+
+        properties = schema.get("properties", {})
+        self.root = self._section(schema, without="properties", compiled=False)
+        self.values = {key: self._section(sub) for key, sub in properties.items()}
+        self.items = {
+            key: self._section(sub["items"])
+            for key, sub in properties.items()
+            if isinstance(sub.get("items"), dict)
+        }
+        self.entries = {
+            key: self._section(sub["additionalProperties"])
+            for key, sub in properties.items()
+            if isinstance(sub.get("additionalProperties"), dict) and "properties" not in sub
+        }
+        self.array_shells = {key: self._section(properties[key], "items", False) for key in self.items}
+        self.map_shells = {key: self._section(properties[key], "additionalProperties", False) for key in self.entries}
+
+    def _section(self, subschema: Dict, without: Optional[str] = None, compiled: bool = True) -> SectionValidator:
+        if without:
+            subschema = {k: v for k, v in subschema.items() if k != without}
+
+        fast = None
+        if compiled and USE_FASTJSONSCHEMA:
+            # References resolve against the contract's definitions
+            wrapper = {
+                "definitions": {**self.schema.get("definitions", {}), "_section": subschema},
+                "$ref": "#/definitions/_section"
+            }
+            if "$schema" in self.schema:
+                wrapper["$schema"] = self.schema["$schema"]
+            fast = fastjsonschema.compile(wrapper, use_default=False)
+
+        return SectionValidator(self._root.evolve(schema=subschema), fast)
+
+
+@lru_cache(maxsize=None)
+def load_contract(schema_path=INDEXED_OUTPUT_SCHEMA) -> Contract:
+    """Contract for a schema file, cached per process."""
+    with open(schema_path, "r", encoding="utf-8") as f:
+        return Contract(json.load(f))
+
+
+class _Checker:
+    """Collects the errors of one artifact as its sections arrive."""
+
+    def __init__(self, contract: Contract):
+        self.contract = contract
+        self.errors: List[SchemaError] = []
+        self.shell: Dict = {}
+        self.lengths: Dict[str, int] = {}
+        self.pending: List[Tuple[Tuple, str, int]] = []
+        self.is_object = True
+
+    def _check(self, validator: SectionValidator, value, path: Tuple) -> None:
+        if validator.fast is not None:
+            try:
+                validator.fast(value)
+                return
+            except fastjsonschema.JsonSchemaException:
+                pass  # invalid: list every error below
+        for error in validator.full.iter_errors(value):
+            self.errors.append(SchemaError(format_path(path + tuple(error.absolute_path)), error.message))
+
+    def _reference(self, path: Tuple, target: str, index: int) -> None:
+        if target not in self.lengths:
+            self.pending.append((path, target, index))
+        elif index >= self.lengths[target]:
+            self.errors.append(SchemaError(format_path(path), f"{target}[{index}] does not exist"))
+
+    def not_object(self) -> None:
+        self.is_object = False
+        self.errors.append(SchemaError("$", "artifact must be a JSON object"))
+
+    def value(self, key: str, value) -> None:
+        self.shell[key] = type(value)() if isinstance(value, (list, dict)) else value
+        if key in self.contract.values:
+            self._check(self.contract.values[key], value, (key,))
+
+    def item(self, key: str, index: int, value) -> None:
+        self._check(self.contract.items[key], value, (key, index))
+        if not isinstance(value, dict):
+            return
+        for (section, field), target in REFERENCES.items():
+            if section != key or field not in value:
+                continue
+            refs = value[field]
+            located = (
+                [((key, index, field, i), ref) for i, ref in enumerate(refs)]
+                if isinstance(refs, list) else [((key, index, field), refs)]
+            )
+            for path, ref in located:
+                if type(ref) is int and ref >= 0:  # wrong types are schema errors already
+                    self._reference(path, target, ref)
+
+    def entry(self, key: str, name: str, value) -> None:
+        self._check(self.contract.entries[key], value, (key, name))
+
+    def end_array(self, key: str, length: int) -> None:
+        self.shell[key] = []
+        self.lengths[key] = length
+        self._check(self.contract.array_shells[key], [None] * length, (key,))
 
-def validate_schema(data: dict) -> None:
-    for key, expected_type in REQUIRED_TOP_LEVEL_KEYS.items():
-        if key not in data:
-            raise ValueError(f"Missing top-level key: {key}")
-        if not isinstance(data[key], expected_type):
-            raise TypeError(f"Key '{key}' must be {expected_type}")
+    def end_map(self, key: str, names: List[str]) -> None:
+        self.shell[key] = {}
+        self._check(self.contract.map_shells[key], dict.fromkeys(names), (key,))
 
-    for topic in data["topics"]:
-        for key, expected_type in REQUIRED_TOPIC_KEYS.items():
-            if key not in topic:
-                raise ValueError(f"Topic missing key: {key}")
-            if not isinstance(topic[key], expected_type):
-                raise TypeError(f"Topic key '{key}' must be {expected_type}")
+    def finish(self) -> List[SchemaError]:
+        if self.is_object:
+            self._check(self.contract.root, self.shell, ())
+        for path, target, index in self.pending:
+            if index >= self.lengths.get(target, 0):
+                self.errors.append(SchemaError(format_path(path), f"{target}[{index}] does not exist"))
+        return self.errors
 
-        for sent in topic["sentences"]:
-            for key, expected_type in REQUIRED_SENTENCE_KEYS.items():
-                if key not in sent:
-                    raise ValueError(f"Sentence missing key: {key}")
-                if not isinstance(sent[key], expected_type):
-                    raise TypeError(f"Sentence key '{key}' must be {expected_type}")
 
+# =========================
+# SOURCES
+# =========================
 
-def validate_file(input_path: str) -> None:
+def _feed_data(data, checker: _Checker) -> None:
+    """Walk an artifact already in memory."""
+    if not isinstance(data, dict):
+        checker.not_object()
+        return
+
+    contract = checker.contract
+    for key, value in data.items():
+        if key in contract.items and isinstance(value, list):
+            for index, item in enumerate(value):
+                checker.item(key, index, item)
+            checker.end_array(key, len(value))
+        elif key in contract.entries and isinstance(value, dict):
+            for name, entry in value.items():
+                checker.entry(key, name, entry)
+            checker.end_map(key, list(value))
+        else:
+            checker.value(key, value)
+
+
+def _feed_stream(f, checker: _Checker) -> None:
+    """
+    Walk an artifact with ijson, holding one array item / map entry at a time.
+
+    Top-level arrays and maps the contract describes per item are not
+    built; any other top-level value is built whole.
+    """
+    contract = checker.contract
+    events = ijson.parse(f, use_float=True)
+    _, event, _ = next(events, (None, None, None))
+    if event != "start_map":
+        checker.not_object()
+        return
+
+    key = container = member = None
+    names: List[str] = []
+    builder, depth = None, 0
+
+    for _, event, value in events:
+        if builder is None:
+            if container == "map" and event == "map_key":
+                member = value
+                names.append(value)
+                continue
+            if container == "array" and event == "end_array":
+                checker.end_array(key, member)
+                container = None
+                continue
+            if container == "map" and event == "end_map":
+                checker.end_map(key, names)
+                container, names = None, []
+                continue
+            if container is None:
+                if event == "map_key":
+                    key = value
+                    continue
+                if event == "end_map":
+                    break
+                if event == "start_array" and key in contract.items:
+                    container, member = "array", 0
+                    continue
+                if event == "start_map" and key in contract.entries:
+                    container = "map"
+                    continue
+            builder, depth = ijson.ObjectBuilder(), 0
+
+        builder.event(event, value)
+        depth += _DEPTH.get(event, 0)
+        if depth:
+            continue
+
+        if container == "array":
+            checker.item(key, member, builder.value)
+            member += 1
+        elif container == "map":
+            checker.entry(key, member, builder.value)
+        else:
+            checker.value(key, builder.value)
+        builder = None
+
+
+# =========================
+# VALIDATION
+# =========================
+
+def schema_errors(data, schema_path=INDEXED_OUTPUT_SCHEMA) -> List[SchemaError]:
+    """
+    All contract violations of an artifact already loaded in memory.
+
+    Args:
+        data: Parsed artifact
+        schema_path: JSON Schema contract
+
+    Returns:
+        List of SchemaError (empty when valid)
+    """
+    checker = _Checker(load_contract(schema_path))
+    _feed_data(data, checker)
+    return checker.finish()
+
+
+def file_errors(input_path, schema_path=INDEXED_OUTPUT_SCHEMA, stream: Optional[bool] = None) -> List[SchemaError]:
+    """
+    All contract violations of an artifact file.
+
+    Args:
+        input_path: Artifact JSON file
+        schema_path: JSON Schema contract
+        stream: Stream with ijson (default: when available and the file
+            is at least STREAM_MIN_BYTES)
+
+    Returns:
+        List of SchemaError (empty when valid); unreadable JSON is one error at $
+    """
+    if stream is None:
+        stream = USE_IJSON and os.path.getsize(input_path) >= STREAM_MIN_BYTES
+
+    checker = _Checker(load_contract(schema_path))
+    try:
+        if stream:
+            with open(input_path, "rb") as f:
+                _feed_stream(f, checker)
+        else:
+            with open(input_path, "r", encoding="utf-8") as f:
+                _feed_data(json.load(f), checker)
+    except _PARSE_ERRORS as e:
+        return checker.errors + [SchemaError("$", f"invalid JSON: {e}")]
+    return checker.finish()
+
+
+def _raise_errors(errors: List[SchemaError]) -> None:
+    if errors:
+        raise ValueError(f"{len(errors)} schema violation(s):\n" + "\n".join(f"  {e}" for e in errors))
+
+
+def validate_schema(data: dict, schema_path=INDEXED_OUTPUT_SCHEMA) -> None:
+    """Raise ValueError listing every contract violation of `data`."""
+    _raise_errors(schema_errors(data, schema_path))
+
+
+def validate_file(input_path: str, schema_path=INDEXED_OUTPUT_SCHEMA) -> None:
+    """Raise ValueError listing every contract violation of an artifact file."""
     input_path = Path(input_path)
 
     if not input_path.exists():
         raise FileNotFoundError(f"File not found: {input_path}")
 
-    with open(input_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    _raise_errors(file_errors(input_path, schema_path))
+
+
+def _file_errors_task(args: Tuple[str, str]) -> List[SchemaError]:
+    return file_errors(*args)
+
 
-    validate_schema(data)
+def validate_files(
+    paths: Iterable,
+    schema_path=INDEXED_OUTPUT_SCHEMA,
+    workers: Optional[int] = None
+) -> Dict[str, List[SchemaError]]:
+    """
+    Validate many artifacts, in parallel processes when there are several CPUs.
+
+    Args:
+        paths: Artifact JSON files
+        schema_path: JSON Schema contract shared by all of them
+        workers: Worker processes (defaults to the CPU count)
+
+    Returns:
+        {path: errors} in input order; missing files get one error at $
+    """
+    paths = [str(p) for p in paths]
+    existing = [p for p in paths if Path(p).exists()]
+    workers = workers or os.cpu_count() or 1
+
+    if workers > 1 and len(existing) > 1:
+        chunksize = max(1, len(existing) // (workers * 4))
+        with ProcessPoolExecutor(min(workers, len(existing))) as pool:
+            found = pool.map(_file_errors_task, [(p, str(schema_path)) for p in existing], chunksize=chunksize)
+            results = dict(zip(existing, found))
+    else:
+        results = {p: file_errors(p, schema_path) for p in existing}
+
+    return {p: results.get(p, [SchemaError("$", "file not found")]) for p in paths}
 
 
 if __name__ == "__main__":
-    if len(sys.argv) != 2:
-        print("Usage: python pipeline_validation_core.py <indexed_output.json>")
-        sys.exit(1)
+    import argparse
 
-    input_file = sys.argv[1]
-    validate_file(input_file)
+    parser = argparse.ArgumentParser(description="Validate pipeline artifacts against a JSON Schema contract")
+    parser.add_argument("paths", nargs="+", help="Artifact JSON files (e.g. indexed_output.json)")
+    parser.add_argument("--schema", default=str(INDEXED_OUTPUT_SCHEMA),
+                        help="JSON Schema contract (default: contracts/indexed_output_schema.json)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Worker processes for many files (default: CPU count)")
+    args = parser.parse_args()
+
+    results = validate_files(args.paths, args.schema, args.workers)
+    invalid = {path: errors for path, errors in results.items() if errors}
+
+    for path, errors in invalid.items():
+        print(f"[ERROR] {path}: {len(errors)} schema violation(s)")
+        for error in errors:
+            print(f"  {error}")
+
+    if invalid:
+        print(f"[ERROR] {len(invalid)} of {len(results)} artifact(s) failed validation")
+        sys.exit(1)
 
-    print("[ok] Pipeline schema validation passed")
+    print(f"[ok] Pipeline schema validation passed ({len(results)} artifact(s))")
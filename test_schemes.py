@@ -1,18 +1,26 @@
-from aksharamukha import transliterate
+from language_adaptation.romanizer import romanize_schemes, romanize_batch
+from language_adaptation.romanization_engine import ROMANIZATION_SCHEMES
 
 def test_schemes():
-    print("Testing Aksharamukha Schemes...")
+    print("Testing Romanization Schemes...")
     
     text_te = "నమస్కారం"
-    schemes = ['ISO', 'IAST', 'HK', 'ITRANS', 'Velthuis']
+    expected = {
+        "iast": "namaskāraṃ",
+        "itrans": "namaskAraM",
+        "iso": "namaskāraṁ",
+        "ascii": "namaskaram",
+    }
     
     print(f"Original: {text_te}")
-    for scheme in schemes:
-        try:
-            res = transliterate.process("Telugu", scheme, text_te)
-            print(f"{scheme}: {res}")
-        except Exception as e:
-            print(f"{scheme} error: {e}")
+    results = romanize_schemes(text_te, "te")
+    for scheme in ROMANIZATION_SCHEMES:
+        print(f"{scheme}: {results[scheme]}")
+        assert results[scheme] == expected[scheme]
+
+    # Batch API gives the same output per scheme
+    for scheme in ROMANIZATION_SCHEMES:
+        assert romanize_batch([text_te, text_te], "te", scheme) == [expected[scheme]] * 2
 
 if __name__ == "__main__":
     test_schemes()
@@ -0,0 +1,150 @@
+"""
+test_audio_loader.py — Tests for the Decode-Once Waveform Cache
+---------------------------------------------------------------
+Validates content fingerprints, cache hits, misses and per-source
+eviction, memory-mapped loading and the playback file choice.
+"""
+
+import io
+import os
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from audio.audio_processing import audio_loader
+from audio.audio_processing.audio_loader import (
+    audio_fingerprint,
+    buffer_fingerprint,
+    cached_waveform_path,
+    decode_to_cache,
+    load_waveform,
+    playback_source
+)
+
+PCM = (np.sin(np.arange(16000) / 10) * 16000).astype(np.int16)
+
+
+class _FakeFfmpeg:
+    """Stands in for the ffmpeg process: s16le PCM on stdout."""
+
+    calls = 0
+
+    def __init__(self, cmd, stdout=None, stderr=None):
+        type(self).calls += 1
+        self.stdout = io.BytesIO(PCM.tobytes())
+        self.stderr = io.BytesIO(b"")
+
+    def wait(self):
+        return 0
+
+    def poll(self):
+        return 0
+
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(audio_loader, "WAVEFORM_CACHE_DIR", tmp_path / "waveforms")
+    monkeypatch.setattr(audio_loader.subprocess, "Popen", _FakeFfmpeg)
+    _FakeFfmpeg.calls = 0
+    return tmp_path / "waveforms"
+
+
+def test_fingerprint_follows_content(tmp_path):
+    """Test that the key depends only on the bytes, not on path or mtime."""
+    upload = tmp_path / "episode.mp3"
+    upload.write_bytes(b"a" * 4096)
+    first = audio_fingerprint(upload)
+
+    assert audio_fingerprint(str(upload)) == first
+    assert buffer_fingerprint(b"a" * 4096) == first
+
+    # Rewriting the same bytes (a Streamlit rerun) keeps the key
+    upload.write_bytes(b"a" * 4096)
+    os.utime(upload, ns=(0, 10**9))
+    assert audio_fingerprint(upload) == first
+
+    copy = tmp_path / "copy.mp3"
+    copy.write_bytes(upload.read_bytes())
+    assert audio_fingerprint(copy) == first
+
+    # Same size, different content
+    upload.write_bytes(b"b" * 4096)
+    os.utime(upload, ns=(0, 2 * 10**9))
+    assert audio_fingerprint(upload) != first
+
+
+def test_decode_once_then_cache_hit(tmp_path, cache_dir):
+    """Test that the first load decodes and later loads read the cache."""
+    upload = tmp_path / "episode.mp3"
+    upload.write_bytes(b"\x00" * 1024)
+
+    path = decode_to_cache(upload)
+    assert path == cached_waveform_path(upload)
+    assert path.parent == cache_dir
+    assert _FakeFfmpeg.calls == 1
+
+    waveform = load_waveform(upload)
+    assert _FakeFfmpeg.calls == 1
+    assert waveform.dtype == np.float32
+    assert np.allclose(waveform, PCM / 32768.0)
+    assert not list(cache_dir.glob("*.tmp"))
+
+    # New content under the same name is a cache miss and evicts the old waveform
+    upload.write_bytes(b"\x01" * 1024)
+    os.utime(upload, ns=(0, 10**9))
+    new_path = decode_to_cache(upload)
+    assert _FakeFfmpeg.calls == 2
+    assert new_path != path and not path.exists()
+    assert [p.name for p in cache_dir.glob("*.wav")] == [new_path.name]
+
+
+def test_shared_waveform_survives_eviction(tmp_path, cache_dir):
+    """Test that a waveform still used by another upload is not evicted."""
+    first = tmp_path / "episode.mp3"
+    second = tmp_path / "episode_copy.mp3"
+    first.write_bytes(b"\x00" * 1024)
+    second.write_bytes(b"\x00" * 1024)
+
+    shared = decode_to_cache(first)
+    assert decode_to_cache(second) == shared
+    assert _FakeFfmpeg.calls == 1
+
+    first.write_bytes(b"\x01" * 1024)
+    os.utime(first, ns=(0, 10**9))
+    decode_to_cache(first)
+    assert shared.exists()
+
+
+def test_memory_mapped_load_is_copy_on_write(tmp_path, cache_dir):
+    """Test that writing into a mapped waveform leaves the cache file intact."""
+    upload = tmp_path / "episode.mp3"
+    upload.write_bytes(b"\x00" * 1024)
+
+    mapped = load_waveform(upload, mmap=True)
+    assert isinstance(mapped, np.memmap)
+    mapped[:100] = 0.0
+
+    assert np.allclose(load_waveform(upload, mmap=False)[:100], PCM[:100] / 32768.0)
+
+
+def test_playback_source(tmp_path, cache_dir):
+    """Test that the smaller of upload and decoded waveform is streamed."""
+    compressed = tmp_path / "episode.mp3"
+    compressed.write_bytes(b"\x00" * 1024)
+    assert playback_source(compressed) == (compressed, "audio/mp3")
+
+    decode_to_cache(compressed)
+    # Decoded float32 WAV is larger than the compressed upload
+    assert playback_source(compressed) == (compressed, "audio/mp3")
+
+    recording = tmp_path / "recording.wav"
+    recording.write_bytes(b"\x00" * 200000)
+    assert playback_source(recording) == (recording, "audio/wav")
+
+    decode_to_cache(recording)
+    assert playback_source(recording) == (cached_waveform_path(recording), "audio/wav")
@@ -0,0 +1,56 @@
+"""
+test_audio_preprocess.py — Tests for Streaming Audio Preprocessing
+------------------------------------------------------------------
+Validates block-wise denoising, resampling, normalization and trimming.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import soundfile as sf
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from audio.audio_processing import preprocess
+from audio.audio_processing.preprocess import StreamingNoiseReducer
+
+
+def test_overlap_add_reconstructs_signal():
+    """Test that blocks pass through unchanged when nothing is subtracted."""
+    reducer = StreamingNoiseReducer()
+    reducer._update_profile = lambda magnitude: np.zeros((magnitude.shape[0], 1), dtype=np.float32)
+
+    signal = np.random.default_rng(0).standard_normal(50000).astype(np.float32)
+    blocks = [reducer.process(signal[i:i + 6000]) for i in range(0, len(signal), 6000)]
+    output = np.concatenate(blocks + [reducer.flush()])
+
+    assert len(output) == len(signal)
+    assert np.allclose(output, signal, atol=1e-4)
+
+
+def test_preprocess_audio_streams_file(tmp_path, monkeypatch):
+    """Test that a file is resampled, normalized and trimmed in small blocks."""
+    raw_dir = tmp_path / "raw"
+    out_dir = tmp_path / "processed"
+    raw_dir.mkdir()
+    out_dir.mkdir()
+    monkeypatch.setattr(preprocess, "RAW_AUDIO_DIR", str(raw_dir))
+    monkeypatch.setattr(preprocess, "PROCESSED_AUDIO_DIR", str(out_dir))
+
+    sr = 22050
+    t = np.arange(sr * 4) / sr
+    tone = 0.3 * np.sin(2 * np.pi * 440 * t) * (t % 1 < 0.5)
+    silence = np.zeros(sr)
+    sf.write(raw_dir / "episode.wav", np.concatenate([silence, tone, silence]), sr)
+
+    output_path = preprocess.preprocess_audio("episode.wav", block_seconds=1)
+    audio, out_sr = sf.read(output_path)
+
+    assert out_sr == preprocess.TARGET_SAMPLE_RATE
+    assert np.isclose(np.abs(audio).max(), 1.0, atol=1e-3)
+    # Leading and trailing silence is trimmed away
+    assert len(audio) < 5.5 * out_sr
+    assert list(out_dir.iterdir()) == [out_dir / "episode.wav"]
+
@@ -0,0 +1,87 @@
+"""
+test_code_switch.py — Tests for Code-Switched Language Runs
+-----------------------------------------------------------
+Validates that consecutive same-language regions merge into one run and
+that short, low-confidence regions are absorbed into the dominant
+language instead of splitting a run. torch and whisper are replaced by
+empty stand-in modules; run building does not touch either.
+"""
+
+import importlib
+import sys
+import types
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+SECOND = 16000
+
+
+@pytest.fixture
+def code_switch(monkeypatch):
+    monkeypatch.setitem(sys.modules, "torch", types.ModuleType("torch"))
+    monkeypatch.setitem(sys.modules, "whisper", types.ModuleType("whisper"))
+    sys.modules.pop("audio.asr.code_switch", None)
+    yield importlib.import_module("audio.asr.code_switch")
+    sys.modules.pop("audio.asr.code_switch", None)
+
+
+def _regions(*seconds):
+    """Back-to-back regions with the given lengths in seconds."""
+    regions, start = [], 0
+    for length in seconds:
+        regions.append((start, start + int(length * SECOND)))
+        start += int(length * SECOND)
+    return regions
+
+
+def test_consecutive_regions_merge(code_switch):
+    """Test that neighbouring regions of one language form a single run."""
+    regions = _regions(5, 4, 6, 3, 2)
+    languages = [("hi", 0.9), ("hi", 0.8), ("en", 0.95), ("en", 0.7), ("hi", 0.9)]
+
+    runs, dominant = code_switch.build_language_runs(regions, languages)
+
+    assert dominant == "hi"
+    assert [(r["language"], r["start"], r["end"]) for r in runs] == [
+        ("hi", regions[0][0], regions[1][1]),
+        ("en", regions[2][0], regions[3][1]),
+        ("hi", regions[4][0], regions[4][1]),
+    ]
+
+
+def test_low_confidence_region_is_absorbed(code_switch):
+    """Test that a noisy region inside a run does not split it."""
+    regions = _regions(10, 1, 10, 8)
+    languages = [("hi", 0.9), ("ta", 0.3), ("hi", 0.85), ("en", 0.9)]
+
+    runs, dominant = code_switch.build_language_runs(regions, languages)
+
+    assert dominant == "hi"
+    assert [r["language"] for r in runs] == ["hi", "en"]
+    assert (runs[0]["start"], runs[0]["end"]) == (regions[0][0], regions[2][1])
+
+
+def test_dominant_language_weighted_by_duration(code_switch):
+    """Test that the dominant language is the one with most confident speech."""
+    regions = _regions(2, 2, 2, 20)
+    languages = [("hi", 0.9), ("hi", 0.9), ("hi", 0.9), ("en", 0.6)]
+
+    runs, dominant = code_switch.build_language_runs(regions, languages)
+
+    assert dominant == "en"
+    assert [r["language"] for r in runs] == ["hi", "en"]
+
+
+def test_all_low_confidence_falls_back_to_first(code_switch):
+    """Test that without confident regions everything joins the first region's language."""
+    regions = _regions(3, 3, 3)
+    languages = [("te", 0.4), ("hi", 0.2), ("en", 0.1)]
+
+    runs, dominant = code_switch.build_language_runs(regions, languages)
+
+    assert dominant == "te"
+    assert runs == [{"language": "te", "start": regions[0][0], "end": regions[-1][1]}]
@@ -0,0 +1,162 @@
+"""
+test_columnar_artifact.py — Tests for the Columnar Episode Artifact
+-------------------------------------------------------------------
+Validates that a segmented episode round-trips through the Arrow tables
+unchanged, including irregular per-row fields and the segments and
+embeddings tables, that indexing reads the artifact and that lazy
+romanization updates it and re-exports the JSON.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from language_adaptation.lazy_romanization import romanize_artifact
+from pipeline.columnar_artifact import (
+    artifact_path,
+    export_json,
+    load_segmented_artifact,
+    load_segments,
+    read_embeddings,
+    transcription_output,
+    write_segmented_artifact
+)
+from topic_intelligence.indexing.indexing_core import build_index
+from topic_intelligence.topic_segmentation.segmented_output import materialize
+
+
+def _episode():
+    topics = []
+    for tid in range(3):
+        sentences = [
+            {
+                "text": f"Sentence {tid}.{i} about topic {tid}.",
+                "translation": f"Sentence {tid}.{i} about topic {tid}.",
+                "source_text": f"Satz {tid}.{i}",
+                "language": "de",
+                "start": float(tid * 10 + i),
+                "end": float(tid * 10 + i + 1),
+            }
+            for i in range(4)
+        ]
+        sentences[0]["romanized"] = {"iast": "satz", "ascii": "satz"}
+        sentences[1]["translation_state"] = "done"
+        sentences[2]["start"] = 21  # int, kept as written
+        topics.append({
+            "topic_id": tid,
+            "segment_id": f"seg_{tid + 1:03d}",
+            "start": float(tid * 10),
+            "end": float(tid * 10 + 4),
+            "topic_title": f"Topic {tid}",
+            "summary": "A summary.",
+            "keywords": ["alpha", "beta"],
+            "text": " ".join(s["text"] for s in sentences),
+            "sentences": sentences,
+            "sentiment": "NEUTRAL",
+            "sentiment_score": 0.0,
+            "boundary_confidence": 0.5 if tid < 2 else None,
+        })
+    return {
+        "Project_Title": "LEXARA",
+        "audio_file": "episode.wav",
+        "topics": topics,
+        "Transcription_Output": transcription_output(topics),
+        "3D_Animation_Output": [{"topic_id": 0, "state": "active"}],
+        "sentence_track": {"start": [0.0, 1.0], "sentiment": [0.1, -0.2], "keyword_hits": [1, 0]},
+    }
+
+
+def test_round_trip(tmp_path):
+    """Loading an artifact restores the JSON content exactly"""
+    data = _episode()
+    artifact = write_segmented_artifact(tmp_path / "segmented_output.arrow", data)
+
+    assert load_segmented_artifact(artifact) == data
+
+    exported = export_json(artifact, tmp_path / "export.json")
+    assert materialize(json.loads(exported.read_text(encoding="utf-8"))) == data
+
+
+def test_track_columns_are_arrays(tmp_path):
+    """Track columns come back as numpy arrays"""
+    artifact = write_segmented_artifact(tmp_path / "a.arrow", _episode())
+
+    track = load_segmented_artifact(artifact, track_arrays=True)["sentence_track"]
+    assert isinstance(track["sentiment"], np.ndarray)
+    assert track["keyword_hits"].tolist() == [1, 0]
+
+
+def test_stage_tables_round_trip(tmp_path):
+    """Segments and embeddings are stored; embeddings are a zero-copy view"""
+    segments = [
+        {"segment_id": 0, "start": 0.0, "end": 2.0, "text": "Satz", "translation": "Sentence",
+         "language": "de", "translation_state": "done"},
+        {"segment_id": 1, "start": 2.0, "end": 4.0, "text": "Hello", "translation": "Hello",
+         "language": "en", "romanized": "Hello"},
+    ]
+    embeddings = np.arange(12, dtype=np.float32).reshape(3, 4)
+    sentences = ["first sentence", "second sentence", "third sentence"]
+    artifact = write_segmented_artifact(
+        tmp_path / "a.arrow", _episode(), segments=segments,
+        embeddings=embeddings, embedded_sentences=sentences
+    )
+
+    assert load_segments(artifact) == segments
+    stored = read_embeddings(artifact, sentences)
+    assert np.array_equal(stored, embeddings)
+    assert not stored.flags.owndata
+    assert read_embeddings(artifact, sentences[:2]) is None
+
+
+def test_update_keeps_stage_tables(tmp_path):
+    """Rewriting an episode without segments keeps them; a new run replaces them"""
+    artifact = write_segmented_artifact(
+        tmp_path / "a.arrow", _episode(), segments=[{"segment_id": 0, "text": "Hi"}],
+        embeddings=np.ones((1, 2)), embedded_sentences=["Hi"]
+    )
+
+    write_segmented_artifact(artifact, _episode())
+    assert load_segments(artifact) == [{"segment_id": 0, "text": "Hi"}]
+    assert read_embeddings(artifact) is not None
+
+    write_segmented_artifact(artifact, _episode(), segments=[])
+    assert load_segments(artifact) == []
+    assert read_embeddings(artifact) is None
+
+
+def test_indexing_reads_artifact(tmp_path):
+    """Indexing reads the artifact directly and agrees with its JSON export"""
+    data = _episode()
+    path = tmp_path / "segmented_output.json"
+    artifact = write_segmented_artifact(artifact_path(path), data)
+
+    from_artifact = build_index(artifact, idf_store_path=tmp_path / "idf.bin", update_corpus=False)
+    export_json(artifact, path)
+    from_json = build_index(path, idf_store_path=tmp_path / "idf.bin", update_corpus=False)
+
+    assert from_artifact["search_index"]["sentence"] == [0, 0, 0, 0, 1, 1, 1, 1, 2, 2, 2, 2]
+    assert {k: v for k, v in from_artifact.items() if k != "metadata"} == \
+        {k: v for k, v in from_json.items() if k != "metadata"}
+
+
+def test_romanization_updates_artifact_and_export(tmp_path):
+    """Romanizing writes the artifact and re-exports the JSON from it"""
+    data = _episode()
+    for topic in data["topics"]:
+        for sentence in topic["sentences"]:
+            sentence.pop("romanized", None)
+    path = tmp_path / "segmented_output.json"
+    artifact = write_segmented_artifact(artifact_path(path), data, segments=[{"segment_id": 0, "text": "Satz"}])
+    export_json(artifact, path)
+
+    romanize_artifact(path)
+
+    loaded = load_segmented_artifact(artifact)
+    assert all("romanized" in s for topic in loaded["topics"] for s in topic["sentences"])
+    assert loaded == materialize(json.loads(path.read_text(encoding="utf-8")))
+    assert load_segments(artifact) == [{"segment_id": 0, "text": "Satz"}]
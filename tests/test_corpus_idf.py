@@ -0,0 +1,163 @@
+"""
+test_corpus_idf.py — Tests for the Corpus Document Frequency Store
+------------------------------------------------------------------
+Validates incremental episode counting, the on-disk round trip, that
+corpus IDF reduces to the episode-only fit while the store is empty,
+that concurrent indexers do not lose episodes, that indexing counts the
+cleaned keyword text and that a damaged store file reads as empty.
+"""
+
+import json
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from topic_intelligence.indexing.idf_store import IDFStore, reweight_tfidf
+from topic_intelligence.indexing.indexing_core import build_index
+from topic_intelligence.topic_segmentation.keywords import KeywordEngine, document_terms
+
+TOPICS = [
+    "Neural networks learn weights. Training data matters for training.",
+    "Gradient descent updates weights. Training data matters again.",
+    "Deployment serves models and needs monitoring. Training data drifts.",
+]
+
+
+def test_incremental_counts_and_round_trip(tmp_path):
+    """Episodes add document counts once and survive save/load"""
+    store = IDFStore(tmp_path / "idf.bin")
+    assert store.add_episode("ep1.wav", [["alpha", "beta", "alpha"], ["beta"]])
+    assert store.add_episode("ep2.wav", [["beta", "gamma"]])
+    assert not store.add_episode("ep1.wav", [["alpha"]])
+    store.save()
+
+    loaded = IDFStore.load(tmp_path / "idf.bin")
+    assert loaded.n_documents == 3
+    assert loaded.has_episode("ep2.wav") and not loaded.has_episode("ep3.wav")
+    assert loaded.document_frequency(["alpha", "beta", "gamma", "delta"]).tolist() == [1, 3, 1, 0]
+    assert np.allclose(loaded.idf(["beta"]), np.log(4 / 4) + 1)
+
+
+def test_empty_store_matches_episode_fit(tmp_path):
+    """Without corpus documents the engine scores exactly as before"""
+    plain = KeywordEngine().fit(TOPICS)
+    corpus = KeywordEngine(idf_store=IDFStore(tmp_path / "missing.bin")).fit(TOPICS)
+    assert plain.phrase_scores(TOPICS[1]) == corpus.phrase_scores(TOPICS[1])
+
+
+def test_corpus_downweights_catalogue_terms(tmp_path):
+    """A phrase in every indexed episode loses weight against episode-specific ones"""
+    store = IDFStore(tmp_path / "idf.bin")
+    for k in range(10):
+        store.add_episode(f"ep{k}.wav", document_terms([f"neural networks episode{k}", "unrelated words here"]))
+
+    plain = KeywordEngine().fit(TOPICS).phrase_scores(TOPICS[0])
+    corpus = KeywordEngine(idf_store=store).fit(TOPICS).phrase_scores(TOPICS[0])
+    assert corpus["neural networks"] / corpus["weights"] < plain["neural networks"] / plain["weights"]
+
+
+def test_build_index_updates_store_once(tmp_path):
+    """Indexing an episode counts its topics, re-indexing it does not"""
+    segmented = tmp_path / "segmented_output.json"
+    segmented.write_text(json.dumps({
+        "audio_file": "ep.wav",
+        "topics": [{"topic_id": i, "text": t, "keywords": ["training data"]} for i, t in enumerate(TOPICS)]
+    }))
+    store_path = tmp_path / "idf.bin"
+
+    first = build_index(segmented, idf_store_path=store_path)
+    second = build_index(segmented, idf_store_path=store_path)
+    assert first["metadata"]["corpus_documents"] == second["metadata"]["corpus_documents"] == 3
+    assert second["keyword_idf"]["training data"] == 1.0
+
+
+def test_stored_episode_terms_not_boosted(tmp_path):
+    """Terms of a stored episode that the store missed are not weighted as corpus-rare"""
+    store = IDFStore(tmp_path / "idf.bin")
+    store.add_episode("ep.wav", document_terms(TOPICS[:2]))
+    for k in range(5):
+        store.add_episode(f"other{k}.wav", [[f"filler{k}"]])
+
+    engine = KeywordEngine()
+    matrix = engine.vectorizer.fit_transform(TOPICS)
+    reweight_tfidf(engine.vectorizer, matrix, store, episode_in_store=True)
+    idf = dict(zip(engine.vectorizer.get_feature_names_out(), engine.vectorizer.idf_))
+
+    # "deployment" only occurs in the topic the store never saw
+    assert idf["deployment"] == idf["gradient"]
+    assert idf["training data"] < idf["deployment"]
+
+
+def test_concurrent_indexing_keeps_every_episode(tmp_path):
+    """Episodes indexed at the same time all end up in the store"""
+    store_path = tmp_path / "idf.bin"
+    paths = []
+    for k in range(8):
+        path = tmp_path / f"segmented_{k}.json"
+        path.write_text(json.dumps({
+            "audio_file": f"ep{k}.wav",
+            "topics": [{"topic_id": i, "text": t, "keywords": []} for i, t in enumerate(TOPICS)]
+        }))
+        paths.append(path)
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda p: build_index(p, idf_store_path=store_path), paths))
+
+    store = IDFStore.load(store_path)
+    assert len(store.episodes) == 8
+    assert store.n_documents == 8 * len(TOPICS)
+
+
+def test_empty_or_truncated_file_is_empty_store(tmp_path):
+    """A zero-length or cut-off store file loads as an empty store"""
+    store = IDFStore(tmp_path / "idf.bin")
+    store.add_episode("ep.wav", [["alpha", "beta"]])
+    store.save()
+    raw = (tmp_path / "idf.bin").read_bytes()
+
+    for content in (b"", raw[:10], raw[:-4]):
+        (tmp_path / "idf.bin").write_bytes(content)
+        loaded = IDFStore.load(tmp_path / "idf.bin")
+        assert loaded.n_documents == 0 and len(loaded) == 0
+
+
+def test_same_file_name_different_audio(tmp_path):
+    """Two uploads with one file name but different audio are both counted"""
+    store_path = tmp_path / "idf.bin"
+    for k in range(2):
+        path = tmp_path / f"segmented_{k}.json"
+        path.write_text(json.dumps({
+            "audio_file": "episode.mp3",
+            "audio_fingerprint": f"fingerprint{k}",
+            "topics": [{"topic_id": i, "text": t, "keywords": []} for i, t in enumerate(TOPICS)]
+        }))
+        build_index(path, idf_store_path=store_path)
+
+    store = IDFStore.load(store_path)
+    assert len(store.episodes) == 2
+    assert store.has_episode("fingerprint1") and not store.has_episode("episode.mp3")
+
+
+def test_store_counts_keyword_text(tmp_path):
+    """The store counts a topic's definition sentences, the text its keywords were fitted on"""
+    sentences = [
+        "Gradient descent means stepping along the slope of the loss.",
+        "Backpropagation refers to computing gradients layer by layer.",
+        "My cat enjoys sunshine on weekends.",
+    ]
+    path = tmp_path / "segmented_output.json"
+    path.write_text(json.dumps({
+        "audio_file": "ep.wav",
+        "topics": [{"topic_id": 0, "keywords": [], "text": " ".join(sentences),
+                    "sentences": [{"text": t, "start": 0.0, "end": 1.0} for t in sentences]}]
+    }))
+
+    build_index(path, idf_store_path=tmp_path / "idf.bin")
+
+    store = IDFStore.load(tmp_path / "idf.bin")
+    assert store.document_frequency(["gradient descent", "backpropagation", "sunshine"]).tolist() == [1, 1, 0]
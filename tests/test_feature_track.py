@@ -0,0 +1,55 @@
+"""
+test_feature_track.py — Tests for the Per-Sentence Feature Track
+----------------------------------------------------------------
+Validates sentence timing inside shared segment timestamps, keyword hit
+counts and the columnar layout stored in the artifact.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from topic_intelligence.topic_segmentation.feature_track import (
+    TRACK_COLUMNS,
+    build_sentence_track,
+    keyword_hits,
+    sentence_times,
+    track_arrays
+)
+from topic_intelligence.topic_segmentation.sentiment import score_text
+
+
+def test_sentence_times_split_segment_by_words():
+    """Sentences of one segment divide its span by word count; rate is per segment"""
+    start, end, rate = sentence_times([(0.0, 10.0), (0.0, 10.0), (10.0, 12.0), (12.0, 12.0)], np.array([3, 1, 4, 2]))
+    assert np.allclose(start, [0.0, 7.5, 10.0, 12.0])
+    assert np.allclose(end, [7.5, 10.0, 12.0, 12.0])
+    assert np.allclose(rate, [24.0, 24.0, 120.0, 0.0])
+
+
+def test_keyword_hits_count_phrases():
+    """Unigram and bigram keywords are counted per text"""
+    texts = ["the dual form and the dual form again", "plural verbs", "nothing here"]
+    assert keyword_hits(texts, ["dual form", "Verbs"]).tolist() == [2, 1, 0]
+    assert keyword_hits(texts, []).tolist() == [0, 0, 0]
+
+
+def test_build_sentence_track_columns():
+    """Every column has one entry per sentence; dropped sentences get topic -1"""
+    sentences = [
+        "This is a really good lesson about the dual form.",
+        "Short aside that was dropped.",
+        "The plural is terribly confusing here.",
+    ]
+    track = build_sentence_track(sentences, [(0, 4), (4, 6), (6, 9)], [(0, [0]), (2, [2])], ["dual form", "plural"])
+
+    assert set(track) == set(TRACK_COLUMNS)
+    assert all(len(track[column]) == 3 for column in TRACK_COLUMNS)
+    assert track["topic_id"] == [0, -1, 2]
+    assert track["keyword_hits"] == [1, 0, 1]
+    assert track["sentiment"] == [round(score_text(s), 3) for s in sentences]
+    assert track_arrays(track)["words_per_minute"].dtype == np.float64
@@ -0,0 +1,54 @@
+"""
+test_keyword_engine.py — Tests for the Episode-Level Keyword Engine
+-------------------------------------------------------------------
+Validates that one TF-IDF fit scores every topic and favours topic-specific
+phrases over episode-wide ones.
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from topic_intelligence.topic_segmentation.keywords import (
+    KeywordEngine,
+    extract_keywords,
+    extract_phrases
+)
+
+TOPICS = [
+    "Neural networks learn weights. Neural networks stack layers. Training data matters for training.",
+    "Gradient descent updates weights. Gradient descent follows the loss. Training data matters again.",
+    "Deployment serves models. Deployment needs monitoring and latency budgets. Training data drifts.",
+]
+
+
+def test_single_topic_matches_per_topic_scoring():
+    """With one topic the IDF is constant, so the ranking equals extract_phrases"""
+    engine = KeywordEngine().fit([TOPICS[0]])
+    expected = sorted(extract_phrases(TOPICS[0]).items(), key=lambda x: x[1], reverse=True)
+    got = list(engine.phrase_scores(TOPICS[0]).items())
+    assert [k for k, _ in got] == [k for k, _ in expected][:len(got)]
+
+
+def test_episode_terms_are_downweighted():
+    """Phrases shared by every topic rank below topic-specific ones"""
+    engine = KeywordEngine().fit(TOPICS)
+    for text in TOPICS:
+        ranked = list(engine.phrase_scores(text))
+        assert ranked.index("training data") > 2
+
+    keywords = extract_keywords(TOPICS[1], engine=engine)
+    assert keywords[0] in ("gradient", "descent", "gradient descent")
+    assert "training data" not in keywords[:3]
+
+
+def test_unseen_text_and_empty_fit():
+    """Texts outside the fit are transformed; an empty fit yields no scores"""
+    engine = KeywordEngine().fit(TOPICS)
+    assert "deployment" in engine.phrase_scores("Deployment of neural networks.")
+
+    empty = KeywordEngine().fit(["a an the", "is are"])
+    assert empty.phrase_scores("a an the") == {}
+    assert extract_keywords("is are", engine=empty)
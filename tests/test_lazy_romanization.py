@@ -0,0 +1,71 @@
+"""
+test_lazy_romanization.py — Tests for On-Demand Romanization
+------------------------------------------------------------
+Validates that artifacts are romanized only when asked and persisted.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from language_adaptation.lazy_romanization import ensure_romanized, romanize_artifact
+from pipeline.pipeline_validation_core import validate_schema
+
+
+def _segmented_artifact():
+    return {
+        "audio_file": "episode.mp3",
+        "topics": [{
+            "topic_id": 0,
+            "start": 0.0,
+            "end": 4.0,
+            "summary": "",
+            "keywords": [],
+            "text": "This is a test. Really.",
+            "sentences": [
+                {"text": "This is a test.", "translation": "This is a test.",
+                 "source_text": "यह एक परीक्षण है", "language": "hi", "start": 0.0, "end": 2.0},
+                {"text": "Hello there.", "translation": "Hello there.",
+                 "source_text": "Hello there.", "language": "en", "start": 2.0, "end": 4.0},
+            ]
+        }]
+    }
+
+
+def test_ensure_romanized_fills_missing_only():
+    """Test that only rows without `romanized` are computed."""
+    rows = [
+        {"text": "नमस्ते", "language": "hi"},
+        {"text": "already", "language": "hi", "romanized": "kept"},
+        {"text": "plain", "language": "en"},
+    ]
+
+    assert ensure_romanized(rows) == 2
+    assert rows[0]["romanized"] == "namaste"
+    assert rows[1]["romanized"] == "kept"
+    assert rows[2]["romanized"] == "plain"
+    assert ensure_romanized(rows) == 0
+
+
+def test_romanize_artifact_persists(tmp_path):
+    """Test that romanized text is written back and the artifact stays valid."""
+    path = tmp_path / "segmented_output.json"
+    data = _segmented_artifact()
+    validate_schema(data)  # valid before romanization
+    path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+
+    romanize_artifact(path)
+
+    saved = json.loads(path.read_text(encoding="utf-8"))
+    sentences = saved["topics"][0]["sentences"]
+    assert sentences[0]["romanized"] == "yaha eka parīkṣaṇa hai"
+    assert sentences[1]["romanized"] == "Hello there."
+    validate_schema(saved)
+
+    # Second call finds nothing to do and leaves the file untouched
+    mtime = path.stat().st_mtime_ns
+    romanize_artifact(path)
+    assert path.stat().st_mtime_ns == mtime
@@ -0,0 +1,90 @@
+"""
+test_lexicon_trie.py — Tests for Longest-Match Lexicon Transliteration
+----------------------------------------------------------------------
+Validates trie matching, word boundaries and the lexicon-backed
+Arabic/Chinese romanizers.
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pytest
+from unidecode import unidecode
+
+from language_adaptation.lexicon_trie import LexiconTrie, get_lexicon, load_lexicon
+from language_adaptation.romanized_adapter import romanize_arabic, romanize_chinese
+from language_adaptation.romanizer import romanize_text
+
+
+def test_longest_match_wins():
+    """Test that the longest entry matching at a position is used."""
+    trie = LexiconTrie({"点": "dian", "有点": "you dian", "有": "you"})
+
+    assert trie.transliterate("有点快") == "you dian快"
+    assert trie.transliterate("有 点") == "you dian"
+    assert trie.transliterate("") == ""
+    assert len(trie) == 3
+
+
+def test_partial_prefix_falls_back():
+    """Test that an unfinished longer path falls back to a shorter match."""
+    trie = LexiconTrie({"ab": "X", "abcd": "Y"})
+
+    assert trie.transliterate("abcx") == "Xcx"
+    assert trie.transliterate("abcd") == "Y"
+    assert trie.transliterate("zzz") == "zzz"
+
+
+def test_load_tsv_lexicon(tmp_path):
+    """Test loading and overriding entries from a TSV file."""
+    path = tmp_path / "extra.tsv"
+    path.write_text("# comment\n你好\tni hao\n\n世界\tshijie\n你好\tnihao\n", encoding="utf-8")
+
+    trie = LexiconTrie().load(path)
+
+    assert len(trie) == 2
+    assert trie.transliterate("你好，世界") == "nihao，shijie"
+
+
+def test_whole_words_only():
+    """Test that whole-word matching leaves entries inside longer words alone."""
+    trie = LexiconTrie({"لي": "li", "في": "fi"})
+
+    assert trie.transliterate("قليل لي", whole_words=True) == "قليل li"
+    assert trie.transliterate("في، لي.", whole_words=True) == "fi، li."
+    assert trie.transliterate("قليل", whole_words=False) == "قliل"
+
+
+def test_separator_keeps_entries_apart():
+    """Test that adjacent replacements and letters are separated once."""
+    trie = LexiconTrie({"这个": "zhe ge", "概念": "gainian"})
+
+    assert trie.transliterate("这个概念", separator=" ") == "zhe ge gainian"
+    assert trie.transliterate("这个 概念。", separator=" ") == "zhe ge gainian。"
+    assert trie.transliterate("我这个", separator=" ") == "我 zhe ge"
+
+
+def test_bundled_lexicons():
+    """Test the Arabic and Chinese romanizers built on bundled lexicons."""
+    assert len(get_lexicon("ar")) > 0 and len(get_lexicon("zh")) > 0
+    assert romanize_arabic("هذا المفهوم غير واضح") == "hatha al-mafhoom ghayr waadih"
+    assert romanize_chinese("这个概念对我来说并不清楚") == "zhe ge gainian dui wo lai shuo bing bu qingchu"
+
+
+def test_engine_matches_unidecode_outside_lexicon_words():
+    """Test that Arabic words merely containing an entry romanize as before."""
+    for text in ["السلام عليكم", "قليل"]:
+        assert romanize_text(text, "ar") == unidecode(text)
+    assert romanize_text("这个概念，我", "zh") == "zhe ge gainian,Wo"
+
+
+def test_load_lexicon_rejects_unused_language(tmp_path):
+    """Test that lexicons are only accepted for languages that use them."""
+    path = tmp_path / "ru.tsv"
+    path.write_text("привет\tprivet\n", encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        load_lexicon("ru", path)
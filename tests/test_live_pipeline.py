@@ -0,0 +1,232 @@
+"""
+test_live_pipeline.py — Tests for Live Mode
+-------------------------------------------
+Runs run_live end to end on a recorded stream with the transcriber and
+ffmpeg replaced by stand-ins, and validates that segments are appended
+incrementally without gaps or repeats, that the online segmenter is fed
+every window, that each snapshot on disk is complete and that ffmpeg
+errors are reported.
+"""
+
+import importlib
+import io
+import json
+import sys
+import types
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from topic_intelligence.topic_segmentation.online_segmentation import OnlineTopicSegmenter
+
+SAMPLE_RATE = 16000
+BLOCK_SECONDS = 4
+
+SENTENCES = [
+    "Machine learning is a method where computers learn patterns from data.",
+    "It refers to algorithms that improve automatically through experience.",
+    "This means the system gets better the more examples it is shown.",
+    "Now let's talk about neural networks and how they are structured today.",
+    "A neural network is defined as layers of connected artificial neurons.",
+    "Each layer transforms the signal before passing it to the next one.",
+    "Next, we should discuss the training process for these large models.",
+    "Training is the process of adjusting weights to reduce the error rate.",
+    "We repeat this process many thousands of times over the whole dataset.",
+    "Finally, let's talk about deploying these models into production systems.",
+    "Deployment means making the trained model available to real users.",
+]
+
+
+def _stream_pcm():
+    """One 4-second block per sentence; block k has constant level (k + 1) / 100."""
+    blocks = [np.full(BLOCK_SECONDS * SAMPLE_RATE, (k + 1) / 100) for k in range(len(SENTENCES))]
+    return (np.concatenate(blocks) * 32768).astype(np.int16)
+
+
+class _FakeModel:
+    """Transcribes each 4-second block of a window as the sentence its level encodes."""
+
+    def __init__(self):
+        self.prompts = []
+
+    def transcribe(self, audio, language=None, initial_prompt=None, **kwargs):
+        self.prompts.append(initial_prompt)
+        block = BLOCK_SECONDS * SAMPLE_RATE
+        segments = []
+        for start in range(0, len(audio), block):
+            chunk = audio[start:start + block]
+            index = int(round(float(np.median(chunk)) * 100)) - 1
+            segments.append({
+                "start": start / SAMPLE_RATE,
+                "end": (start + len(chunk)) / SAMPLE_RATE,
+                "text": " " + SENTENCES[index]
+            })
+        return {"language": "en", "segments": segments}
+
+
+class _FakeFfmpeg:
+    returncode = 0
+    error = b""
+
+    def __init__(self, cmd, stdin=None, stdout=None, stderr=None):
+        self.stdin = io.BytesIO()
+        self.stdout = io.BytesIO(_stream_pcm().tobytes())
+        self.stderr = io.BytesIO(self.error)
+
+    def poll(self):
+        return self.returncode
+
+    def wait(self):
+        return self.returncode
+
+
+class _FailingFfmpeg(_FakeFfmpeg):
+    returncode = 1
+    error = b"pipe:0: Invalid data found when processing input\n"
+
+
+class _RecordingSegmenter(OnlineTopicSegmenter):
+    def __init__(self):
+        super().__init__(topic_builder=_record_builder)
+        self.updates = []
+
+    def add_segments(self, segments):
+        segments = list(segments)
+        self.updates.append(len(segments))
+        return super().add_segments(segments)
+
+
+def _record_builder(topic_id, ids, sentences, timestamps, original_segments):
+    return {
+        "topic_id": topic_id,
+        "segment_id": f"seg_{topic_id + 1:03d}",
+        "sentences": [sentences[i] for i in ids],
+        "start": timestamps[ids[0]][0],
+        "end": timestamps[ids[-1]][1]
+    }
+
+
+@pytest.fixture
+def live(tmp_path, monkeypatch):
+    model = _FakeModel()
+    whisper = types.ModuleType("whisper")
+    whisper.load_model = lambda name: model
+    monkeypatch.setitem(sys.modules, "whisper", whisper)
+
+    sys.modules.pop("pipeline.live_pipeline", None)
+    module = importlib.import_module("pipeline.live_pipeline")
+    monkeypatch.setattr(module, "LIVE_OUTPUT", tmp_path / "outputs" / "live_output.json")
+    monkeypatch.setattr(module.subprocess, "Popen", _FakeFfmpeg)
+
+    segmenters = []
+
+    def segmenter():
+        segmenters.append(_RecordingSegmenter())
+        return segmenters[-1]
+
+    monkeypatch.setattr(module, "OnlineTopicSegmenter", segmenter)
+
+    # Every snapshot is read back from disk as the UI would
+    snapshots = []
+    write_snapshot = module._write_snapshot
+
+    def recording_write(snapshot):
+        write_snapshot(snapshot)
+        snapshots.append(json.loads(module.LIVE_OUTPUT.read_text(encoding="utf-8")))
+
+    monkeypatch.setattr(module, "_write_snapshot", recording_write)
+
+    yield types.SimpleNamespace(module=module, model=model, segmenters=segmenters, snapshots=snapshots)
+    sys.modules.pop("pipeline.live_pipeline", None)
+
+
+def test_run_live_appends_segments_incrementally(live, tmp_path):
+    """Test that windows add new segments in order, once each, with stream timestamps."""
+    stream = tmp_path / "stream.wav"
+    stream.write_bytes(b"\x00" * 1024)
+
+    result = live.module.run_live(str(stream), "en", idle_timeout=0.1)
+
+    segments = result["segments"]
+    assert [s["text"] for s in segments] == SENTENCES
+    assert [s["segment_id"] for s in segments] == list(range(len(SENTENCES)))
+    assert [s["start"] for s in segments] == [float(k * BLOCK_SECONDS) for k in range(len(SENTENCES))]
+    assert all(s["language"] == "en" and s["translation"] == s["text"] for s in segments)
+
+    # Several windows, each prompted with the text committed before it
+    assert len(live.model.prompts) > 2
+    assert live.model.prompts[0] is None
+    assert SENTENCES[0] in live.model.prompts[1]
+
+
+def test_online_segmenter_fed_every_window(live, tmp_path):
+    """Test that the online segmenter receives each window's new segments."""
+    stream = tmp_path / "stream.wav"
+    stream.write_bytes(b"\x00" * 1024)
+
+    result = live.module.run_live(str(stream), "en", idle_timeout=0.1)
+
+    updates = live.segmenters[0].updates
+    assert len(updates) > 1
+    assert sum(updates) == len(result["segments"])
+    assert result["topics"]
+    assert [t["topic_id"] for t in result["topics"]] == sorted(t["topic_id"] for t in result["topics"])
+    covered = [s for t in result["topics"] for s in t["sentences"]]
+    assert covered == [s for s in SENTENCES if s in covered]
+
+
+def test_snapshots_are_atomic_and_growing(live, tmp_path):
+    """Test that every snapshot on disk is complete JSON and segments only grow."""
+    stream = tmp_path / "stream.wav"
+    stream.write_bytes(b"\x00" * 1024)
+
+    result = live.module.run_live(str(stream), "en", idle_timeout=0.1)
+
+    counts = [len(s["segments"]) for s in live.snapshots]
+    assert counts == sorted(counts) and counts[0] == 0
+    assert [s["status"] for s in live.snapshots] == ["live"] * (len(counts) - 1) + ["finished"]
+    assert live.snapshots[-1]["segments"] == result["segments"]
+
+    output_dir = live.module.LIVE_OUTPUT.parent
+    assert [p.name for p in output_dir.iterdir()] == ["live_output.json"]
+
+
+def test_snapshots_reuse_encoded_topics(live, tmp_path, monkeypatch):
+    """Test that animation states are only regenerated when a topic was finalized."""
+    stream = tmp_path / "stream.wav"
+    stream.write_bytes(b"\x00" * 1024)
+    generated = []
+    generate = live.module.generate_animation_states
+
+    def recording_generate(topics):
+        generated.append(len(topics))
+        return generate(topics)
+
+    monkeypatch.setattr(live.module, "generate_animation_states", recording_generate)
+
+    result = live.module.run_live(str(stream), "en", idle_timeout=0.1)
+
+    topic_counts = [len(s["topics"]) for s in live.snapshots]
+    assert generated == sorted(set(topic_counts) - {0})
+    assert len(generated) < len(live.snapshots)
+    assert live.snapshots[-1]["3D_Animation_Output"] == generate(result["topics"])
+    assert live.snapshots[-1]["topics"] == result["topics"]
+
+
+def test_ffmpeg_failure_is_reported(live, tmp_path, monkeypatch):
+    """Test that a non-zero ffmpeg exit raises and leaves a failed snapshot with its stderr."""
+    stream = tmp_path / "stream.wav"
+    stream.write_bytes(b"\x00" * 1024)
+    monkeypatch.setattr(live.module.subprocess, "Popen", _FailingFfmpeg)
+
+    with pytest.raises(RuntimeError, match="Invalid data"):
+        live.module.run_live(str(stream), "en", idle_timeout=0.1)
+
+    final = live.snapshots[-1]
+    assert final["status"] == "failed"
+    assert "Invalid data" in final["error"]
+    assert [s["text"] for s in final["segments"]] == SENTENCES
@@ -0,0 +1,91 @@
+"""
+test_online_segmentation.py — Tests for Incremental Topic Segmentation
+----------------------------------------------------------------------
+Validates that the online segmenter matches the batch grouping rules.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from topic_intelligence.topic_segmentation import registry
+from topic_intelligence.topic_segmentation import topic_segmentation_core as core
+from topic_intelligence.topic_segmentation.online_segmentation import OnlineTopicSegmenter
+
+
+SENTENCES = [
+    "Machine learning is a method where computers learn patterns from data.",
+    "It refers to algorithms that improve automatically through experience.",
+    "This means the system gets better the more examples it is shown.",
+    "Now let's talk about neural networks and how they are structured today.",
+    "A neural network is defined as layers of connected artificial neurons.",
+    "Each layer transforms the signal before passing it to the next one.",
+    "Next, we should discuss the training process for these large models.",
+    "Training is the process of adjusting weights to reduce the error rate.",
+    "We repeat this process many thousands of times over the whole dataset.",
+    "Finally, let's talk about deploying these models into production systems.",
+    "Deployment means making the trained model available to real users.",
+]
+
+
+def _segments(n_repeats=3):
+    segments = []
+    t = 0.0
+    for _ in range(n_repeats):
+        for sentence in SENTENCES:
+            segments.append({"start": t, "end": t + 4.0, "text": sentence, "translation": sentence})
+            t += 4.0
+    return segments
+
+
+def _record_builder(topic_id, ids, sentences, timestamps, original_segments):
+    return {
+        "topic_id": topic_id,
+        "sentences": [sentences[i] for i in ids],
+        "start": timestamps[ids[0]][0],
+        "end": timestamps[ids[-1]][1]
+    }
+
+
+class _ZeroEmbedder:
+    def encode(self, texts):
+        return np.zeros((len(texts), 4))
+
+
+def test_online_matches_batch(monkeypatch):
+    """Test that streaming segments yields the batch topics and ids."""
+    monkeypatch.setattr(registry, "get_embedder", lambda: _ZeroEmbedder())
+    segments = _segments()
+
+    topic_ids, sentences, timestamps = core.segment_topics(segments)
+    expected = [
+        _record_builder(i, ids, sentences, timestamps, segments)
+        for i, ids in enumerate(topic_ids)
+        if len(ids) >= 3
+    ]
+
+    segmenter = OnlineTopicSegmenter(topic_builder=_record_builder)
+    streamed = []
+    for seg in segments:
+        streamed.extend(segmenter.add_segment(seg))
+    streamed.extend(segmenter.flush())
+
+    assert streamed == expected
+    assert len(expected) > 1
+
+
+def test_topics_emitted_before_end_with_bounded_state():
+    """Test that topics are finalized mid-stream and the open group stays small."""
+    segmenter = OnlineTopicSegmenter(topic_builder=_record_builder)
+    emitted_before_flush = 0
+
+    for seg in _segments(n_repeats=20):
+        emitted_before_flush += len(segmenter.add_segment(seg))
+        assert len(segmenter.open_group()["sentences"]) <= core.MAX_SENTENCES_PER_TOPIC
+        assert len(segmenter._sources) <= 2 * core.MAX_SENTENCES_PER_TOPIC
+
+    assert emitted_before_flush > 10
@@ -0,0 +1,79 @@
+"""
+test_optimal_partition.py — Tests for Optimal-Partition Segmentation
+--------------------------------------------------------------------
+Validates the prefix-sum DP against planted boundaries and brute force.
+"""
+
+import itertools
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from topic_intelligence.topic_segmentation.algorithms.segment_optimal_partition import (
+    optimal_boundaries,
+    segment,
+    _normalize
+)
+
+
+def _clustered(sizes, dim=16, noise=0.1, seed=0):
+    rng = np.random.default_rng(seed)
+    blocks = [rng.normal(size=dim) + noise * rng.normal(size=(size, dim)) for size in sizes]
+    return np.vstack(blocks)
+
+
+def _cost(x, boundaries, penalty):
+    total = 0.0
+    for start, end in zip([0] + boundaries, boundaries + [len(x)]):
+        block = x[start:end]
+        total += ((block - block.mean(axis=0)) ** 2).sum() + penalty
+    return total
+
+
+def test_recovers_planted_boundaries():
+    """Well separated clusters are cut exactly at their edges"""
+    sizes = [12, 7, 20, 9, 15]
+    embeddings = _clustered(sizes)
+    assert optimal_boundaries(embeddings) == list(np.cumsum(sizes)[:-1])
+
+
+def test_matches_brute_force():
+    """The DP finds the minimum-cost partition"""
+    embeddings = _clustered([4, 5, 3], noise=0.8, seed=3)
+    x = _normalize(embeddings)
+    n, penalty, min_size, max_size = len(x), 0.5, 2, 6
+
+    best = None
+    for k in range(n):
+        for cuts in itertools.combinations(range(1, n), k):
+            edges = [0, *cuts, n]
+            if all(min_size <= b - a <= max_size for a, b in zip(edges, edges[1:])):
+                cost = _cost(x, list(cuts), penalty)
+                if best is None or cost < best[0] - 1e-9:
+                    best = (cost, list(cuts))
+
+    found = optimal_boundaries(embeddings, penalty, min_size, max_size)
+    assert abs(_cost(x, found, penalty) - best[0]) < 1e-9
+
+
+def test_topic_sizes_respected():
+    """Every topic stays within min/max size even for one long topic"""
+    embeddings = _clustered([50])
+    boundaries = optimal_boundaries(embeddings, min_size=3, max_size=10)
+    edges = [0] + boundaries + [50]
+    assert all(3 <= b - a <= 10 for a, b in zip(edges, edges[1:]))
+
+
+def test_segment_output_format():
+    """segment() returns consecutive topics covering every input segment"""
+    sizes = [6, 8]
+    items = [{"text": f"s{i}"} for i in range(sum(sizes))]
+    topics = segment(items, embeddings=_clustered(sizes))
+    assert [t["topic_id"] for t in topics] == [0, 1]
+    assert [s for t in topics for s in t["segments"]] == items
+    assert segment([]) == []
+    assert len(segment(items[:4], embeddings=_clustered([4]))) == 1
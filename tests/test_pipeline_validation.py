@@ -0,0 +1,133 @@
+"""
+test_pipeline_validation.py — Tests for Contract-Based Artifact Validation
+--------------------------------------------------------------------------
+Validates that artifacts are checked against the JSON Schema contracts,
+that every violation is reported with its path, that the streaming and
+in-memory readers agree, and that many files validate in one call.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import pipeline.pipeline_validation_core as validation
+from pipeline.pipeline_validation_core import (
+    PIPELINE_SCHEMA,
+    file_errors,
+    schema_errors,
+    validate_file,
+    validate_files,
+    validate_schema
+)
+
+
+def _indexed_v3():
+    return {
+        "audio_file": "episode.wav",
+        "schema_version": 3,
+        "segments": [{"text": "यह एक परीक्षण है", "language": "hi", "translation": "A test. Two parts."}],
+        "sentences": [
+            {"segment": 0, "start": 0.0, "end": 2.0, "text": "A test."},
+            {"segment": 0, "start": 0.0, "end": 2.0, "text": "Two parts."},
+            {"text": "Unmatched.", "start": 2.0, "end": 3.0},
+        ],
+        "topics": [{"topic_id": 0, "start": 0.0, "end": 3.0, "summary": "", "keywords": [], "sentence_ids": [0, 1, 2]}],
+        "search_index": {"test": [0], "parts": [0]},
+        "keyword_idf": {},
+        "metadata": {"total_topics": 1}
+    }
+
+
+def _broken():
+    data = _indexed_v3()
+    data["sentences"][1]["segment"] = 4
+    data["sentences"][2]["start"] = "2.0"
+    data["topics"][0]["sentence_ids"].append(9)
+    data["topics"].append({"topic_id": 1, "start": 3.0, "end": 4.0, "summary": "", "keywords": [],
+                           "text": "Inline topic.", "sentences": [{"text": "Inline topic.", "start": 3.0, "end": 4.0}]})
+    data["search_index"]["test"] = ["0"]
+    del data["segments"]
+    return data
+
+
+EXPECTED_PATHS = {
+    "$",                           # v3 without segments
+    "$.sentences[0].segment",      # ... so segments[0] does not exist either
+    "$.sentences[1].segment",
+    "$.sentences[2].start",
+    "$.topics[0].sentence_ids[3]",
+    "$.topics[1].sentences[0]",    # translation and language missing
+    "$.search_index.test[0]",
+}
+
+
+def test_valid_artifacts_pass(tmp_path):
+    """v2 and v3 artifacts and a pipeline output satisfy their contracts"""
+    validate_schema(_indexed_v3())
+    validate_schema({"audio_file": "a.wav", "topics": [{
+        "topic_id": 0, "start": 0, "end": 1, "summary": "", "keywords": [], "text": "Hi.",
+        "sentences": [{"text": "Hi.", "translation": "Hi.", "language": "en", "start": 0, "end": 1}]
+    }]})
+
+    pipeline_output = tmp_path / "pipeline_output.json"
+    pipeline_output.write_text(json.dumps({"audio_file": "a.wav", "language_detected": "en", "segments": [
+        {"segment_id": 0, "start": 0.0, "end": 1.5, "language": "en", "text": "Hi.", "translation": "Hi."}
+    ]}))
+    validate_file(pipeline_output, schema_path=PIPELINE_SCHEMA)
+
+
+def test_all_errors_reported_with_paths():
+    """Every violation is listed, not just the first"""
+    errors = schema_errors(_broken())
+    assert {e.path for e in errors} == EXPECTED_PATHS
+    assert any("segments[4] does not exist" in e.message for e in errors)
+
+    with pytest.raises(ValueError, match=r"\$\.topics\[0\]\.sentence_ids\[3\]"):
+        validate_schema(_broken())
+
+
+def test_compiled_fast_path_agrees(monkeypatch):
+    """Without fastjsonschema the plain jsonschema validators give the same result"""
+    compiled = schema_errors(_broken())
+    monkeypatch.setattr(validation, "USE_FASTJSONSCHEMA", False)
+    validation.load_contract.cache_clear()
+    try:
+        assert schema_errors(_broken()) == compiled
+        assert schema_errors(_indexed_v3()) == []
+    finally:
+        validation.load_contract.cache_clear()
+
+
+def test_stream_matches_in_memory(tmp_path):
+    """The ijson reader reports the same errors as the json reader"""
+    pytest.importorskip("ijson")
+    path = tmp_path / "indexed_output.json"
+    for data in (_indexed_v3(), _broken(), [1, 2]):
+        path.write_text(json.dumps(data, ensure_ascii=False), encoding="utf-8")
+        assert sorted(file_errors(path, stream=True)) == sorted(schema_errors(data))
+
+    path.write_text('{"audio_file": "a.wav", "topics": [', encoding="utf-8")
+    assert file_errors(path, stream=True)[-1].message.startswith("invalid JSON")
+    assert file_errors(path, stream=False)[-1].message.startswith("invalid JSON")
+
+
+def test_validate_files_in_parallel(tmp_path, monkeypatch):
+    """Many artifacts are validated in one call, serially or across processes"""
+    paths = []
+    for i in range(6):
+        path = tmp_path / f"indexed_{i}.json"
+        path.write_text(json.dumps(_broken() if i % 3 == 0 else _indexed_v3(), ensure_ascii=False), encoding="utf-8")
+        paths.append(path)
+    paths.append(tmp_path / "missing.json")
+
+    results = validate_files(paths, workers=2)
+    assert list(results) == [str(p) for p in paths]
+    assert [bool(errors) for errors in results.values()] == [True, False, False, True, False, False, True]
+
+    monkeypatch.setattr(validation, "STREAM_MIN_BYTES", 0)
+    assert validate_files(paths, workers=1) == results
@@ -0,0 +1,84 @@
+"""
+test_romanization_engine.py — Tests for the Romanization Engine
+---------------------------------------------------------------
+Validates batching, memoization and the LRU bound of RomanizationEngine.
+"""
+
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from language_adaptation.romanization_engine import RomanizationEngine
+
+
+SEGMENTS = [
+    "यह अवधारणा मुझे समझ में नहीं आ रही है",
+    "पॉडकास्ट में समझाने की गति बहुत तेज़ है\nइसलिए कुछ बातें छूट जाती हैं",
+    "   ",
+    "plain english inside a hindi episode",
+    "यह अवधारणा मुझे समझ में नहीं आ रही है",
+]
+
+
+def test_batch_matches_single_calls():
+    """Test that one batch pass gives the same output as per-text calls."""
+    batch = RomanizationEngine().romanize_batch(SEGMENTS, "hi")
+    single = [RomanizationEngine().romanize(text, "hi") for text in SEGMENTS]
+
+    assert batch == single
+    assert batch[0] == "yaha avadhāraṇā mujhe samajha meṃ nahīṃ ā rahī hai"
+    assert batch[1].count("\n") == 1
+    assert batch[2] == "   "
+    assert batch[3] == SEGMENTS[3]
+
+
+def test_memoization_and_lru_bound():
+    """Test that repeated texts hit the cache and the cache stays bounded."""
+    engine = RomanizationEngine(cache_size=2)
+
+    engine.romanize("नमस्ते", "hi")
+    engine.romanize("नमस्ते", "hi")
+    assert engine.hits == 1
+
+    engine.romanize("नमस्ते", "mr")
+    engine.romanize("धन्यवाद", "hi")
+    assert len(engine._cache) == 2
+
+    # Oldest entry was evicted
+    engine.romanize("नमस्ते", "hi")
+    assert engine.hits == 1
+
+
+def test_unsupported_language_passthrough():
+    """Test that English and unsupported languages are returned unchanged."""
+    engine = RomanizationEngine()
+
+    assert engine.romanize_batch(["hello", "Bonjour à tous"], "en") == ["hello", "Bonjour à tous"]
+    assert engine.romanize("Bonjour à tous", "fr") == "Bonjour à tous"
+    assert engine.romanize("Привет", "ru") == "Privet"
+
+
+def test_schemes_cached_separately():
+    """Test per-scheme output and that ASCII reuses the cached IAST result."""
+    engine = RomanizationEngine()
+
+    iast = engine.romanize("परीक्षण", "hi", "iast")
+    assert engine.romanize("परीक्षण", "hi", "itrans") == "parIkShaNa"
+    assert engine.romanize("परीक्षण", "hi", "iso") == "parīkṣaṇa"
+
+    hits = engine.hits
+    assert engine.romanize("परीक्षण", "hi", "ascii") == "pariksana"
+    assert engine.hits == hits + 1  # IAST came from the cache
+    assert iast == "parīkṣaṇa"
+    assert len(engine._cache) == 4
+
+
+def test_unknown_scheme_rejected():
+    """Test that an unknown scheme raises instead of silently defaulting."""
+    try:
+        RomanizationEngine().romanize("नमस्ते", "hi", "hk")
+    except ValueError:
+        return
+    raise AssertionError("expected ValueError")
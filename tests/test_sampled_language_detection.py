@@ -0,0 +1,151 @@
+"""
+test_sampled_language_detection.py — Tests for Sampled Language Detection
+-------------------------------------------------------------------------
+Validates window placement and that detect_language_sampled stops early
+and reuses, invalidates or evicts entries of its JSON cache. Whisper is replaced by a small
+stand-in module whose model reads the language off the window amplitude.
+"""
+
+import importlib
+import json
+import os
+import sys
+import types
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from audio.audio_processing.audio_loader import audio_fingerprint
+
+SAMPLE_RATE = 16000
+WINDOW = 30 * SAMPLE_RATE
+
+
+class _Mel:
+    def __init__(self, segment):
+        self.segment = segment
+
+    def to(self, device):
+        return self
+
+
+class _FakeModel:
+    """Loud windows are Hindi, quiet ones English; confidence 0.9."""
+
+    dims = types.SimpleNamespace(n_mels=80)
+    device = "cpu"
+
+    def __init__(self):
+        self.calls = 0
+
+    def detect_language(self, mel):
+        self.calls += 1
+        lang = "hi" if np.abs(mel.segment).mean() > 0.2 else "en"
+        other = "en" if lang == "hi" else "hi"
+        return None, {lang: 0.9, other: 0.1}
+
+
+@pytest.fixture
+def detection(tmp_path, monkeypatch):
+    whisper = types.ModuleType("whisper")
+    whisper.pad_or_trim = lambda segment: segment
+    whisper.log_mel_spectrogram = lambda segment, n_mels: _Mel(segment)
+    monkeypatch.setitem(sys.modules, "whisper", whisper)
+
+    sys.modules.pop("audio.asr.language_detection", None)
+    module = importlib.import_module("audio.asr.language_detection")
+    monkeypatch.setattr(module, "LANGUAGE_CACHE_FILE", tmp_path / "cache" / "language_detection.json")
+    yield module
+    sys.modules.pop("audio.asr.language_detection", None)
+
+
+def _speech(seconds, amplitude):
+    t = np.arange(seconds * SAMPLE_RATE) / SAMPLE_RATE
+    return (amplitude * np.sin(2 * np.pi * 220 * t)).astype(np.float32)
+
+
+def test_window_offsets_short_input(detection):
+    """Test that audio up to one window is probed once from the start."""
+    assert detection.window_offsets(0) == [0]
+    assert detection.window_offsets(10 * SAMPLE_RATE) == [0]
+    assert detection.window_offsets(WINDOW) == [0]
+
+
+def test_window_offsets_long_input(detection):
+    """Test that windows are spread evenly and probed middle-first."""
+    n = 20 * WINDOW
+    offsets = detection.window_offsets(n, max_windows=5)
+
+    assert len(offsets) == 5 == len(set(offsets))
+    assert all(0 <= o <= n - WINDOW for o in offsets)
+    assert offsets[0] == sorted(offsets)[2]
+    assert {offsets[-2], offsets[-1]} == {min(offsets), max(offsets)}
+
+    # Fewer windows than requested when the audio is short
+    assert len(detection.window_offsets(int(2.5 * WINDOW), max_windows=5)) == 2
+
+
+def test_early_exit_skips_remaining_windows(detection):
+    """Test that a confident first window ends detection."""
+    model = _FakeModel()
+    language, confidence = detection.detect_language_sampled(model, _speech(300, 0.5))
+
+    assert (language, confidence) == ("hi", 0.9)
+    assert model.calls == 1
+
+
+def test_cache_reuse_and_invalidation(detection, tmp_path):
+    """Test that a cached key skips the model and a changed file is detected again."""
+    upload = tmp_path / "episode.mp3"
+    upload.write_bytes(b"\x00" * 1024)
+    audio = _speech(120, 0.5)
+
+    model = _FakeModel()
+    first_key = f"{audio_fingerprint(upload)}:small"
+    assert detection.detect_language_sampled(model, audio, cache_key=first_key) == ("hi", 0.9)
+    assert model.calls == 1
+
+    cache = json.loads(detection.LANGUAGE_CACHE_FILE.read_text(encoding="utf-8"))
+    assert cache[first_key] == {"language": "hi", "confidence": 0.9, "windows": 1}
+
+    # Same audio: served from the cache without touching the model
+    assert detection.detect_language_sampled(model, audio, cache_key=first_key) == ("hi", 0.9)
+    assert model.calls == 1
+
+    # New content under the same name: new fingerprint, detected again
+    upload.write_bytes(b"\x01" * 1024)
+    os.utime(upload, ns=(0, 10**9))
+    second_key = f"{audio_fingerprint(upload)}:small"
+    assert second_key != first_key
+    assert detection.detect_language_sampled(model, _speech(120, 0.1), cache_key=second_key) == ("en", 0.9)
+    assert model.calls == 2
+    assert set(json.loads(detection.LANGUAGE_CACHE_FILE.read_text(encoding="utf-8"))) == {first_key, second_key}
+
+
+def test_cache_evicts_least_recently_used(detection, monkeypatch):
+    """Test that the cache stays at its size limit and keeps recently used keys."""
+    monkeypatch.setattr(detection, "LANGUAGE_CACHE_SIZE", 2)
+    model = _FakeModel()
+    audio = _speech(60, 0.5)
+
+    detection.detect_language_sampled(model, audio, cache_key="a")
+    detection.detect_language_sampled(model, audio, cache_key="b")
+    detection.detect_language_sampled(model, audio, cache_key="a")  # hit: "b" is now oldest
+    detection.detect_language_sampled(model, audio, cache_key="c")
+
+    assert model.calls == 3
+    assert list(json.loads(detection.LANGUAGE_CACHE_FILE.read_text(encoding="utf-8"))) == ["a", "c"]
+
+
+def test_corrupt_cache_is_ignored(detection):
+    """Test that an unreadable cache file falls back to detection."""
+    detection.LANGUAGE_CACHE_FILE.parent.mkdir(parents=True)
+    detection.LANGUAGE_CACHE_FILE.write_text("{not json", encoding="utf-8")
+
+    model = _FakeModel()
+    assert detection.detect_language_sampled(model, _speech(60, 0.5), cache_key="k") == ("hi", 0.9)
+    assert model.calls == 1
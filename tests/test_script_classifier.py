@@ -0,0 +1,85 @@
+"""
+test_script_classifier.py — Tests for Unicode Script Classification
+-------------------------------------------------------------------
+Validates range-table script detection against unicodedata names.
+"""
+
+import sys
+import unicodedata
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from language_adaptation.script_classifier import (
+    classify_char,
+    dominant_script,
+    script_counts_bulk,
+    detect_languages_bulk,
+    detect_language_from_script,
+    SCRIPTS
+)
+
+
+def test_classify_char_matches_unicode_names():
+    """Test that letters of each script map to the script in their Unicode name."""
+    for text in ["नमस्ते", "తెలుగు", "தமிழ்", "ಕನ್ನಡ", "മലയാളം", "বাংলা", "ગુજરાતી",
+                 "مرحبا", "Привет", "ひらがな", "カタカナ", "你好", "안녕하세요"]:
+        for ch in text:
+            name = unicodedata.name(ch).split()[0]
+            if name in SCRIPTS:
+                assert classify_char(ch) == name, f"{ch!r} should be {name}"
+
+    assert classify_char("a") is None
+    assert classify_char("é") is None
+
+
+def test_dominant_script_with_counts():
+    """Test that the most frequent script wins and counts are reported."""
+    script, counts = dominant_script("Hello नमस्ते दुनिया and Привет")
+
+    assert script == "DEVANAGARI"
+    assert counts["CYRILLIC"] == 6
+    assert "LATIN" not in counts
+
+
+def test_bulk_counts_match_single_text():
+    """Test that the bulk matrix equals per-text counts."""
+    texts = ["यह हिंदी है", "", "plain english", "这是中文 and 日本語のテキスト", "مرحبا"]
+
+    matrix = script_counts_bulk(texts)
+
+    for row, text in zip(matrix, texts):
+        _, counts = dominant_script(text)
+        assert {SCRIPTS[i]: int(c) for i, c in enumerate(row) if c} == counts
+
+
+def test_detect_languages_bulk_fallback():
+    """Test per-text languages with fallback for Latin-only text."""
+    languages = detect_languages_bulk(["ఇది తెలుగు", "English only", "안녕"], fallback="en")
+
+    assert languages == ["te", "en", "ko"]
+
+
+def test_japanese_kanji_count_with_kana():
+    """Test that Han characters next to kana count as Japanese, alone as Chinese."""
+    texts = ["これは日本語の文章", "私は学生です", "日本語テキスト", "这是中文句子", "你好"]
+
+    assert detect_languages_bulk(texts, fallback="en") == ["ja", "ja", "ja", "zh", "zh"]
+
+
+def test_mixed_script_text():
+    """Test that the language with most characters wins in mixed-script text."""
+    texts = ["नमस्ते दुनिया こんにちは", "東京 is big", "Да 日本語です", "你好 hello"]
+
+    assert detect_languages_bulk(texts, fallback="en") == ["hi", "zh", "ja", "zh"]
+
+
+def test_single_and_bulk_agree():
+    """Test that per-text and bulk detection give the same language, ties included."""
+    texts = ["これは日本語の文章", "私は学生です", "你好", "Да नम", "مرحبا Привет",
+             "가나 カナ", "plain english", ""]
+
+    bulk = detect_languages_bulk(texts, fallback="en")
+
+    assert [detect_language_from_script(t, "en") for t in texts] == bulk
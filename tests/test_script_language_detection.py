@@ -1,4 +1,4 @@
-from pipeline_core import detect_language_from_script
+from language_adaptation.script_classifier import detect_language_from_script
 
 tests = {
     "नमस्ते": "hi",
@@ -0,0 +1,72 @@
+"""
+test_segment_ensemble.py — Tests for Parallel Ensemble Segmentation
+-------------------------------------------------------------------
+Validates votes, consensus, confidences and executor equivalence.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from topic_intelligence.topic_segmentation.registry import (
+    SegmentationFeatures,
+    run_algorithm,
+    ALGORITHMS
+)
+from topic_intelligence.topic_segmentation.segment_ensemble import run_ensemble
+
+
+def _features(sizes=(6, 8, 7), seed=0):
+    rng = np.random.default_rng(seed)
+    sentences, blocks = [], []
+    for topic, size in enumerate(sizes):
+        centroid = rng.normal(size=16)
+        blocks.append(centroid + 0.05 * rng.normal(size=(size, 16)))
+        sentences += [f"Topic {topic} sentence about subject{topic} number {i}." for i in range(size)]
+    return SegmentationFeatures(sentences, embeddings=np.vstack(blocks)), list(np.cumsum(sizes)[:-1])
+
+
+def test_votes_and_consensus(monkeypatch):
+    """Boundaries need min_votes; every proposed boundary is counted"""
+    monkeypatch.setitem(ALGORITHMS, "fixed_a", lambda f: [3, 6, 10])
+    monkeypatch.setitem(ALGORITHMS, "fixed_b", lambda f: [6, 10, 15])
+    monkeypatch.setitem(ALGORITHMS, "fixed_c", lambda f: [6, 12])
+    features, _ = _features()
+
+    result = run_ensemble(features, ["fixed_a", "fixed_b", "fixed_c"], min_votes=2, executor="thread")
+
+    assert result["votes"] == {3: 1, 6: 3, 10: 2, 12: 1, 15: 1}
+    assert result["boundaries"] == [6, 10]
+    assert len(result["confidences"]) == 2
+    assert [len(t["segments"]) for t in result["topics"]] == [6, 4, len(features) - 10]
+    assert result["topics"][-1]["boundary_confidence"] is None
+    assert set(result["members"]) == {"fixed_a", "fixed_b", "fixed_c"}
+    assert all(m["seconds"] >= 0 for m in result["members"].values())
+
+
+def test_default_members_find_planted_topics():
+    """Real members agree on well separated topics with high confidence"""
+    features, truth = _features()
+    result = run_ensemble(features, executor="thread")
+    assert result["boundaries"] == truth
+    assert all(c > 0.5 for c in result["confidences"])
+
+
+def test_process_pool_matches_threads():
+    """Both executors give the same consensus"""
+    features, _ = _features(sizes=(9, 12, 7, 10))
+    threads = run_ensemble(features, executor="thread")
+    processes = run_ensemble(features, executor="process", workers=2)
+    assert threads["boundaries"] == processes["boundaries"]
+    assert threads["votes"] == processes["votes"]
+
+
+def test_registered_as_algorithm():
+    """The ensemble is selectable through the registry"""
+    features, truth = _features()
+    assert run_algorithm("hybrid_consensus", features).boundaries == truth
+    assert run_ensemble(SegmentationFeatures([]))["topics"] == []
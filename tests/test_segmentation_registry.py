@@ -0,0 +1,120 @@
+"""
+test_segmentation_registry.py — Tests for the Segmentation Registry
+-------------------------------------------------------------------
+Validates the common interface, shared features and the anchor rule.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from topic_intelligence.topic_segmentation import registry
+from topic_intelligence.topic_segmentation import topic_segmentation_core as core
+from topic_intelligence.topic_segmentation.registry import (
+    SegmentationFeatures,
+    available_algorithms,
+    benchmark,
+    register,
+    run_algorithm,
+    ALGORITHMS
+)
+
+
+def _features(sizes=(6, 8, 7), seed=0):
+    rng = np.random.default_rng(seed)
+    sentences, blocks = [], []
+    for topic, size in enumerate(sizes):
+        centroid = rng.normal(size=16)
+        blocks.append(centroid + 0.05 * rng.normal(size=(size, 16)))
+        sentences += [f"Topic {topic} sentence about subject{topic} number {i}." for i in range(size)]
+    return SegmentationFeatures(sentences, embeddings=np.vstack(blocks)), list(np.cumsum(sizes)[:-1])
+
+
+def test_every_algorithm_returns_common_result():
+    """All registered algorithms run on shared features and return sorted boundaries"""
+    features, _ = _features()
+    results = benchmark(features)
+
+    assert set(results) == set(available_algorithms())
+    for result in results.values():
+        assert result.boundaries == sorted(result.boundaries)
+        assert all(0 < b < len(features) for b in result.boundaries)
+        assert len(result.confidences) == len(result.boundaries)
+        assert all(0.0 <= c <= 1.0 for c in result.confidences)
+        assert sum(len(g) for g in result.groups()) == len(features)
+
+
+def test_embedding_algorithms_find_planted_topics():
+    """Embedding-based algorithms use the precomputed embeddings"""
+    features, truth = _features()
+    assert run_algorithm("optimal_partition", features).boundaries == truth
+    assert run_algorithm("embedding_dynamic", features).boundaries == truth
+
+
+def test_features_computed_once(monkeypatch):
+    """The encoder is called once however many algorithms run"""
+    calls = []
+
+    class CountingEmbedder:
+        def encode(self, texts):
+            calls.append(len(texts))
+            return np.eye(len(texts))
+
+    monkeypatch.setattr(registry, "get_embedder", lambda: CountingEmbedder())
+    features, _ = _features()
+    features._embeddings = None
+    benchmark(features, ["optimal_partition", "embedding_drop", "baseline_similarity"])
+    assert calls == [len(features)]
+
+
+def test_registry_encodes_what_standalone_algorithms_encode(monkeypatch):
+    """Shared embeddings are computed on the raw sentences, so boundaries match a standalone run"""
+    from topic_intelligence.topic_segmentation.algorithms.segment_embedding_dynamic import segment
+    from topic_intelligence.topic_segmentation.registry import _boundaries_from_topics
+
+    planted, truth = _features()
+    # Fillers clean_text would strip must reach the encoder unchanged
+    sentences = [f"Um, you know, {s}" for s in planted.sentences]
+    by_text = dict(zip(sentences, planted.embeddings))
+    encoded = []
+
+    class LookupEmbedder:
+        def encode(self, texts):
+            encoded.append(list(texts))
+            return np.vstack([by_text.get(t, np.zeros(16)) for t in texts])
+
+    monkeypatch.setattr(registry, "get_embedder", lambda: LookupEmbedder())
+    features = SegmentationFeatures(sentences)
+    assert features.cleaned != sentences
+
+    shared = run_algorithm("embedding_dynamic", features).boundaries
+    standalone = _boundaries_from_topics(segment(features.items()))
+
+    assert shared == standalone == truth
+    assert encoded == [sentences, sentences]
+
+
+def test_anchor_definition_matches_max_sentences():
+    """Without anchors the built-in rule cuts every MAX_SENTENCES_PER_TOPIC sentences"""
+    features = SegmentationFeatures(["plain sentence"] * 25, embeddings=np.ones((25, 4)))
+    result = run_algorithm("anchor_definition", features)
+    step = core.MAX_SENTENCES_PER_TOPIC
+    assert result.boundaries == list(range(step, 25, step))
+
+
+def test_register_and_unknown(monkeypatch):
+    """Custom algorithms can be registered; unknown names raise"""
+    monkeypatch.setitem(ALGORITHMS, "halves", None)
+    register("halves")(lambda features: ([len(features) // 2], [0.5]))
+    features, _ = _features()
+    result = run_algorithm("halves", features)
+    assert result.boundaries == [len(features) // 2]
+    assert result.confidences == [0.5]
+
+    with pytest.raises(ValueError):
+        run_algorithm("does_not_exist", features)
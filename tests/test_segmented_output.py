@@ -0,0 +1,93 @@
+"""
+test_segmented_output.py — Tests for the v3 Segmented Output Schema
+-------------------------------------------------------------------
+Validates that compacting segmented output stores each text once, that
+the compatibility reader restores the old shape exactly, and that
+indexing, validation and lazy romanization accept the v3 schema.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from language_adaptation.lazy_romanization import romanize_artifact
+from pipeline.pipeline_validation_core import validate_schema
+from topic_intelligence.indexing.indexing_core import build_index
+from topic_intelligence.topic_segmentation.segmented_output import (
+    compact_output,
+    is_compact,
+    load_segmented_output,
+    materialize,
+    transcription_output
+)
+from topic_intelligence.topic_segmentation.utils.segment_mapper import build_sentence_data
+
+HINDI = {"text": "यह एक परीक्षण है", "translation": "This is a test of the dual form. It has two parts.",
+         "language": "hi", "translation_state": "done"}
+ENGLISH = {"text": "We now look at plural verbs in detail.", "translation": "We now look at plural verbs in detail.",
+           "language": "en", "translation_state": "not_needed"}
+
+
+def _segmented_v2():
+    sentences = [
+        build_sentence_data("This is a test of the dual form.", HINDI, 0.0, 4.0),
+        build_sentence_data("It has two parts.", HINDI, 0.0, 4.0),
+        build_sentence_data("We now look at plural verbs in detail.", ENGLISH, 4.0, 6.0),
+        build_sentence_data("An unmatched sentence with no source segment.", {}, 6.0, 8.0),
+    ]
+    sentences[3]["romanized"] = "An unmatched sentence with no source segment."
+    topics = [
+        {"topic_id": 0, "segment_id": "seg_001", "start": 0.0, "end": 4.0, "topic_title": "Dual",
+         "summary": "Dual form.", "keywords": ["dual form"], "text": " ".join(s["text"] for s in sentences[:2]),
+         "sentences": sentences[:2], "sentiment": "NEUTRAL", "sentiment_score": 0.0, "boundary_confidence": 0.7},
+        {"topic_id": 2, "segment_id": "seg_003", "start": 4.0, "end": 8.0, "topic_title": "Plural",
+         "summary": "Plural verbs.", "keywords": ["plural verbs"], "text": " ".join(s["text"] for s in sentences[2:]),
+         "sentences": sentences[2:], "sentiment": "NEUTRAL", "sentiment_score": 0.0, "boundary_confidence": None},
+    ]
+    return {
+        "Project_Title": "LEXARA",
+        "audio_file": "episode.wav",
+        "topics": topics,
+        "Transcription_Output": transcription_output(topics),
+        "3D_Animation_Output": [],
+        "sentence_track": {"start": [0.0, 2.0]}
+    }
+
+
+def test_compact_stores_text_once():
+    """Every sentence and source text appears once; the old shape is restored exactly"""
+    data = _segmented_v2()
+    compact = compact_output(data)
+
+    assert is_compact(compact) and not is_compact(data)
+    assert "Transcription_Output" not in compact
+    assert all("sentences" not in t and "text" not in t for t in compact["topics"])
+    assert [t["sentence_ids"] for t in compact["topics"]] == [[0, 1], [2, 3]]
+    assert len(compact["segments"]) == 2  # both Hindi sentences share one source segment
+    assert "translation" not in compact["segments"][1]  # same as its text
+    assert compact["sentences"][2] == {"segment": 1, "start": 4.0, "end": 6.0}
+
+    serialized = json.dumps(compact, ensure_ascii=False)
+    assert serialized.count("plural verbs in detail") == 1
+
+    assert materialize(compact) == data
+    assert compact_output(materialize(compact)) == compact
+
+
+def test_consumers_accept_v3(tmp_path):
+    """Indexing, validation and lazy romanization work on the v3 file"""
+    path = tmp_path / "segmented_output.json"
+    path.write_text(json.dumps(compact_output(_segmented_v2()), ensure_ascii=False), encoding="utf-8")
+
+    indexed = build_index(path, idf_store_path=tmp_path / "idf.bin")
+    validate_schema(indexed)
+    assert indexed["sentences"] == load_segmented_output(path, materialized=False)["sentences"]
+    assert 0 in indexed["search_index"]["dual"] and 2 in indexed["search_index"]["plural"]
+
+    romanize_artifact(path)
+    topics = load_segmented_output(path)["topics"]
+    assert topics[0]["sentences"][0]["romanized"] == topics[0]["sentences"][1]["romanized"] == "yaha eka parīkṣaṇa hai"
+    assert topics[1]["sentences"][0]["romanized"] == ENGLISH["text"]
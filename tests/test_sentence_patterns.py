@@ -0,0 +1,68 @@
+"""
+test_sentence_patterns.py — Tests for Compiled Sentence Patterns
+----------------------------------------------------------------
+Validates the single-pass cleaner and anchor/definition flags against the
+per-pattern re.sub/re.search rules they replaced.
+"""
+
+import random
+import re
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from topic_intelligence.topic_segmentation.sentence_patterns import (
+    FILLERS,
+    ANCHORS,
+    DEF_PATTERNS,
+    EX_PATTERNS,
+    clean_text,
+    sentence_flags
+)
+from topic_intelligence.topic_segmentation.concept_anchors import has_concept_anchor
+from topic_intelligence.topic_segmentation.definition_filter import is_definition
+
+
+def _reference_clean(text):
+    t = text.lower()
+    for f in FILLERS:
+        t = re.sub(f, " ", t)
+    t = re.sub(r"\b(\w+)\s+\1\b", r"\1", t)
+    t = re.sub(r"\s+", " ", t)
+    return t.strip()
+
+
+def _reference_is_definition(sentence):
+    s = sentence.lower()
+    if any(re.search(p, s) for p in EX_PATTERNS):
+        return False
+    return any(re.search(p, s) for p in DEF_PATTERNS)
+
+
+def _reference_anchor(sentence):
+    s = sentence.lower()
+    return any(re.search(p, s) for p in ANCHORS)
+
+
+def _random_sentences(rng, n):
+    phrases = [p.replace(r"\b", "") for p in FILLERS + ANCHORS + DEF_PATTERNS + EX_PATTERNS]
+    words = phrases + ["This", "word", "is", "the", "Now", "meansure", "nowhere", "called", "we", "we", "alright,"]
+    return [" ".join(rng.choice(words) for _ in range(rng.randint(0, 12))) for _ in range(n)]
+
+
+def test_matches_per_pattern_rules():
+    """Cleaner and flags agree with the original implementations"""
+    rng = random.Random(0)
+    for sentence in _random_sentences(rng, 3000):
+        assert clean_text(sentence) == _reference_clean(sentence)
+        assert is_definition(sentence) == _reference_is_definition(sentence)
+        assert has_concept_anchor(sentence) == _reference_anchor(sentence)
+
+
+def test_overlapping_phrases_are_all_found():
+    """A phrase inside another ('this is called' / 'is called') sets both flags"""
+    flags = sentence_flags("This is called the dual form.")
+    assert flags.anchor and flags.definition and not flags.example
+    assert not sentence_flags("For example, this is called a drill.").is_definition
@@ -0,0 +1,48 @@
+"""
+test_sentiment.py — Tests for Batched Sentiment Scoring
+-------------------------------------------------------
+Validates that scores and labels agree with TextBlob's pattern analyzer,
+including negation, adverb, exclamation, sarcasm and emoticon rules.
+"""
+
+import random
+import sys
+from pathlib import Path
+
+from textblob import TextBlob
+from textblob.en import sentiment as pattern_lexicon
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from topic_intelligence.topic_segmentation.sentiment import (
+    score_text,
+    score_texts,
+    sentiment_label
+)
+
+SENTENCES = [
+    "This is a really good example of the dual form.",
+    "It is not good, and honestly the grammar is terribly confusing!",
+    "We use this word when we talk about two people.",
+    "I don't like it... but Mr. Smith said it's great (!)",
+    "Never a bad lesson :) <3",
+    "",
+]
+
+
+def test_matches_textblob():
+    """Scores equal TextBlob polarity on fixed and random lexicon text"""
+    rng = random.Random(0)
+    words = list(pattern_lexicon.keys())[:2000] + ["not", "very", "!", "(!)", "don't", ":)", "a", "U.S.", "good."] * 40
+    texts = SENTENCES + [" ".join(rng.choice(words) for _ in range(rng.randint(1, 14))) for _ in range(500)]
+
+    for text in texts:
+        assert score_text(text) == TextBlob(text).sentiment.polarity
+
+
+def test_batch_and_labels():
+    """score_texts equals per-text scoring; labels use the +-0.1 cut"""
+    assert score_texts(SENTENCES).tolist() == [score_text(s) for s in SENTENCES]
+    assert [sentiment_label(s) for s in (0.5, 0.1, -0.1, -0.11)] == ["POSITIVE", "NEUTRAL", "NEUTRAL", "NEGATIVE"]
+    assert score_text("") == 0.0
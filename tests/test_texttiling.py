@@ -0,0 +1,101 @@
+"""
+test_texttiling.py — Tests for Sparse TextTiling
+------------------------------------------------
+Validates the sparse window scores against a per-position reference and
+the depth-score boundary detection.
+"""
+
+import math
+import random
+import sys
+from collections import Counter
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from topic_intelligence.topic_segmentation.algorithms.segment_texttiling import (
+    segment,
+    term_matrix,
+    depth_scores,
+    _tokenize
+)
+from topic_intelligence.topic_segmentation.utils.sparse_windows import window_cosine
+
+
+def _reference_cosine(a, b):
+    dot = sum(a[x] * b[x] for x in set(a) & set(b))
+    norm = math.sqrt(sum(v ** 2 for v in a.values())) * math.sqrt(sum(v ** 2 for v in b.values()))
+    return dot / norm if norm else 0.0
+
+
+def _reference_segment(segments, window_size, threshold):
+    """Per-position Counter implementation the sparse version replaced."""
+    if len(segments) <= window_size:
+        return [segments]
+    topics, current = [], segments[:window_size]
+    for i in range(window_size, len(segments)):
+        left = Counter(_tokenize(" ".join(s["text"] for s in segments[i - window_size:i])))
+        if _reference_cosine(left, Counter(_tokenize(segments[i]["text"]))) < threshold:
+            topics.append(current)
+            current = [segments[i]]
+        else:
+            current = current + [segments[i]]
+    return topics + [current]
+
+
+def _random_segments(rng, n):
+    vocab = [f"word{i}" for i in range(60)] + ["Don't", "e-mail", "naïve", "x_y"]
+    return [
+        {"id": i, "text": " ".join(rng.choice(vocab) for _ in range(rng.randint(0, 10))) + "."}
+        for i in range(n)
+    ]
+
+
+def test_threshold_matches_reference():
+    """The default method reproduces the original per-position rule"""
+    rng = random.Random(1)
+    for n in (1, 2, 5, 40, 120):
+        segments = _random_segments(rng, n)
+        for window_size in (1, 2, 3):
+            for threshold in (0.1, 0.25):
+                expected = [[s["id"] for s in topic] for topic in _reference_segment(segments, window_size, threshold)]
+                got = [[s["id"] for s in t["segments"]] for t in segment(segments, window_size, threshold)]
+                assert got == expected
+
+
+def test_window_cosine_matches_dense():
+    """Sparse window sums equal dense slicing at every gap, edges included"""
+    rng = random.Random(2)
+    counts = term_matrix(_random_segments(rng, 30))
+    dense = counts.toarray().astype(float)
+    sims = window_cosine(counts, 3, 2)
+    for gap in range(1, 30):
+        left = dense[max(0, gap - 3):gap].sum(axis=0)
+        right = dense[gap:gap + 2].sum(axis=0)
+        norm = np.linalg.norm(left) * np.linalg.norm(right)
+        assert abs(sims[gap - 1] - (left @ right / norm if norm else 0.0)) < 1e-12
+
+
+def test_depth_scores():
+    """Depth is measured against the nearest peaks on both sides"""
+    scores = np.array([0.8, 0.5, 0.2, 0.6, 0.9, 0.7, 0.4, 0.5])
+    depths = depth_scores(scores)
+    assert np.isclose(depths[2], (0.8 - 0.2) + (0.9 - 0.2))
+    assert np.isclose(depths[6], (0.9 - 0.4) + (0.5 - 0.4))
+    assert depths[4] == 0
+
+
+def test_depth_method_finds_planted_topics():
+    """Depth scoring cuts between blocks with disjoint vocabularies"""
+    rng = random.Random(3)
+    segments, sizes = [], [12, 9, 15]
+    for topic, size in enumerate(sizes):
+        vocab = [f"topic{topic}term{i}" for i in range(15)]
+        segments += [{"text": " ".join(rng.choice(vocab) for _ in range(8))} for _ in range(size)]
+
+    topics = segment(segments, window_size=3, method="depth")
+    assert [len(t["segments"]) for t in topics] == sizes
+    assert [t["topic_id"] for t in topics] == [0, 1, 2]
@@ -0,0 +1,68 @@
+"""
+test_tfidf_drift.py — Tests for Vectorized TF-IDF Drift Segmentation
+--------------------------------------------------------------------
+Validates the window-sum similarities against per-position slicing and
+the multi-scale option.
+"""
+
+import random
+import sys
+from pathlib import Path
+
+import numpy as np
+from sklearn.feature_extraction.text import TfidfVectorizer
+from sklearn.metrics.pairwise import cosine_similarity
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from topic_intelligence.topic_segmentation.algorithms.segment_tfidf_drift import (
+    segment,
+    drift_similarities
+)
+
+
+def _segments(sizes=(10, 8, 12), seed=0):
+    rng = random.Random(seed)
+    segments = []
+    for topic, size in enumerate(sizes):
+        vocab = [f"topic{topic}term{i}" for i in range(12)]
+        segments += [{"text": " ".join(rng.choice(vocab) for _ in range(8))} for _ in range(size)]
+    return segments
+
+
+def test_similarities_match_window_means():
+    """Window sums give the same cosine as sliced window means"""
+    segments = _segments()
+    tfidf = TfidfVectorizer(stop_words="english").fit_transform([s["text"] for s in segments])
+    sims = drift_similarities(tfidf, [3, 5])
+
+    for row, window in enumerate([3, 5]):
+        for i in range(window, len(segments)):
+            prev_vec = np.asarray(tfidf[i - window:i].mean(axis=0))
+            next_vec = np.asarray(tfidf[i:i + window].mean(axis=0))
+            assert abs(sims[row, i - 1] - cosine_similarity(prev_vec, next_vec)[0][0]) < 1e-9
+
+
+def test_single_scale_cuts_at_topic_changes():
+    """Default settings cut at every vocabulary change"""
+    topics = segment(_segments())
+    starts = np.cumsum([len(t["segments"]) for t in topics])[:-1]
+    assert {10, 18} <= set(starts.tolist())
+    assert [t["topic_id"] for t in topics] == list(range(len(topics)))
+
+
+def test_multiscale_averages_scales():
+    """Averaging scales removes the cuts next to the true boundaries"""
+    segments = _segments()
+    topics = segment(segments, window_sizes=[2, 3, 5])
+    assert [len(t["segments"]) for t in topics] == [10, 8, 12]
+
+    # Single-element window set is the plain window_size rule
+    single = segment(segments, window_sizes=[4])
+    assert [len(t["segments"]) for t in single] == [len(t["segments"]) for t in segment(segments, window_size=4)]
+
+
+def test_short_input_single_topic():
+    segments = _segments(sizes=(3,))
+    assert segment(segments) == [{"topic_id": 0, "segments": segments}]
@@ -0,0 +1,117 @@
+"""
+test_translation_tier.py — Tests for Policy-Driven Translation
+--------------------------------------------------------------
+Validates translation state tracking, deduplication, persistence and the
+background completion callback.
+"""
+
+import json
+import sys
+from pathlib import Path
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from language_adaptation import translation_tier
+from language_adaptation.translation_tier import (
+    init_translation_state,
+    needs_translation,
+    start_background_translation,
+    translate_segments,
+    translate_artifact
+)
+
+
+def _segments():
+    return [
+        {"segment_id": 0, "text": "नमस्ते", "language": "hi"},
+        {"segment_id": 1, "text": "Welcome back", "language": "en"},
+        {"segment_id": 2, "text": "नमस्ते", "language": "hi"},
+        {"segment_id": 3, "text": "धन्यवाद", "language": "hi"},
+    ]
+
+
+def _fake_translator(calls):
+    table = {"नमस्ते": "Hello", "धन्यवाद": "Thank you"}
+
+    def translate_auto(text, source_lang, target_lang, raise_errors=False):
+        calls.append(text)
+        return table.get(text, text)
+
+    return translate_auto
+
+
+def test_init_state_uses_placeholders():
+    """Test that pending segments keep their source text as translation."""
+    segments = _segments()
+    init_translation_state(segments)
+
+    assert [s["translation_state"] for s in segments] == ["pending", "not_needed", "pending", "pending"]
+    assert segments[0]["translation"] == "नमस्ते"
+    assert needs_translation(segments)
+
+
+def test_translate_segments_dedups_and_tracks_state(monkeypatch):
+    """Test that identical texts are requested once and states are updated."""
+    calls = []
+    monkeypatch.setattr(translation_tier, "translate_auto", _fake_translator(calls))
+    segments = _segments()
+
+    assert translate_segments(segments, indices=[0, 1, 2]) == 2
+    assert calls == ["नमस्ते"]
+    assert segments[2]["translation"] == "Hello"
+    assert segments[3]["translation_state"] == "pending"
+
+    assert translate_segments(segments) == 1
+    assert not needs_translation(segments)
+
+
+def test_identity_translation_is_done(monkeypatch):
+    """Test that a translation equal to the source text is not a failure."""
+    monkeypatch.setattr(translation_tier, "translate_auto", lambda text, s, t, raise_errors=False: text)
+    segments = [{"text": "Bengaluru", "language": "kn"}]
+
+    assert translate_segments(segments) == 1
+    assert segments[0]["translation_state"] == "done"
+    assert not needs_translation(segments)
+
+
+def test_failed_translation_is_retried(monkeypatch, tmp_path):
+    """Test that backend errors are marked failed and persisted for retry."""
+    def unavailable(text, source_lang, target_lang, raise_errors=False):
+        raise RuntimeError("backend unavailable")
+
+    monkeypatch.setattr(translation_tier, "translate_auto", unavailable)
+    path = tmp_path / "pipeline_output.json"
+    path.write_text(json.dumps({"segments": _segments()}, ensure_ascii=False), encoding="utf-8")
+
+    data = translate_artifact(path)
+    assert data["segments"][0]["translation_state"] == "failed"
+    assert data["segments"][0]["translation"] == "नमस्ते"
+
+    calls = []
+    monkeypatch.setattr(translation_tier, "translate_auto", _fake_translator(calls))
+    translate_artifact(path)
+
+    saved = json.loads(path.read_text(encoding="utf-8"))
+    assert [s["translation"] for s in saved["segments"]] == ["Hello", "Welcome back", "Hello", "Thank you"]
+    assert not needs_translation(saved["segments"])
+
+
+def test_background_translation_calls_back_after_persisting(monkeypatch, tmp_path):
+    """Test that the completion callback sees the translations already on disk."""
+    monkeypatch.setattr(translation_tier, "translate_auto", _fake_translator([]))
+    path = tmp_path / "pipeline_output.json"
+    path.write_text(json.dumps({"segments": _segments()}, ensure_ascii=False), encoding="utf-8")
+
+    seen = []
+
+    def resegment(data):
+        seen.append((data, json.loads(path.read_text(encoding="utf-8"))))
+
+    start_background_translation(path, on_complete=resegment).join(timeout=10)
+
+    assert len(seen) == 1
+    data, on_disk = seen[0]
+    assert not needs_translation(data["segments"])
+    assert on_disk == data
@@ -0,0 +1,55 @@
+"""
+test_vad.py — Tests for Energy-Based Speech Region Detection
+------------------------------------------------------------
+Validates speech/pause segmentation used by code-switch mode.
+"""
+
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add project root to path
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from audio.audio_processing.vad import speech_regions, SAMPLE_RATE, MAX_REGION_SECONDS
+
+
+def _tone(seconds):
+    t = np.arange(int(seconds * SAMPLE_RATE)) / SAMPLE_RATE
+    return (0.5 * np.sin(2 * np.pi * 220 * t)).astype(np.float32)
+
+
+def _silence(seconds):
+    return np.zeros(int(seconds * SAMPLE_RATE), dtype=np.float32)
+
+
+def test_regions_split_on_pauses():
+    """Test that pauses longer than the bridge length separate regions."""
+    audio = np.concatenate([_silence(1), _tone(2), _silence(2), _tone(3), _silence(1)])
+
+    regions = speech_regions(audio)
+
+    assert len(regions) == 2
+    assert abs(regions[0][0] / SAMPLE_RATE - 1.0) < 0.05
+    assert abs(regions[1][1] / SAMPLE_RATE - 8.0) < 0.05
+
+
+def test_short_pauses_are_bridged():
+    """Test that brief pauses stay inside one region."""
+    audio = np.concatenate([_tone(2), _silence(0.2), _tone(2)])
+
+    assert len(speech_regions(audio)) == 1
+
+
+def test_long_regions_are_capped():
+    """Test that no region exceeds one whisper window."""
+    regions = speech_regions(_tone(75))
+
+    assert len(regions) == 3
+    assert all((e - s) / SAMPLE_RATE <= MAX_REGION_SECONDS for s, e in regions)
+
+
+def test_silence_has_no_regions():
+    """Test that pure silence yields no speech."""
+    assert speech_regions(_silence(5)) == []
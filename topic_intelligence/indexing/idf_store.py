@@ -0,0 +1,266 @@
+"""
+idf_store.py — Corpus-Wide Document Frequency Store
+---------------------------------------------------
+Document frequencies of keyword terms over every episode indexed so far,
+so TF-IDF scoring can tell terms that are common across the whole
+catalogue from terms that are specific to one episode.
+
+Terms are stored as 64-bit blake2b hashes in a sorted array next to their
+document counts; lookups are a single searchsorted and the file is three
+flat arrays behind a fixed header, read in one call. Each topic of an
+episode counts as one document. Episodes are recorded by the hash of
+their audio content (episode_id), so re-indexing an episode does not
+count it twice and two uploads that share a file name are both counted. Updates hold an exclusive
+lock on a sidecar file so concurrent indexers do not lose each other's
+episodes.
+"""
+
+import hashlib
+import os
+import struct
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Sequence
+
+import numpy as np
+from scipy import sparse
+from sklearn.preprocessing import normalize
+
+try:
+    import fcntl
+    USE_FCNTL = True
+except ImportError:
+    # Windows
+    import msvcrt
+    USE_FCNTL = False
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent.parent
+
+# =========================
+# CONFIG
+# =========================
+
+IDF_STORE_FILE = PROJECT_ROOT / "data" / "corpus" / "idf_store.bin"
+MAGIC = b"LXIDF1\x00\x00"
+HEADER = struct.Struct("<8sQQQ")  # magic, documents, episodes, terms
+
+_cache = {}
+_cache_lock = threading.Lock()
+
+
+def term_hash(term: str) -> int:
+    return int.from_bytes(hashlib.blake2b(term.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def term_hashes(terms: Iterable[str]) -> np.ndarray:
+    return np.fromiter((term_hash(t) for t in terms), dtype=np.uint64)
+
+
+def episode_id(data: Dict) -> Optional[str]:
+    """Store id of an episode: its audio fingerprint, or the file name for older outputs."""
+    return data.get("audio_fingerprint") or data.get("audio_file")
+
+
+class IDFStore:
+    """
+    Hashed term -> document count table for the indexed corpus.
+
+    Args:
+        path: Store file, written by save()
+    """
+
+    def __init__(self, path=IDF_STORE_FILE):
+        self.path = Path(path)
+        self.n_documents = 0
+        self.episodes = np.empty(0, dtype=np.uint64)
+        self.terms = np.empty(0, dtype=np.uint64)
+        self.counts = np.empty(0, dtype=np.uint32)
+
+    def __len__(self):
+        return len(self.terms)
+
+    @classmethod
+    def load(cls, path=IDF_STORE_FILE) -> "IDFStore":
+        """Read a store from disk; a missing, empty or truncated file gives an empty store."""
+        store = cls(path)
+        try:
+            with open(store.path, "rb") as f:
+                raw = f.read()
+        except FileNotFoundError:
+            return store
+
+        if len(raw) < HEADER.size:
+            if raw:
+                print(f"[WARNING] Truncated IDF store, starting empty: {store.path}")
+            return store
+
+        magic, n_documents, n_episodes, n_terms = HEADER.unpack_from(raw)
+        if magic != MAGIC:
+            raise ValueError(f"Not an IDF store: {store.path}")
+        if len(raw) < HEADER.size + 8 * n_episodes + 12 * n_terms:
+            print(f"[WARNING] Truncated IDF store, starting empty: {store.path}")
+            return store
+
+        offset = HEADER.size
+        store.n_documents = n_documents
+        store.episodes = np.frombuffer(raw, dtype="<u8", count=n_episodes, offset=offset)
+        offset += 8 * n_episodes
+        store.terms = np.frombuffer(raw, dtype="<u8", count=n_terms, offset=offset)
+        offset += 8 * n_terms
+        store.counts = np.frombuffer(raw, dtype="<u4", count=n_terms, offset=offset)
+        return store
+
+    def save(self) -> None:
+        """Write the store atomically next to its final path."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        temp_path = self.path.with_suffix(f".{os.getpid()}.tmp")
+        with open(temp_path, "wb") as f:
+            f.write(HEADER.pack(MAGIC, self.n_documents, len(self.episodes), len(self.terms)))
+            f.write(self.episodes.astype("<u8").tobytes())
+            f.write(self.terms.astype("<u8").tobytes())
+            f.write(self.counts.astype("<u4").tobytes())
+        os.replace(temp_path, self.path)
+
+    def has_episode(self, episode_id: str) -> bool:
+        key = np.uint64(term_hash(episode_id))
+        i = np.searchsorted(self.episodes, key)
+        return bool(i < len(self.episodes) and self.episodes[i] == key)
+
+    def document_frequency(self, terms: Sequence[str]) -> np.ndarray:
+        """Number of corpus documents containing each term (0 if unseen)."""
+        keys = term_hashes(terms)
+        if not len(self.terms):
+            return np.zeros(len(keys), dtype=np.int64)
+        pos = np.minimum(np.searchsorted(self.terms, keys), len(self.terms) - 1)
+        found = self.terms[pos] == keys
+        return np.where(found, self.counts[pos], 0).astype(np.int64)
+
+    def idf(
+        self,
+        terms: Sequence[str],
+        episode_df: Optional[np.ndarray] = None,
+        episode_documents: int = 0
+    ) -> np.ndarray:
+        """
+        Smoothed IDF, ln((1 + N) / (1 + df)) + 1, over the corpus plus an
+        episode that is not in the store yet.
+
+        Args:
+            terms: Terms to weight
+            episode_df: Document frequency of each term in the episode
+            episode_documents: Number of documents in the episode
+
+        Returns:
+            IDF per term; with an empty store this is scikit-learn's
+            smooth_idf over the episode alone
+        """
+        df = self.document_frequency(terms)
+        if episode_df is not None:
+            df = df + np.asarray(episode_df, dtype=np.int64)
+        n = self.n_documents + episode_documents
+        return np.log((1 + n) / (1 + df)) + 1
+
+    def add_episode(self, episode_id: str, documents: Iterable[Iterable[str]]) -> bool:
+        """
+        Count the terms of one episode's documents into the store.
+
+        Args:
+            episode_id: Stable episode identifier (see episode_id())
+            documents: Terms of each document; repeats within a document count once
+
+        Returns:
+            False if the episode was already counted
+        """
+        if self.has_episode(episode_id):
+            return False
+
+        doc_keys = [np.unique(term_hashes(set(doc))) for doc in documents]
+        new_keys = np.concatenate(doc_keys) if doc_keys else np.empty(0, dtype=np.uint64)
+
+        merged, inverse = np.unique(np.concatenate([self.terms, new_keys]), return_inverse=True)
+        counts = np.zeros(len(merged), dtype=np.int64)
+        counts[inverse[:len(self.terms)]] = self.counts
+        np.add.at(counts, inverse[len(self.terms):], 1)
+
+        self.terms = merged
+        self.counts = counts.astype(np.uint32)
+        self.episodes = np.sort(np.append(self.episodes, np.uint64(term_hash(episode_id))))
+        self.n_documents += len(doc_keys)
+        return True
+
+
+def reweight_tfidf(vectorizer, matrix, store: IDFStore, episode_in_store: bool = False):
+    """
+    Swap the episode-only IDF of a fitted TfidfVectorizer for corpus IDF.
+
+    Args:
+        vectorizer: TfidfVectorizer fitted on the episode (l2 norm, smooth_idf)
+        matrix: Its fit_transform output
+        store: Corpus document frequencies
+        episode_in_store: The episode is already counted in the store, so
+            its own document frequencies are not added again; they still
+            bound the document frequency from below, so a term the store
+            has not seen is not treated as corpus-rare
+
+    Returns:
+        The matrix re-weighted and re-normalized; vectorizer.idf_ is
+        updated so later transform() calls use the same weights
+    """
+    if store.n_documents == 0:
+        return matrix
+
+    terms = vectorizer.get_feature_names_out()
+    episode_df = np.bincount(sparse.csr_matrix(matrix).indices, minlength=len(terms))
+    if episode_in_store:
+        df = np.maximum(store.document_frequency(terms), episode_df)
+        idf = np.log((1 + store.n_documents) / (1 + df)) + 1
+    else:
+        idf = store.idf(terms, episode_df, matrix.shape[0])
+
+    scale = idf / vectorizer.idf_
+    vectorizer.idf_ = idf
+    return normalize(sparse.csr_matrix(matrix) @ sparse.diags(scale))
+
+
+@contextmanager
+def store_lock(path=IDF_STORE_FILE):
+    """
+    Exclusive lock for a load -> add_episode -> save cycle on a store file.
+
+    Readers do not need it: save() replaces the file atomically.
+    """
+    lock_path = Path(path).with_suffix(".lock")
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+    with open(lock_path, "a+b") as f:
+        if USE_FCNTL:
+            fcntl.flock(f.fileno(), fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if USE_FCNTL:
+                fcntl.flock(f.fileno(), fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def load_idf_store(path=IDF_STORE_FILE) -> IDFStore:
+    """
+    Shared read-only store for a path, reloaded only when the file changes.
+    """
+    path = Path(path)
+    try:
+        version = path.stat().st_mtime_ns
+    except FileNotFoundError:
+        version = None
+
+    with _cache_lock:
+        cached = _cache.get(path)
+        if cached is None or cached[0] != version:
+            cached = (version, IDFStore.load(path))
+            _cache[path] = cached
+    return cached[1]
@@ -3,23 +3,65 @@ import sys
 from pathlib import Path
 from collections import defaultdict
 
+from pipeline.columnar_artifact import load_segmented
+from topic_intelligence.indexing.idf_store import IDFStore, IDF_STORE_FILE, episode_id, store_lock
+from topic_intelligence.topic_segmentation.keywords import document_terms
+from topic_intelligence.topic_segmentation.segmented_output import (
+    COMPACT_SECTIONS,
+    compact_output,
+    materialize_sentence,
+    topic_text
+)
+from topic_intelligence.topic_segmentation.topic_segmentation_core import topic_text as keyword_text
 
-def build_index(input_path: str) -> dict:
+
+def keyword_texts(data: dict) -> list:
+    """
+    Cleaned text of each topic, the same text segmentation fitted its
+    KeywordEngine on, so the corpus store counts the terms keywords are
+    scored against rather than the raw transcript.
+    """
+    texts = []
+    for topic in data["topics"]:
+        if "sentence_ids" in topic:
+            sentences = [materialize_sentence(data, i)["text"] for i in topic["sentence_ids"]]
+        else:
+            sentences = [topic_text(data, topic)]
+        texts.append(keyword_text(range(len(sentences)), sentences))
+    return texts
+
+
+def build_index(input_path: str, idf_store_path=IDF_STORE_FILE, update_corpus: bool = True) -> dict:
+    """
+    Build the search index of a segmented episode.
+
+    Args:
+        input_path: Columnar artifact of a segmented episode, or
+                    segmented_output.json (its artifact is read when present)
+        idf_store_path: Corpus document frequency store
+        update_corpus: Count this episode's topics into the store (once per episode_id)
+
+    Returns:
+        Indexed output with search_index and corpus IDF of every keyword,
+        in the v3 layout: referenced sentences/segments instead of text
+        inlined into the topics.
+    """
     input_path = Path(input_path)
 
     if not input_path.exists():
         raise FileNotFoundError(f"Input file not found: {input_path}")
 
-    with open(input_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = compact_output(load_segmented(input_path))
 
     if "topics" not in data:
-        raise ValueError("Input JSON must contain 'topics'")
+        raise ValueError("Input must contain 'topics'")
+
+    texts = [topic_text(data, topic) for topic in data["topics"]]
 
     # Build search index
     search_index = defaultdict(list)
     
-    for topic in data["topics"]:
+    for topic, text in zip(data["topics"], texts):
         # Index by keywords
         for keyword in topic.get("keywords", []):
             search_index[keyword.lower()].append(topic["topic_id"])
@@ -31,27 +73,45 @@ def build_index(input_path: str) -> dict:
                 search_index[word].append(topic["topic_id"])
         
         # Index by full text
-        text_words = topic.get("text", "").lower().split()
+        text_words = text.lower().split()
         for word in text_words:
             if len(word) > 3:
                 search_index[word].append(topic["topic_id"])
 
-    indexed = {
-        "audio_file": data.get("audio_file"),
+    # Every topic of the episode is one corpus document; the lock keeps
+    # concurrent indexers from overwriting each other's episodes
+    if update_corpus and episode_id(data):
+        documents = document_terms(keyword_texts(data))
+        with store_lock(idf_store_path):
+            store = IDFStore.load(idf_store_path)
+            if store.add_episode(episode_id(data), documents):
+                store.save()
+    else:
+        store = IDFStore.load(idf_store_path)
+
+    keywords = sorted({kw.lower() for topic in data["topics"] for kw in topic.get("keywords", [])})
+    keyword_idf = {kw: round(float(w), 4) for kw, w in zip(keywords, store.idf(keywords))}
+
+    indexed = {"audio_file": data.get("audio_file")}
+    indexed.update((key, data[key]) for key in COMPACT_SECTIONS)
+    indexed.update({
         "topics": data["topics"],
         "search_index": dict(search_index),
+        "keyword_idf": keyword_idf,
         "metadata": {
             "total_topics": len(data["topics"]),
+            "corpus_documents": store.n_documents,
+            "corpus_episodes": len(store.episodes),
             "indexed_at": __import__("datetime").datetime.now().isoformat()
         }
-    }
+    })
 
     return indexed
 
 
 if __name__ == "__main__":
     if len(sys.argv) != 2:
-        print("Usage: python indexing_core.py <segmented_output.json>")
+        print("Usage: python indexing_core.py <segmented_output.arrow | segmented_output.json>")
         sys.exit(1)
 
     input_file = sys.argv[1]
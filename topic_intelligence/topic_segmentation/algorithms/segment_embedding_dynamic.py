@@ -1,32 +1,26 @@
-from sentence_transformers import SentenceTransformer
-from sklearn.metrics.pairwise import cosine_similarity
-from typing import List, Dict
+from sklearn.preprocessing import normalize
+from typing import List, Dict, Optional
 import numpy as np
 
-_MODEL = SentenceTransformer("all-MiniLM-L6-v2")
-
 
 def segment(
     segments: List[Dict],
     min_topic_size: int = 3,
-    std_factor: float = 0.8
+    std_factor: float = 0.8,
+    embeddings: Optional[np.ndarray] = None
 ) -> List[Dict]:
 
     if not segments:
         return []
 
-    texts = [s["text"] for s in segments]
-    embeddings = _MODEL.encode(texts)
-
-    sims = []
-    for i in range(1, len(embeddings)):
-        sim = cosine_similarity(
-            [embeddings[i - 1]],
-            [embeddings[i]]
-        )[0][0]
-        sims.append(sim)
+    if embeddings is None:
+        from ..registry import get_embedder
+        embeddings = get_embedder().encode([s["text"] for s in segments])
 
-    sims_np = np.array(sims)
+    # Similarity of each segment with the previous one, in one pass
+    unit = normalize(np.asarray(embeddings, dtype=np.float64))
+    sims_np = np.einsum("ij,ij->i", unit[:-1], unit[1:])
+    sims = sims_np.tolist()
 
     mean_sim = sims_np.mean()
     std_sim = sims_np.std()
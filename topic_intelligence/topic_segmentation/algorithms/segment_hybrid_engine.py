@@ -1,10 +1,8 @@
-from sentence_transformers import SentenceTransformer
-from sklearn.metrics.pairwise import cosine_similarity
-from sklearn.feature_extraction.text import TfidfVectorizer
-from typing import List, Dict
+from sklearn.preprocessing import normalize
+from typing import List, Dict, Optional
 import numpy as np
 
-_MODEL = SentenceTransformer("all-MiniLM-L6-v2")
+from ..keywords import KeywordEngine
 
 MIN_SEGMENTS_PER_TOPIC = 3
 SMOOTHING_WINDOW = 2
@@ -20,32 +18,25 @@ def _smooth(values, window=2):
     return smoothed
 
 
-def _extract_keywords(texts, top_k=5):
-    vectorizer = TfidfVectorizer(
-        stop_words="english",
-        max_features=1000
-    )
-    tfidf = vectorizer.fit_transform(texts)
-    scores = np.asarray(tfidf.sum(axis=0)).ravel()
-    indices = scores.argsort()[::-1][:top_k]
-    features = vectorizer.get_feature_names_out()
-    return [features[i] for i in indices]
+def _add_keywords(topics, top_k=5):
+    """Keywords of every topic from one TF-IDF fit over all topics."""
+    texts = [" ".join(s["text"] for s in topic["segments"]) for topic in topics]
+    engine = KeywordEngine(max_ngram=1).fit(texts)
+    for topic, text in zip(topics, texts):
+        topic["keywords"] = engine.top_terms(text, top_k)
+    return topics
 
 
-def segment(segments: List[Dict]) -> List[Dict]:
+def segment(segments: List[Dict], embeddings: Optional[np.ndarray] = None) -> List[Dict]:
     if not segments:
         return []
 
-    texts = [s["text"] for s in segments]
-    embeddings = _MODEL.encode(texts)
+    if embeddings is None:
+        from ..registry import get_embedder
+        embeddings = get_embedder().encode([s["text"] for s in segments])
 
-    sims = [
-        cosine_similarity(
-            [embeddings[i - 1]],
-            [embeddings[i]]
-        )[0][0]
-        for i in range(1, len(segments))
-    ]
+    unit = normalize(np.asarray(embeddings, dtype=np.float64))
+    sims = np.einsum("ij,ij->i", unit[:-1], unit[1:]).tolist()
 
     sims = _smooth(sims, SMOOTHING_WINDOW)
 
@@ -56,11 +47,9 @@ def segment(segments: List[Dict]) -> List[Dict]:
 
     for i, sim in enumerate(sims, start=1):
         if sim < SIM_THRESHOLD and len(current) >= MIN_SEGMENTS_PER_TOPIC:
-            keywords = _extract_keywords([s["text"] for s in current])
             topics.append({
                 "topic_id": topic_id,
-                "segments": current,
-                "keywords": keywords
+                "segments": current
             })
             topic_id += 1
             current = [segments[i]]
@@ -68,11 +57,9 @@ def segment(segments: List[Dict]) -> List[Dict]:
             current.append(segments[i])
 
     if current:
-        keywords = _extract_keywords([s["text"] for s in current])
         topics.append({
             "topic_id": topic_id,
-            "segments": current,
-            "keywords": keywords
+            "segments": current
         })
 
-    return topics
+    return _add_keywords(topics)
@@ -0,0 +1,105 @@
+from typing import List, Dict, Optional
+import numpy as np
+
+MIN_TOPIC_SIZE = 3
+MAX_TOPIC_SIZE = 40     # longest topic considered, bounds the DP to O(n * k)
+PENALTY_FACTOR = 2.0    # boundary cost, in units of the mean per-item dispersion
+
+
+def _normalize(embeddings: np.ndarray) -> np.ndarray:
+    embeddings = np.asarray(embeddings, dtype=np.float64)
+    norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+    return embeddings / np.maximum(norms, 1e-12)
+
+
+def segment_costs(prefix: np.ndarray, prefix_sq: np.ndarray, starts: np.ndarray, end: int) -> np.ndarray:
+    """
+    Within-segment sum of squared distances to the centroid for [start, end).
+
+    Uses prefix sums, so each cost is O(d) regardless of segment length:
+    SSE = sum ||x||^2 - ||sum x||^2 / length
+    """
+    lengths = end - starts
+    sums = prefix[end] - prefix[starts]
+    return (prefix_sq[end] - prefix_sq[starts]) - np.einsum("ij,ij->i", sums, sums) / lengths
+
+
+def optimal_boundaries(
+    embeddings: np.ndarray,
+    penalty: Optional[float] = None,
+    min_size: int = MIN_TOPIC_SIZE,
+    max_size: int = MAX_TOPIC_SIZE
+) -> List[int]:
+    """
+    Globally optimal topic boundaries by dynamic programming.
+
+    Minimizes the total within-topic dispersion of the (unit-normalized)
+    embeddings plus `penalty` per topic, over all partitions whose topics
+    have between min_size and max_size items.
+
+    Returns:
+        Start indices of every topic after the first
+    """
+    x = _normalize(embeddings)
+    n = len(x)
+    if n < 2 * min_size:
+        return []
+
+    max_size = max(max_size, 2 * min_size - 1)  # keeps every length partitionable
+
+    prefix = np.zeros((n + 1, x.shape[1]))
+    np.cumsum(x, axis=0, out=prefix[1:])
+    prefix_sq = np.zeros(n + 1)
+    np.cumsum(np.einsum("ij,ij->i", x, x), out=prefix_sq[1:])
+
+    if penalty is None:
+        total = segment_costs(prefix, prefix_sq, np.array([0]), n)[0]
+        penalty = PENALTY_FACTOR * total / n
+
+    best = np.full(n + 1, np.inf)
+    best[0] = 0.0
+    back = np.zeros(n + 1, dtype=np.int64)
+
+    for end in range(min_size, n + 1):
+        starts = np.arange(max(0, end - max_size), end - min_size + 1)
+        candidates = best[starts] + segment_costs(prefix, prefix_sq, starts, end) + penalty
+        k = int(np.argmin(candidates))
+        best[end] = candidates[k]
+        back[end] = starts[k]
+
+    boundaries = []
+    end = n
+    while end > 0:
+        start = int(back[end])
+        if start > 0:
+            boundaries.append(start)
+        end = start
+
+    return boundaries[::-1]
+
+
+def segment(
+    segments: List[Dict],
+    penalty: Optional[float] = None,
+    min_topic_size: int = MIN_TOPIC_SIZE,
+    max_topic_size: int = MAX_TOPIC_SIZE,
+    embeddings: Optional[np.ndarray] = None
+) -> List[Dict]:
+
+    if not segments:
+        return []
+
+    if embeddings is None:
+        from ..registry import get_embedder
+        embeddings = get_embedder().encode([s["text"] for s in segments])
+
+    boundaries = optimal_boundaries(embeddings, penalty, min_topic_size, max_topic_size)
+
+    topics = []
+    for topic_id, (start, end) in enumerate(zip([0] + boundaries, boundaries + [len(segments)])):
+        topics.append({
+            "topic_id": topic_id,
+            "segments": segments[start:end]
+        })
+
+    return topics
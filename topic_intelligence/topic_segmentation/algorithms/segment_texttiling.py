@@ -1,68 +1,132 @@
-from typing import List, Dict
-from collections import Counter
-import math
+from typing import List, Dict, Optional
 import re
+import numpy as np
+from sklearn.feature_extraction.text import CountVectorizer
+
+from ..utils.sparse_windows import window_cosine
+
+DEPTH_CUTOFF_STD = 0.5   # boundaries need depth > mean + 0.5 * std of all gap depths
+SMOOTHING_WIDTH = 1      # gap scores are averaged over +-1 neighbours before depth scoring
+
+_STRIP = re.compile(r"[^a-z0-9\s]")
 
 
 def _tokenize(text: str) -> List[str]:
     text = text.lower()
-    text = re.sub(r"[^a-z0-9\s]", "", text)
+    text = _STRIP.sub("", text)
     return text.split()
 
 
-def _cosine(counter_a: Counter, counter_b: Counter) -> float:
-    intersection = set(counter_a) & set(counter_b)
-    numerator = sum(counter_a[x] * counter_b[x] for x in intersection)
+def term_matrix(segments: List[Dict]):
+    """Sparse segment x term count matrix, each segment tokenized once."""
+    vectorizer = CountVectorizer(tokenizer=_tokenize, lowercase=False, token_pattern=None)
+    try:
+        return vectorizer.fit_transform([s["text"] for s in segments])
+    except ValueError:
+        # No tokens at all
+        from scipy.sparse import csr_matrix
+        return csr_matrix((len(segments), 1))
+
+
+def smooth_scores(gap_scores: np.ndarray, width: int = SMOOTHING_WIDTH) -> np.ndarray:
+    """Moving average over +-width gaps, shrinking at the edges."""
+    if width <= 0 or len(gap_scores) == 0:
+        return gap_scores
+    kernel = np.ones(2 * width + 1)
+    totals = np.convolve(gap_scores, kernel, mode="same")
+    counts = np.convolve(np.ones(len(gap_scores)), kernel, mode="same")
+    return totals / counts
+
+
+def depth_scores(gap_scores: np.ndarray) -> np.ndarray:
+    """
+    Depth of every gap: how far its score sits below the nearest peaks,
+    found by climbing left and right while the score keeps rising.
+    """
+    n = len(gap_scores)
+    left_peak = np.empty(n)
+    right_peak = np.empty(n)
+
+    for i in range(n):
+        left_peak[i] = left_peak[i - 1] if i and gap_scores[i - 1] >= gap_scores[i] else gap_scores[i]
+    for i in range(n - 1, -1, -1):
+        right_peak[i] = right_peak[i + 1] if i < n - 1 and gap_scores[i + 1] >= gap_scores[i] else gap_scores[i]
 
-    sum_a = sum(v ** 2 for v in counter_a.values())
-    sum_b = sum(v ** 2 for v in counter_b.values())
-    denominator = math.sqrt(sum_a) * math.sqrt(sum_b)
+    return (left_peak - gap_scores) + (right_peak - gap_scores)
 
-    if denominator == 0:
-        return 0.0
 
-    return numerator / denominator
+def depth_boundaries(
+    gap_scores: np.ndarray,
+    min_topic_size: int,
+    cutoff: Optional[float] = None,
+    raw_scores: Optional[np.ndarray] = None,
+    snap_width: int = SMOOTHING_WIDTH
+) -> List[int]:
+    """
+    Boundaries at local minima whose depth exceeds the cutoff, deepest
+    first, keeping min_topic_size segments between accepted boundaries.
+
+    When gap_scores are smoothed, raw_scores moves each valley back to the
+    lowest unsmoothed gap within snap_width.
+    """
+    n_segments = len(gap_scores) + 1
+    depths = depth_scores(gap_scores)
+    if cutoff is None:
+        cutoff = depths.mean() + DEPTH_CUTOFF_STD * depths.std()
+
+    padded = np.concatenate([[np.inf], gap_scores, [np.inf]])
+    is_valley = (gap_scores <= padded[:-2]) & (gap_scores <= padded[2:])
+    candidates = np.flatnonzero(is_valley & (depths > cutoff) & (depths > 0))
+
+    accepted = []
+    blocked = np.zeros(n_segments + 1, dtype=bool)
+    blocked[:min_topic_size] = True
+    blocked[n_segments - min_topic_size + 1:] = True
+    for gap in candidates[np.argsort(-depths[candidates], kind="stable")]:
+        if raw_scores is not None:
+            lo = max(int(gap) - snap_width, 0)
+            gap = lo + int(np.argmin(raw_scores[lo:int(gap) + snap_width + 1]))
+        boundary = int(gap) + 1
+        if not blocked[boundary]:
+            accepted.append(boundary)
+            blocked[max(boundary - min_topic_size + 1, 0):boundary + min_topic_size] = True
+
+    return sorted(accepted)
 
 
 def segment(
     segments: List[Dict],
     window_size: int = 2,
-    threshold: float = 0.25
+    threshold: float = 0.25,
+    method: str = "threshold",
+    min_topic_size: int = 3
 ) -> List[Dict]:
-   
+    """
+    TextTiling over a sparse term matrix.
+
+    method "threshold" cuts wherever the previous window_size segments and
+    the next segment have cosine below threshold (the original rule);
+    "depth" compares window_size blocks on both sides, smooths the
+    similarity curve and cuts at its deepest valleys (Hearst's depth
+    scores).
+    """
     if len(segments) <= window_size:
         return [{"topic_id": 0, "segments": segments}]
 
-    topics = []
-    topic_id = 0
-    current = {
-        "topic_id": topic_id,
-        "segments": segments[:window_size]
-    }
-
-    for i in range(window_size, len(segments)):
-        left_text = " ".join(
-            s["text"] for s in segments[i - window_size:i]
-        )
-        right_text = segments[i]["text"]
-
-        left_tokens = _tokenize(left_text)
-        right_tokens = _tokenize(right_text)
-
-        sim = _cosine(
-            Counter(left_tokens),
-            Counter(right_tokens)
-        )
-
-        if sim < threshold:
-            topics.append(current)
-            topic_id += 1
-            current = {
-                "topic_id": topic_id,
-                "segments": [segments[i]]
-            }
-        else:
-            current["segments"].append(segments[i])
-
-    topics.append(current)
-    return topics
\ No newline at end of file
+    counts = term_matrix(segments)
+
+    if method == "threshold":
+        sims = window_cosine(counts, window_size, 1)
+        gaps = np.arange(1, len(segments))
+        boundaries = gaps[(gaps >= window_size) & (sims < threshold)].tolist()
+    elif method == "depth":
+        raw = window_cosine(counts, window_size, window_size)
+        boundaries = depth_boundaries(smooth_scores(raw), min_topic_size, raw_scores=raw)
+    else:
+        raise ValueError(f"Unknown TextTiling method '{method}'")
+
+    edges = [0] + boundaries + [len(segments)]
+    return [
+        {"topic_id": topic_id, "segments": segments[start:end]}
+        for topic_id, (start, end) in enumerate(zip(edges, edges[1:]))
+    ]
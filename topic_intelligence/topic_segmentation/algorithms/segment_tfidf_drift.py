@@ -1,56 +1,60 @@
-from typing import List, Dict
+from typing import List, Dict, Optional, Sequence
 import numpy as np
 from sklearn.feature_extraction.text import TfidfVectorizer
-from sklearn.metrics.pairwise import cosine_similarity
+
+from ..utils.sparse_windows import multiscale_window_cosine
+
+
+def drift_similarities(tfidf, window_sizes: Sequence[int]) -> np.ndarray:
+    """
+    Similarity of the window before and after every gap, for each size.
+
+    Cosine ignores scale, so window sums stand in for the window means.
+
+    Returns:
+        Array of shape (len(window_sizes), n - 1); column g - 1 is gap g
+    """
+    return multiscale_window_cosine(tfidf, window_sizes)
 
 
 def segment(
     segments: List[Dict],
     window_size: int = 3,
-    threshold: float = 0.25
+    threshold: float = 0.25,
+    tfidf: Optional[object] = None,
+    window_sizes: Optional[Sequence[int]] = None
 ) -> List[Dict]:
+    """
+    Cut where the TF-IDF centroids of adjacent windows drift apart.
+
+    With window_sizes, every scale is scored in the same pass and a gap
+    is cut when the mean similarity across scales is below threshold.
+    """
+    window_sizes = list(window_sizes) if window_sizes else [window_size]
+    first_gap = min(window_sizes)
 
-    if len(segments) <= window_size:
+    if len(segments) <= first_gap:
         return [{
             "topic_id": 0,
             "segments": segments
         }]
 
-    texts = [s["text"] for s in segments]
-
-    vectorizer = TfidfVectorizer(
-        stop_words="english",
-        max_features=5000
-    )
-
-    tfidf = vectorizer.fit_transform(texts)
-
-    topics = []
-    topic_id = 0
-
-    current = {
-        "topic_id": topic_id,
-        "segments": segments[:window_size]
-    }
-
-    for i in range(window_size, len(segments)):
-        prev_window = tfidf[i - window_size : i]
-        next_window = tfidf[i : i + window_size]
+    if tfidf is None:
+        texts = [s["text"] for s in segments]
 
-        prev_vec = np.asarray(prev_window.mean(axis=0)).reshape(1, -1)
-        next_vec = np.asarray(next_window.mean(axis=0)).reshape(1, -1)
+        vectorizer = TfidfVectorizer(
+            stop_words="english",
+            max_features=5000
+        )
 
-        sim = cosine_similarity(prev_vec, next_vec)[0][0]
+        tfidf = vectorizer.fit_transform(texts)
 
-        if sim < threshold:
-            topics.append(current)
-            topic_id += 1
-            current = {
-                "topic_id": topic_id,
-                "segments": [segments[i]]
-            }
-        else:
-            current["segments"].append(segments[i])
+    sims = drift_similarities(tfidf, window_sizes).mean(axis=0)
+    gaps = np.arange(1, len(segments))
+    boundaries = gaps[(gaps >= first_gap) & (sims < threshold)].tolist()
 
-    topics.append(current)
-    return topics
+    edges = [0] + boundaries + [len(segments)]
+    return [
+        {"topic_id": topic_id, "segments": segments[start:end]}
+        for topic_id, (start, end) in enumerate(zip(edges, edges[1:]))
+    ]
@@ -0,0 +1,123 @@
+"""
+feature_track.py — Per-Sentence Feature Track
+---------------------------------------------
+Sentence-level time series for the timeline overlays: sentiment, episode
+keyword hits and speaking rate, computed in one batched pass over the
+sentences of an episode and stored as parallel columns (one list per
+feature) in segmented_output.json under "sentence_track".
+
+Sentences split from one merged Whisper segment share its timestamps;
+the segment's span is divided between them in proportion to their word
+counts, and the speaking rate is the segment's words per minute.
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sklearn.feature_extraction.text import CountVectorizer
+
+from .keywords import tokenize
+from .sentiment import score_texts
+
+# =========================
+# CONFIG
+# =========================
+
+TRACK_COLUMNS = ("start", "end", "topic_id", "sentiment", "keyword_hits", "words_per_minute")
+NO_TOPIC = -1  # sentences of groups dropped as too short
+
+
+def sentence_times(timestamps: Sequence[Tuple[float, float]], word_counts: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Start/end of every sentence and the speaking rate of its segment.
+
+    Args:
+        timestamps: (start, end) per sentence, shared by sentences of one segment
+        word_counts: Words per sentence
+
+    Returns:
+        Tuple of (start, end, words_per_minute) arrays
+    """
+    n = len(timestamps)
+    if n == 0:
+        empty = np.zeros(0)
+        return empty, empty, empty
+
+    spans = np.asarray(timestamps, dtype=np.float64).reshape(n, 2)
+    words = np.asarray(word_counts, dtype=np.float64)
+
+    # Runs of consecutive sentences with the same timestamps form one segment
+    new_run = np.ones(n, dtype=bool)
+    new_run[1:] = np.any(spans[1:] != spans[:-1], axis=1)
+    run = np.cumsum(new_run) - 1
+
+    run_words = np.bincount(run, weights=words)
+    cumulative = np.cumsum(words)
+    run_offset = (cumulative - words)[new_run]  # words before each run
+    before = cumulative - words - run_offset[run]
+
+    duration = spans[:, 1] - spans[:, 0]
+    total = run_words[run]
+    share_start = np.divide(before, total, out=np.zeros(n), where=total > 0)
+    share_end = np.divide(before + words, total, out=np.ones(n), where=total > 0)
+
+    rate = np.divide(total * 60.0, duration, out=np.zeros(n), where=duration > 0)
+    return spans[:, 0] + share_start * duration, spans[:, 0] + share_end * duration, rate
+
+
+def keyword_hits(texts: Sequence[str], keywords: Sequence[str]) -> np.ndarray:
+    """Occurrences of the episode keywords (1-2 word phrases) in every text."""
+    vocabulary = sorted({k.lower() for k in keywords if k.strip()})
+    if not vocabulary or not len(texts):
+        return np.zeros(len(texts), dtype=np.int64)
+    ngrams = max(len(k.split()) for k in vocabulary)
+    vectorizer = CountVectorizer(
+        tokenizer=tokenize,
+        token_pattern=None,
+        ngram_range=(1, ngrams),
+        vocabulary=vocabulary
+    )
+    return np.asarray(vectorizer.transform(texts).sum(axis=1)).ravel().astype(np.int64)
+
+
+def build_sentence_track(
+    sentences: Sequence[str],
+    timestamps: Sequence[Tuple[float, float]],
+    topic_groups: Sequence[Tuple[int, Sequence[int]]],
+    keywords: Sequence[str],
+    cleaned: Optional[Sequence[str]] = None
+) -> Dict[str, List]:
+    """
+    Columnar per-sentence features of an episode.
+
+    Args:
+        sentences: All sentences in transcript order
+        timestamps: (start, end) per sentence
+        topic_groups: (topic_id, sentence indices) of every kept topic
+        keywords: Keywords of all topics
+        cleaned: Filler-free sentences to score (defaults to sentences)
+
+    Returns:
+        Dict of equal-length lists, keyed by TRACK_COLUMNS
+    """
+    cleaned = sentences if cleaned is None else cleaned
+    word_counts = np.fromiter((len(s.split()) for s in sentences), dtype=np.int64, count=len(sentences))
+    start, end, rate = sentence_times(timestamps, word_counts)
+
+    topic_id = np.full(len(sentences), NO_TOPIC, dtype=np.int64)
+    for tid, ids in topic_groups:
+        topic_id[list(ids)] = tid
+
+    return {
+        "start": np.round(start, 2).tolist(),
+        "end": np.round(end, 2).tolist(),
+        "topic_id": topic_id.tolist(),
+        "sentiment": np.round(score_texts(cleaned), 3).tolist(),
+        "keyword_hits": keyword_hits(cleaned, keywords).tolist(),
+        "words_per_minute": np.round(rate, 1).tolist()
+    }
+
+
+def track_arrays(track: Dict[str, List]) -> Dict[str, np.ndarray]:
+    """Columns of a stored sentence track as numpy arrays."""
+    return {column: np.asarray(track.get(column, [])) for column in TRACK_COLUMNS}
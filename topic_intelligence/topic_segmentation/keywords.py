@@ -1,9 +1,20 @@
 
 import re
+from typing import Dict, List, Optional, Sequence
+
+import numpy as np
 from sklearn.feature_extraction.text import TfidfVectorizer
 
+try:
+    from topic_intelligence.indexing.idf_store import load_idf_store, reweight_tfidf
+    USE_CORPUS_IDF = True
+except ImportError:
+    USE_CORPUS_IDF = False
+
 MAX_KEYWORDS = 6
 MIN_KEYWORDS = 3
+MAX_PHRASES = 50  # candidate phrases per topic, as max_features in extract_phrases
+MIN_CORPUS_DOCUMENTS = 20  # corpus IDF for single-text keywords only once the store is this large
 
 STOPWORDS = {
     "the","a","an","this","that","these","those",
@@ -34,6 +45,11 @@ def clean_keyword(word):
         return False
     return True
 
+def document_terms(texts: Sequence[str], max_ngram: int = 2) -> List[List[str]]:
+    """Keyword phrases (1..max_ngram words) of each text, as counted in the corpus IDF store."""
+    analyzer = TfidfVectorizer(tokenizer=tokenize, token_pattern=None, ngram_range=(1, max_ngram)).build_analyzer()
+    return [analyzer(text) for text in texts]
+
 def extract_phrases(text, max_ngram=2):
     try:
         vectorizer = TfidfVectorizer(
@@ -51,9 +67,86 @@ def extract_phrases(text, max_ngram=2):
         return {}
 
 
-def extract_keywords(segments, summary_text=None):
-    
-        
+class KeywordEngine:
+    """
+    Episode-level TF-IDF keyword scorer.
+
+    Vocabulary and IDF are fitted once over the texts of all topics of an
+    episode, so each topic is a row of one sparse matrix and phrases that
+    occur in every topic are down-weighted instead of dominating. With an
+    IDFStore the document frequencies of all indexed episodes are added,
+    so phrases common to the whole catalogue are down-weighted too.
+
+    Args:
+        max_ngram: Longest phrase in words
+        max_phrases: Candidate phrases returned per text
+        idf_store: Corpus document frequencies (indexing.idf_store)
+        episode_id: Episode being scored, to avoid counting it twice when
+            the store already contains it
+    """
+
+    def __init__(
+        self,
+        max_ngram: int = 2,
+        max_phrases: int = MAX_PHRASES,
+        idf_store=None,
+        episode_id: Optional[str] = None
+    ):
+        self.max_phrases = max_phrases
+        self.idf_store = idf_store
+        self.episode_id = episode_id
+        self.vectorizer = TfidfVectorizer(
+            tokenizer=tokenize,
+            token_pattern=None,
+            ngram_range=(1, max_ngram)
+        )
+        self.matrix = None
+        self.features = None
+        self._rows: Dict[str, int] = {}
+
+    def fit(self, texts: Sequence[str]) -> "KeywordEngine":
+        """Fit vocabulary and IDF over all topic texts of the episode."""
+        texts = list(texts)
+        try:
+            self.matrix = self.vectorizer.fit_transform(texts)
+        except ValueError:
+            # No usable tokens in any topic
+            self.matrix = None
+            return self
+        if self.idf_store is not None:
+            in_store = self.episode_id is not None and self.idf_store.has_episode(self.episode_id)
+            self.matrix = reweight_tfidf(self.vectorizer, self.matrix, self.idf_store, in_store)
+        self.features = self.vectorizer.get_feature_names_out()
+        self._rows = {text: i for i, text in enumerate(texts)}
+        return self
+
+    def row(self, text: str):
+        """Sparse TF-IDF row of a topic text (fitted rows are reused)."""
+        if text in self._rows:
+            return self.matrix[self._rows[text]]
+        return self.vectorizer.transform([text])
+
+    def phrase_scores(self, text: str) -> Dict[str, float]:
+        """Top phrases of one text with their scores, best first."""
+        if self.matrix is None:
+            return {}
+        row = self.row(text)
+        # Highest score first, ties in vocabulary order
+        order = np.lexsort((row.indices, -row.data))[:self.max_phrases]
+        return {self.features[row.indices[j]]: float(row.data[j]) for j in order}
+
+    def top_terms(self, text: str, top_k: int) -> List[str]:
+        return list(self.phrase_scores(text))[:top_k]
+
+
+def extract_keywords(segments, summary_text=None, engine: Optional[KeywordEngine] = None):
+    """
+    Pick MAX_KEYWORDS keywords for a topic.
+
+    With an episode-fitted KeywordEngine the phrases are scored against the
+    other topics; without one the text is scored on its own, against the
+    corpus IDF store once it holds MIN_CORPUS_DOCUMENTS documents.
+    """
     if isinstance(segments, str):
         full_text = segments
     else:
@@ -62,7 +155,12 @@ def extract_keywords(segments, summary_text=None):
     if not full_text.strip():
         return ["general topic", "discussion", "content"]
     
-    scores = extract_phrases(full_text, max_ngram=2)
+    if engine is None and USE_CORPUS_IDF:
+        store = load_idf_store()
+        if store.n_documents >= MIN_CORPUS_DOCUMENTS:
+            engine = KeywordEngine(idf_store=store).fit([full_text])
+
+    scores = engine.phrase_scores(full_text) if engine is not None else extract_phrases(full_text, max_ngram=2)
     
     if not scores:
         words = tokenize(full_text)
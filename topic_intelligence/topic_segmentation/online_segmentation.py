@@ -0,0 +1,182 @@
+"""
+online_segmentation.py — Incremental Topic Segmentation
+-------------------------------------------------------
+Streaming counterpart of `segment_topics` for live ingestion. Whisper
+segments are fed as they arrive; short segments are merged, split into
+sentences and grouped with the same anchor/definition rules as the batch
+segmenter. A topic is finalized (and enriched with `build_topic`) as soon
+as its boundary is confirmed, and only the open group is kept in memory,
+so per-update cost and memory stay bounded however long the episode runs.
+
+Fed the complete transcript followed by `flush()`, it produces the same
+topic boundaries and ids as the batch path in topic_segmentation_core.main.
+Sentences are mapped back to the Whisper segments they were merged from
+rather than searched across the whole episode.
+"""
+
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+from .concept_anchors import has_concept_anchor
+from .definition_filter import is_definition
+from .topic_segmentation_core import (
+    build_topic,
+    split_sentences,
+    MIN_DEF_SENTENCES,
+    MAX_SENTENCES_PER_TOPIC
+)
+
+# =========================
+# CONFIG
+# =========================
+
+MERGE_MIN_CHARS = 120   # same threshold as merge_short_segments
+MIN_TOPIC_SENTENCES = 3  # groups below this are dropped, as in main()
+
+
+class OnlineTopicSegmenter:
+    """
+    Incremental topic segmenter with bounded state.
+
+    State held between updates:
+        - the merge buffer (segments until it reaches MERGE_MIN_CHARS)
+        - the open group's sentences, timestamps and source segments
+        - the definition count of the open group
+
+    Boundaries only depend on the incoming sentence and these counters;
+    the batch segmenter's adjacent-sentence similarity does not affect its
+    grouping, so no embeddings need to be kept.
+    """
+
+    def __init__(
+        self,
+        topic_builder: Callable = build_topic,
+        merge_min_chars: int = MERGE_MIN_CHARS,
+        min_topic_sentences: int = MIN_TOPIC_SENTENCES
+    ):
+        self.topic_builder = topic_builder
+        self.merge_min_chars = merge_min_chars
+        self.min_topic_sentences = min_topic_sentences
+
+        self._buffer: Optional[Dict] = None
+        self._buffer_sources: List[Dict] = []
+
+        self._sentences: List[str] = []
+        self._timestamps: List[Tuple[float, float]] = []
+        self._sources: List[Dict] = []
+        self._def_count = 0
+
+        self.groups_closed = 0   # topic ids count every closed group, like the batch path
+        self.sentences_seen = 0
+
+    # -------------------------
+    # Public API
+    # -------------------------
+
+    def add_segment(self, segment: Dict) -> List[Dict]:
+        """
+        Feed one Whisper segment (needs start, end, translation).
+
+        Returns:
+            Topics finalized by this update (usually empty)
+        """
+        if self._buffer is None:
+            self._buffer = segment.copy()
+            self._buffer_sources = [segment]
+            return []
+
+        if len(self._buffer["translation"]) < self.merge_min_chars:
+            self._buffer["translation"] += " " + segment["translation"]
+            self._buffer["end"] = segment["end"]
+            self._buffer_sources.append(segment)
+            return []
+
+        merged, sources = self._buffer, self._buffer_sources
+        self._buffer = segment.copy()
+        self._buffer_sources = [segment]
+        return self._add_merged(merged, sources)
+
+    def add_segments(self, segments: Iterable[Dict]) -> List[Dict]:
+        """Feed several segments; returns all topics they finalized."""
+        topics = []
+        for segment in segments:
+            topics.extend(self.add_segment(segment))
+        return topics
+
+    def flush(self) -> List[Dict]:
+        """End of stream: emit the merge buffer and close the open group."""
+        topics = []
+        if self._buffer is not None:
+            merged, sources = self._buffer, self._buffer_sources
+            self._buffer, self._buffer_sources = None, []
+            topics.extend(self._add_merged(merged, sources))
+
+        topic = self._close_group()
+        if topic:
+            topics.append(topic)
+        return topics
+
+    def open_group(self) -> Dict:
+        """Snapshot of the not-yet-finalized group (for live previews)."""
+        return {
+            "sentences": list(self._sentences),
+            "start": self._timestamps[0][0] if self._timestamps else None,
+            "end": self._timestamps[-1][1] if self._timestamps else None
+        }
+
+    # -------------------------
+    # Internals
+    # -------------------------
+
+    def _add_merged(self, merged: Dict, sources: List[Dict]) -> List[Dict]:
+        topics = []
+        for sentence in split_sentences(merged["translation"]):
+            topic = self._add_sentence(sentence, (merged["start"], merged["end"]), sources)
+            if topic:
+                topics.append(topic)
+        return topics
+
+    def _add_sentence(self, sentence: str, timestamp: Tuple[float, float], sources: List[Dict]) -> Optional[Dict]:
+        first = self.sentences_seen == 0
+        self.sentences_seen += 1
+        is_def = is_definition(sentence)
+
+        topic = None
+        if not first:
+            anchor = has_concept_anchor(sentence)
+            if (anchor and self._def_count >= MIN_DEF_SENTENCES) or len(self._sentences) >= MAX_SENTENCES_PER_TOPIC:
+                topic = self._close_group()
+
+        if not self._sentences:
+            self._def_count = 1 if is_def else 0
+        elif is_def:
+            self._def_count += 1
+
+        self._sentences.append(sentence)
+        self._timestamps.append(timestamp)
+        # Sentences of one merged segment share its sources
+        for source in sources:
+            if all(source is not known for known in self._sources):
+                self._sources.append(source)
+
+        return topic
+
+    def _close_group(self) -> Optional[Dict]:
+        if not self._sentences:
+            return None
+
+        topic_id = self.groups_closed
+        self.groups_closed += 1
+
+        topic = None
+        if len(self._sentences) >= self.min_topic_sentences:
+            topic = self.topic_builder(
+                topic_id,
+                list(range(len(self._sentences))),
+                self._sentences,
+                self._timestamps,
+                self._sources
+            )
+
+        self._sentences, self._timestamps, self._sources = [], [], []
+        self._def_count = 0
+        return topic
@@ -0,0 +1,416 @@
+"""
+registry.py — Topic Segmentation Algorithm Registry
+---------------------------------------------------
+One interface for every sentence-level segmenter in this package.
+
+Input:  SegmentationFeatures — the transcript sentences plus features
+        computed once on first use and shared by all algorithms
+        (sentence embeddings, TF-IDF matrices, adjacent similarities,
+        anchor/definition flags).
+Output: SegmentationResult — boundaries (start index of every topic after
+        the first) and one confidence in [0, 1] per boundary.
+
+Algorithms are registered by name with @register and selected with
+run_algorithm(name, features); benchmark() runs several side by side on
+the same features so timings only measure the boundary search.
+"""
+
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from sklearn.feature_extraction.text import TfidfVectorizer
+
+from .discourse_cleaner import clean_text
+from .sentence_patterns import SentenceFlags, sentence_flags
+from .segment_adaptive_confidence import compute_adaptive_threshold
+
+# =========================
+# CONFIG
+# =========================
+
+DEFAULT_ALGORITHM = "anchor_definition"
+DEFAULT_LANGUAGE = "en"
+EMBED_MODEL = "all-MiniLM-L6-v2"
+
+_embedder = None
+_embedder_lock = threading.Lock()
+
+
+def get_embedder():
+    """
+    Sentence embedding model shared by every algorithm, loaded on first use.
+
+    Algorithms called standalone (without precomputed embeddings) use it
+    too, so an ensemble run never holds more than one copy of the model.
+    """
+    global _embedder
+    if _embedder is None:
+        with _embedder_lock:
+            if _embedder is None:
+                from sentence_transformers import SentenceTransformer
+                _embedder = SentenceTransformer(EMBED_MODEL)
+    return _embedder
+
+
+class SegmentationFeatures:
+    """
+    Sentences of one transcript and their lazily computed, shared features.
+
+    Args:
+        sentences: Sentence texts in transcript order
+        timestamps: (start, end) per sentence
+        languages: Language code per sentence
+        embeddings: Precomputed sentence embeddings (skips the encoder)
+    """
+
+    def __init__(
+        self,
+        sentences: Sequence[str],
+        timestamps: Optional[Sequence[Tuple[float, float]]] = None,
+        languages: Optional[Sequence[str]] = None,
+        embeddings: Optional[np.ndarray] = None
+    ):
+        self.sentences = list(sentences)
+        self.timestamps = list(timestamps) if timestamps is not None else [(0.0, 0.0)] * len(self.sentences)
+        self.languages = list(languages) if languages is not None else [DEFAULT_LANGUAGE] * len(self.sentences)
+
+        self._cleaned = None
+        self._flags = None
+        self._embeddings = None if embeddings is None else np.asarray(embeddings)
+        self._unit_embeddings = None
+        self._adjacent_similarity = None
+        self._tfidf = {}
+        self._items = None
+        # Algorithms may run concurrently on one instance (segment_ensemble)
+        self._lock = threading.RLock()
+
+    def __len__(self):
+        return len(self.sentences)
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
+
+    @property
+    def cleaned(self) -> List[str]:
+        """Sentences with discourse fillers removed."""
+        with self._lock:
+            if self._cleaned is None:
+                self._cleaned = [clean_text(s) for s in self.sentences]
+        return self._cleaned
+
+    @property
+    def flags(self) -> List[SentenceFlags]:
+        """Anchor/definition/example flags of every sentence."""
+        with self._lock:
+            if self._flags is None:
+                self._flags = [sentence_flags(s) for s in self.sentences]
+        return self._flags
+
+    @property
+    def embeddings(self) -> np.ndarray:
+        """
+        Sentence embeddings, encoded once.
+
+        The raw sentences are encoded, as every algorithm does when it
+        runs standalone, so going through the registry does not move
+        their boundaries.
+        """
+        with self._lock:
+            if self._embeddings is None:
+                self._embeddings = np.asarray(get_embedder().encode(self.sentences))
+        return self._embeddings
+
+    @property
+    def has_embeddings(self) -> bool:
+        """Embeddings were supplied or already encoded (reading them is free)."""
+        return self._embeddings is not None
+
+    @property
+    def unit_embeddings(self) -> np.ndarray:
+        with self._lock:
+            if self._unit_embeddings is None:
+                emb = self.embeddings.astype(np.float64)
+                norms = np.linalg.norm(emb, axis=1, keepdims=True)
+                self._unit_embeddings = emb / np.maximum(norms, 1e-12)
+        return self._unit_embeddings
+
+    @property
+    def adjacent_similarity(self) -> np.ndarray:
+        """Cosine similarity of sentence i-1 and i, for i = 1..n-1."""
+        with self._lock:
+            if self._adjacent_similarity is None:
+                unit = self.unit_embeddings
+                self._adjacent_similarity = np.einsum("ij,ij->i", unit[:-1], unit[1:])
+        return self._adjacent_similarity
+
+    def tfidf(self, ngram_range: Tuple[int, int] = (1, 1)):
+        """Sparse TF-IDF matrix of the sentences, fitted once per n-gram range."""
+        with self._lock:
+            if ngram_range not in self._tfidf:
+                vectorizer = TfidfVectorizer(stop_words="english", ngram_range=ngram_range)
+                try:
+                    self._tfidf[ngram_range] = vectorizer.fit_transform(self.sentences)
+                except ValueError:
+                    # Only stop words: every row is empty
+                    from scipy.sparse import csr_matrix
+                    self._tfidf[ngram_range] = csr_matrix((len(self.sentences), 1))
+        return self._tfidf[ngram_range]
+
+    def items(self) -> List[Dict]:
+        """Sentences as segment-like dicts for the segment(...) style algorithms."""
+        with self._lock:
+            if self._items is None:
+                self._items = [
+                    {
+                        "segment_id": i,
+                        "sentence_index": i,
+                        "text": sentence,
+                        "start": start,
+                        "end": end,
+                        "language": language
+                    }
+                    for i, (sentence, (start, end), language)
+                    in enumerate(zip(self.sentences, self.timestamps, self.languages))
+                ]
+        return self._items
+
+
+@dataclass
+class SegmentationResult:
+    algorithm: str
+    boundaries: List[int]
+    confidences: List[float] = field(default_factory=list)
+    n_sentences: int = 0
+    seconds: float = 0.0
+
+    def groups(self) -> List[List[int]]:
+        """Sentence indices of every topic."""
+        edges = [0] + self.boundaries + [self.n_sentences]
+        return [list(range(a, b)) for a, b in zip(edges, edges[1:]) if b > a]
+
+    def boundary_after(self, group_index: int) -> Optional[float]:
+        """Confidence of the boundary that closes a group (None for the last)."""
+        if group_index < len(self.confidences):
+            return self.confidences[group_index]
+        return None
+
+
+# =========================
+# REGISTRY
+# =========================
+
+ALGORITHMS: Dict[str, Callable] = {}
+
+
+def register(name: str):
+    """
+    Register fn(features, **params) -> boundaries or (boundaries, confidences).
+    """
+    def decorator(fn):
+        ALGORITHMS[name] = fn
+        return fn
+    return decorator
+
+
+def available_algorithms() -> List[str]:
+    return list(ALGORITHMS)
+
+
+def get_algorithm(name: str) -> Callable:
+    if name not in ALGORITHMS:
+        raise ValueError(
+            f"Unknown segmentation algorithm '{name}'. "
+            f"Choose from: {', '.join(ALGORITHMS)}"
+        )
+    return ALGORITHMS[name]
+
+
+def boundary_confidences(features: SegmentationFeatures, boundaries: Sequence[int]) -> List[float]:
+    """
+    Confidence of each boundary from the similarity dip it sits on.
+
+    Same scoring as segment_adaptive_confidence: boundaries whose adjacent
+    similarity falls below the transcript's adaptive threshold
+    (mean - std) score (threshold - sim) / threshold, the rest 0.
+    """
+    if not boundaries:
+        return []
+
+    sims = features.adjacent_similarity
+    threshold = compute_adaptive_threshold(sims.tolist())
+    at_boundary = sims[np.asarray(boundaries) - 1]
+    if threshold <= 0:
+        scores = (at_boundary < threshold).astype(float)
+    else:
+        scores = np.clip((threshold - at_boundary) / threshold, 0.0, 1.0)
+    return [round(float(s), 3) for s in scores]
+
+
+def run_algorithm(name: str, features: SegmentationFeatures, **params) -> SegmentationResult:
+    """
+    Segment the features with a registered algorithm.
+
+    Args:
+        name: Registered algorithm name
+        features: Shared sentence features
+        **params: Algorithm-specific parameters
+
+    Returns:
+        SegmentationResult with sorted boundaries and their confidences
+    """
+    fn = get_algorithm(name)
+    n = len(features)
+    if n == 0:
+        return SegmentationResult(name, [], [], 0)
+
+    start = time.perf_counter()
+    output = fn(features, **params)
+    seconds = time.perf_counter() - start
+
+    boundaries, confidences = output if isinstance(output, tuple) else (output, None)
+    boundaries = sorted({int(b) for b in boundaries if 0 < b < n})
+    if confidences is None:
+        confidences = boundary_confidences(features, boundaries)
+
+    return SegmentationResult(name, boundaries, list(confidences), n, seconds)
+
+
+def benchmark(
+    features: SegmentationFeatures,
+    names: Optional[Sequence[str]] = None
+) -> Dict[str, SegmentationResult]:
+    """
+    Run several algorithms on the same features.
+
+    Embeddings and TF-IDF are computed before timing starts, so the
+    reported seconds compare the boundary searches only.
+    """
+    features.adjacent_similarity
+    features.tfidf()
+
+    results = {}
+    for name in names or available_algorithms():
+        try:
+            results[name] = run_algorithm(name, features)
+        except ImportError as e:
+            print(f"[WARNING] Skipping {name}: {e}")
+    return results
+
+
+# =========================
+# ADAPTERS
+# =========================
+
+def _boundaries_from_topics(topics: List[Dict]) -> List[int]:
+    """Start indices of topics 2..k from segment(...) style output."""
+    return [topic["segments"][0]["sentence_index"] for topic in topics[1:] if topic["segments"]]
+
+
+@register("anchor_definition")
+def _anchor_definition(features: SegmentationFeatures, min_def_sentences=None, max_sentences=None):
+    """Built-in rule: cut at a concept anchor once enough definitions were seen."""
+    from .topic_segmentation_core import MIN_DEF_SENTENCES, MAX_SENTENCES_PER_TOPIC
+    min_def = MIN_DEF_SENTENCES if min_def_sentences is None else min_def_sentences
+    max_len = MAX_SENTENCES_PER_TOPIC if max_sentences is None else max_sentences
+
+    flags = features.flags
+    boundaries = []
+    current_len = 1
+    def_count = 1 if flags[0].is_definition else 0
+
+    for i in range(1, len(flags)):
+        is_def = flags[i].is_definition
+        if (flags[i].anchor and def_count >= min_def) or current_len >= max_len:
+            boundaries.append(i)
+            current_len = 1
+            def_count = 1 if is_def else 0
+        else:
+            current_len += 1
+            if is_def:
+                def_count += 1
+
+    return boundaries
+
+
+@register("embedding_dynamic")
+def _embedding_dynamic(features: SegmentationFeatures, **params):
+    from .algorithms.segment_embedding_dynamic import segment
+    return _boundaries_from_topics(segment(features.items(), embeddings=features.embeddings, **params))
+
+
+@register("hybrid_engine")
+def _hybrid_engine(features: SegmentationFeatures, **params):
+    from .algorithms.segment_hybrid_engine import segment
+    return _boundaries_from_topics(segment(features.items(), embeddings=features.embeddings, **params))
+
+
+@register("texttiling")
+def _texttiling(features: SegmentationFeatures, **params):
+    from .algorithms.segment_texttiling import segment
+    return _boundaries_from_topics(segment(features.items(), **params))
+
+
+@register("texttiling_depth")
+def _texttiling_depth(features: SegmentationFeatures, **params):
+    from .algorithms.segment_texttiling import segment
+    params.setdefault("window_size", 3)
+    return _boundaries_from_topics(segment(features.items(), method="depth", **params))
+
+
+@register("tfidf_drift")
+def _tfidf_drift(features: SegmentationFeatures, **params):
+    from .algorithms.segment_tfidf_drift import segment
+    return _boundaries_from_topics(segment(features.items(), tfidf=features.tfidf(), **params))
+
+
+@register("tfidf_drift_multiscale")
+def _tfidf_drift_multiscale(features: SegmentationFeatures, **params):
+    from .algorithms.segment_tfidf_drift import segment
+    params.setdefault("window_sizes", (2, 3, 5))
+    return _boundaries_from_topics(segment(features.items(), tfidf=features.tfidf(), **params))
+
+
+@register("optimal_partition")
+def _optimal_partition(features: SegmentationFeatures, **params):
+    from .algorithms.segment_optimal_partition import segment
+    return _boundaries_from_topics(segment(features.items(), embeddings=features.embeddings, **params))
+
+
+@register("baseline_similarity")
+def _baseline_similarity(features: SegmentationFeatures, **params):
+    from .segment_baseline_similarity import segment_by_similarity
+    return _boundaries_from_topics(segment_by_similarity(features.items(), features.embeddings, **params))
+
+
+@register("embedding_drop")
+def _embedding_drop(features: SegmentationFeatures, **params):
+    from .segment_embedding_drop import segment_embedding_drop
+    return _boundaries_from_topics(segment_embedding_drop(features.items(), embeddings=features.embeddings, **params))
+
+
+@register("mixed_language")
+def _mixed_language(features: SegmentationFeatures, **params):
+    from .segment_mixed_language import segment_mixed_language
+    return _boundaries_from_topics(segment_mixed_language(features.items(), embeddings=features.embeddings, **params))
+
+
+@register("tfidf_lexical")
+def _tfidf_lexical(features: SegmentationFeatures, **params):
+    from .segment_tfidf_lexical import segment_tfidf_lexical
+    return _boundaries_from_topics(segment_tfidf_lexical(features.items(), tfidf=features.tfidf((1, 2)), **params))
+
+
+@register("hybrid_consensus")
+def _hybrid_consensus(features: SegmentationFeatures, **params):
+    from .segment_ensemble import run_ensemble
+    ensemble = run_ensemble(features, **params)
+    return ensemble["boundaries"], ensemble["confidences"]
@@ -6,6 +6,10 @@ from pathlib import Path
 # Get the directory where this script is located
 SCRIPT_DIR = Path(__file__).resolve().parent
 PROJECT_ROOT = SCRIPT_DIR.parent.parent
+if str(PROJECT_ROOT) not in sys.path:
+    sys.path.insert(0, str(PROJECT_ROOT))
+
+from topic_intelligence.topic_segmentation.registry import available_algorithms, DEFAULT_ALGORITHM
 
 def run_segmentation(input_json: str, algorithm: str):
     # Run as a module to allow relative imports
@@ -25,9 +29,10 @@ def run_segmentation(input_json: str, algorithm: str):
 if __name__ == "__main__":
     if len(sys.argv) < 2:
         print("Usage: python run_segmentation.py <pipeline_output.json> [algorithm]")
+        print(f"       algorithm: {', '.join(available_algorithms())} (default: {DEFAULT_ALGORITHM})")
         sys.exit(1)
 
     input_json = sys.argv[1]
-    algorithm = sys.argv[2] if len(sys.argv) > 2 else "baseline_similarity"
+    algorithm = sys.argv[2] if len(sys.argv) > 2 else DEFAULT_ALGORITHM
 
     run_segmentation(input_json, algorithm)
@@ -1,6 +1,5 @@
 from typing import List, Dict
 import numpy as np
-from sklearn.metrics.pairwise import cosine_similarity
 
 MIN_TOPIC_DURATION = 25.0
 SIMILARITY_DROP_THRESHOLD = 0.15
@@ -15,7 +14,10 @@ def segment_by_similarity(
     if not segments or len(segments) <= 1:
         return _build_single_topic(segments)
 
-    similarities = cosine_similarity(embeddings[:-1], embeddings[1:]).flatten()
+    # Row-wise: similarity of each segment with the next one
+    embeddings = np.asarray(embeddings, dtype=np.float64)
+    norms = np.maximum(np.linalg.norm(embeddings, axis=1), 1e-12)
+    similarities = np.einsum("ij,ij->i", embeddings[:-1], embeddings[1:]) / (norms[:-1] * norms[1:])
 
     boundaries = []
     current_topic_start = segments[0]["start"]
@@ -1,32 +1,23 @@
-from typing import List, Dict
+from typing import List, Dict, Optional
 import numpy as np
-from sentence_transformers import SentenceTransformer
-from sklearn.metrics.pairwise import cosine_similarity
-
-
-_MODEL = SentenceTransformer("all-MiniLM-L6-v2")
+from sklearn.preprocessing import normalize
 
 
 def segment_embedding_drop(
     sentences: List[Dict],
-    drop_threshold: float = 0.15
+    drop_threshold: float = 0.15,
+    embeddings: Optional[np.ndarray] = None
 ) -> List[Dict]:
 
     if not sentences:
         return []
 
-    texts = [s["text"] for s in sentences]
-    embeddings = _MODEL.encode(texts)
-
-    similarities = []
-    for i in range(1, len(embeddings)):
-        sim = cosine_similarity(
-            [embeddings[i - 1]],
-            [embeddings[i]]
-        )[0][0]
-        similarities.append(sim)
+    if embeddings is None:
+        from .registry import get_embedder
+        embeddings = get_embedder().encode([s["text"] for s in sentences])
 
-    similarities = np.array(similarities)
+    unit = normalize(np.asarray(embeddings, dtype=np.float64))
+    similarities = np.einsum("ij,ij->i", unit[:-1], unit[1:])
 
     topics = []
     topic_id = 0
@@ -0,0 +1,152 @@
+"""
+segment_ensemble.py — Parallel Ensemble Segmentation
+----------------------------------------------------
+Runs several registered segmenters on one set of shared features and
+combines them with segment_hybrid_consensus in a single call.
+
+Embeddings and TF-IDF are computed once before the members start; the
+members then run concurrently on those features. Short transcripts use
+a thread pool; long ones a process pool, since several members still
+loop in Python and would serialize on the GIL (each worker process
+receives the precomputed features once). The result carries the
+consensus topics, the vote count of every proposed boundary, the
+adaptive confidence of each consensus boundary and the timing of every
+member.
+"""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, List, Optional, Sequence
+
+from .registry import SegmentationFeatures, SegmentationResult, run_algorithm
+from .segment_hybrid_consensus import segment_hybrid_consensus
+from .segment_adaptive_confidence import (
+    compute_adaptive_threshold,
+    score_boundaries,
+    apply_confidence_to_topics
+)
+
+# =========================
+# CONFIG
+# =========================
+
+DEFAULT_MEMBERS = (
+    "embedding_dynamic",
+    "embedding_drop",
+    "optimal_partition",
+    "texttiling",
+    "tfidf_drift"
+)
+MIN_VOTES = 2
+PROCESS_MIN_SENTENCES = 1000  # below this, process start-up costs more than it saves
+
+_worker_features: Optional[SegmentationFeatures] = None
+
+
+def _init_worker(features: SegmentationFeatures) -> None:
+    global _worker_features
+    _worker_features = features
+
+
+def _run_in_worker(name: str) -> SegmentationResult:
+    return run_algorithm(name, _worker_features)
+
+
+def _member_topics(result: SegmentationResult, items: List[Dict]) -> List[Dict]:
+    """Member boundaries as topics, the input format of segment_hybrid_consensus."""
+    return [
+        {"topic_id": topic_id, "segments": [items[i] for i in group]}
+        for topic_id, group in enumerate(result.groups())
+    ]
+
+
+def prepare_features(features: SegmentationFeatures, members: Sequence[str]) -> float:
+    """Compute the shared features up front; returns the seconds spent."""
+    start = time.perf_counter()
+    features.items()
+    features.adjacent_similarity
+    features.tfidf()
+    if "tfidf_lexical" in members:
+        features.tfidf((1, 2))
+    return time.perf_counter() - start
+
+
+def run_ensemble(
+    features: SegmentationFeatures,
+    members: Sequence[str] = DEFAULT_MEMBERS,
+    min_votes: int = MIN_VOTES,
+    workers: Optional[int] = None,
+    executor: str = "auto"
+) -> Dict:
+    """
+    Segment with every member concurrently and vote on the boundaries.
+
+    Args:
+        features: Shared sentence features
+        members: Registered algorithm names
+        min_votes: Votes a boundary needs to enter the consensus
+        workers: Pool size (default: one per member, at most one process per CPU)
+        executor: "thread", "process" or "auto" (process for long transcripts)
+
+    Returns:
+        Dictionary with:
+            - topics: consensus topics with boundary_confidence
+            - boundaries: consensus boundaries (topic start indices)
+            - confidences: adaptive confidence per consensus boundary
+            - votes: {boundary: votes} for every proposed boundary
+            - members: {name: {"boundaries", "seconds"}}
+            - feature_seconds, seconds: shared-feature and total time
+    """
+    start = time.perf_counter()
+    members = list(members)
+
+    if len(features) == 0:
+        return {
+            "topics": [], "boundaries": [], "confidences": [], "votes": {},
+            "members": {}, "feature_seconds": 0.0, "seconds": 0.0
+        }
+
+    feature_seconds = prepare_features(features, members)
+
+    cpus = os.cpu_count() or 1
+    if executor == "auto":
+        executor = "process" if cpus > 1 and len(features) >= PROCESS_MIN_SENTENCES else "thread"
+
+    if executor == "process":
+        max_workers = workers or max(1, min(len(members), cpus))
+        with ProcessPoolExecutor(max_workers, initializer=_init_worker, initargs=(features,)) as pool:
+            results = dict(zip(members, pool.map(_run_in_worker, members)))
+    else:
+        with ThreadPoolExecutor(workers or max(1, len(members))) as pool:
+            results = dict(zip(members, pool.map(lambda name: run_algorithm(name, features), members)))
+
+    items = features.items()
+    algo_outputs = {name: _member_topics(result, items) for name, result in results.items()}
+
+    votes = {}
+    for result in results.values():
+        for boundary in result.boundaries:
+            votes[boundary] = votes.get(boundary, 0) + 1
+
+    topics = segment_hybrid_consensus(items, algo_outputs, min_votes=min_votes)
+
+    similarities = features.adjacent_similarity.tolist()
+    threshold = compute_adaptive_threshold(similarities)
+    topics = apply_confidence_to_topics(topics, score_boundaries(similarities, threshold))
+
+    boundaries = [topic["segments"][0]["sentence_index"] for topic in topics[1:]]
+    confidences = [topic["boundary_confidence"] for topic in topics[:-1]]
+
+    return {
+        "topics": topics,
+        "boundaries": boundaries,
+        "confidences": confidences,
+        "votes": dict(sorted(votes.items())),
+        "members": {
+            name: {"boundaries": result.boundaries, "seconds": round(result.seconds, 4)}
+            for name, result in results.items()
+        },
+        "feature_seconds": round(feature_seconds, 4),
+        "seconds": round(time.perf_counter() - start, 4)
+    }
@@ -1,18 +1,21 @@
-from typing import List, Dict
-from sklearn.metrics.pairwise import cosine_similarity
-from sentence_transformers import SentenceTransformer
-
-_MODEL = SentenceTransformer("all-MiniLM-L6-v2")
+from typing import List, Dict, Optional
+from sklearn.preprocessing import normalize
+import numpy as np
 
 
 def segment_mixed_language(
     segments: List[Dict],
     base_threshold: float = 0.75,
-    language_penalty: float = 0.15
+    language_penalty: float = 0.15,
+    embeddings: Optional[np.ndarray] = None
 ) -> List[Dict]:
 
-    texts = [s["text"] for s in segments]
-    embeddings = _MODEL.encode(texts)
+    if not segments:
+        return []
+
+    if embeddings is None:
+        from .registry import get_embedder
+        embeddings = get_embedder().encode([s["text"] for s in segments])
 
     topics = []
     topic_id = 0
@@ -25,11 +28,11 @@ def segment_mixed_language(
         "algorithm": "mixed_language"
     }
 
+    unit = normalize(np.asarray(embeddings, dtype=np.float64))
+    similarities = np.einsum("ij,ij->i", unit[:-1], unit[1:])
+
     for i in range(1, len(segments)):
-        sim = cosine_similarity(
-            [embeddings[i - 1]],
-            [embeddings[i]]
-        )[0][0]
+        sim = similarities[i - 1]
 
         if segments[i]["language"] != segments[i - 1]["language"]:
             sim -= language_penalty
@@ -1,25 +1,27 @@
-from typing import List, Dict
+from typing import List, Dict, Optional
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
 
 
 def segment_tfidf_lexical(
     sentences: List[Dict],
-    threshold: float = 0.35
+    threshold: float = 0.35,
+    tfidf: Optional[object] = None
 ) -> List[Dict]:
 
     if not sentences:
         return []
 
-    texts = [s["text"] for s in sentences]
+    if tfidf is None:
+        texts = [s["text"] for s in sentences]
 
-    vectorizer = TfidfVectorizer(
-        stop_words="english",
-        ngram_range=(1, 2),
-        min_df=1
-    )
+        vectorizer = TfidfVectorizer(
+            stop_words="english",
+            ngram_range=(1, 2),
+            min_df=1
+        )
 
-    tfidf = vectorizer.fit_transform(texts)
+        tfidf = vectorizer.fit_transform(texts)
 
     topics = []
     topic_id = 0
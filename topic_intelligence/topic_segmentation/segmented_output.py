@@ -0,0 +1,235 @@
+"""
+segmented_output.py — Segmented Output Schema (v3)
+--------------------------------------------------
+segmented_output.json used to hold every sentence's text several times:
+in `topics[].text`, in each topic sentence (text, translation and the
+whole source segment's text) and again in `Transcription_Output`. The v3
+schema stores each piece of text once and references it by position:
+
+    schema_version  3
+    segments        source segments the sentences were matched to:
+                    text (source script), language, translation (only
+                    when it differs from text), romanized/translation_state
+                    when known
+    sentences       topic sentences in order: start, end, segment (index
+                    into segments, absent when unmatched) and text (absent
+                    when it equals the segment's translation)
+    topics          topics with sentence_ids instead of text/sentences
+    derived         sections rebuilt on read (Transcription_Output)
+
+Topic text is derived from the sentences on read. `materialize`
+rebuilds the old (v2) shape exactly, so consumers that walk
+`topics[].sentences` keep working through `load_segmented_output`.
+"""
+
+import json
+from pathlib import Path
+from typing import Dict, List
+
+from .utils.segment_mapper import build_sentence_data
+
+# =========================
+# CONFIG
+# =========================
+
+SCHEMA_VERSION = 3
+COMPACT_SECTIONS = ("schema_version", "segments", "sentences")
+
+# Filled from the source segment, possibly lazily after segmentation
+SOURCE_FIELDS = ("romanized", "translation_state")
+SENTENCE_FIELDS = ("text", "translation", "source_text", "language", "start", "end") + SOURCE_FIELDS
+
+
+def is_compact(data: Dict) -> bool:
+    """Whether segmented output uses the v3 (referenced text) schema."""
+    return data.get("schema_version", 2) >= SCHEMA_VERSION
+
+
+def transcription_output(topics: List[Dict]) -> List[Dict]:
+    """Transcription_Output section, derived from (v2) topics."""
+    return [
+        {
+            "Segment_ID": t["segment_id"],
+            "Start_Time": t["start"],
+            "End_Time": t["end"],
+            "Topic_Title": t["topic_title"],
+            "Transcript_Text": t["text"]
+        }
+        for t in topics
+    ]
+
+
+# =========================
+# V2 -> V3
+# =========================
+
+def _compact_sentence(sentence: Dict, segments: List[Dict], index: Dict[str, int]) -> Dict:
+    text = sentence.get("text", "")
+    translation = sentence.get("translation", text)
+    source_text = sentence.get("source_text", text)
+    language = sentence.get("language", "en")
+
+    # Unmatched sentences (build_sentence_data with no segment) carry their own text
+    if translation == source_text == text and language == "en" and "translation_state" not in sentence:
+        row = {"text": text}
+    else:
+        segment = {"text": source_text, "language": language}
+        if translation != source_text:
+            segment["translation"] = translation
+        for field in SOURCE_FIELDS:
+            if field in sentence:
+                segment[field] = sentence[field]
+
+        key = json.dumps(segment, sort_keys=True, ensure_ascii=False)
+        if key not in index:
+            index[key] = len(segments)
+            segments.append(segment)
+        row = {"segment": index[key]}
+        if text != translation:
+            row["text"] = text
+
+    row["start"] = sentence.get("start")
+    row["end"] = sentence.get("end")
+    for key, value in sentence.items():
+        if key not in SENTENCE_FIELDS or ("segment" not in row and key in SOURCE_FIELDS):
+            row[key] = value
+    return row
+
+
+def compact_output(data: Dict) -> Dict:
+    """
+    Segmented output in the v3 schema.
+
+    Args:
+        data: Segmented output in either schema
+
+    Returns:
+        Dict with text stored once and referenced by segment/sentence index
+    """
+    if is_compact(data):
+        return data
+
+    try:
+        derivable = data["Transcription_Output"] == transcription_output(data["topics"])
+    except KeyError:
+        derivable = False  # absent, or topics it cannot be rebuilt from
+    derived = ["Transcription_Output"] if derivable else []
+
+    segments: List[Dict] = []
+    sentences: List[Dict] = []
+    index: Dict[str, int] = {}
+    topics = []
+    for topic in data.get("topics", []):
+        first = len(sentences)
+        topic_sentences = topic.get("sentences", [])
+        sentences.extend(_compact_sentence(s, segments, index) for s in topic_sentences)
+
+        compact = {}
+        for key, value in topic.items():
+            if key == "sentences":
+                compact["sentence_ids"] = list(range(first, len(sentences)))
+            elif key != "text" or value != " ".join(s.get("text", "") for s in topic_sentences):
+                compact[key] = value  # text kept only when it is not the sentences joined
+        topics.append(compact)
+
+    output = {"schema_version": SCHEMA_VERSION, "derived": derived}
+    for key, value in data.items():
+        if key == "topics":
+            output["segments"] = segments
+            output["sentences"] = sentences
+            output["topics"] = topics
+        elif key not in derived:
+            output[key] = value
+    return output
+
+
+# =========================
+# V3 -> V2
+# =========================
+
+def _source_segment(segment: Dict) -> Dict:
+    expanded = {
+        "text": segment["text"],
+        "translation": segment.get("translation", segment["text"]),
+        "language": segment.get("language", "en")
+    }
+    for field in SOURCE_FIELDS:
+        if field in segment:
+            expanded[field] = segment[field]
+    return expanded
+
+
+def materialize_sentence(data: Dict, sentence_id: int) -> Dict:
+    """One v3 sentence with its translation/source fields filled in."""
+    row = data["sentences"][sentence_id]
+    if "segment" in row:
+        segment = _source_segment(data["segments"][row["segment"]])
+        text = row.get("text", segment["translation"])
+    else:
+        segment, text = {}, row["text"]
+
+    sentence = build_sentence_data(text, segment, row.get("start"), row.get("end"))
+    for key, value in row.items():
+        if key not in ("text", "segment", "start", "end"):
+            sentence[key] = value
+    return sentence
+
+
+def topic_text(data: Dict, topic: Dict) -> str:
+    """Transcript text of a topic in either schema."""
+    if "text" in topic or "sentence_ids" not in topic:
+        return topic.get("text", "")
+    return " ".join(materialize_sentence(data, i)["text"] for i in topic["sentence_ids"])
+
+
+def materialize(data: Dict) -> Dict:
+    """
+    Segmented output in the v2 shape (self-contained topics).
+
+    Args:
+        data: Segmented output in either schema
+
+    Returns:
+        Dict with topics[].text, topics[].sentences and derived sections
+    """
+    if not is_compact(data):
+        return data
+
+    topics = []
+    for topic in data.get("topics", []):
+        full = {}
+        for key, value in topic.items():
+            if key == "sentence_ids":
+                sentences = [materialize_sentence(data, i) for i in value]
+                if "text" not in topic:
+                    full["text"] = " ".join(s["text"] for s in sentences)
+                full["sentences"] = sentences
+            else:
+                full[key] = value
+        topics.append(full)
+
+    output = {}
+    for key, value in data.items():
+        if key == "topics":
+            output["topics"] = topics
+            if "Transcription_Output" in data.get("derived", []):
+                output["Transcription_Output"] = transcription_output(topics)
+        elif key not in COMPACT_SECTIONS and key != "derived":
+            output[key] = value
+    return output
+
+
+def load_segmented_output(path, materialized: bool = True) -> Dict:
+    """
+    Read segmented_output.json of either schema.
+
+    Args:
+        path: segmented_output.json
+        materialized: Return the v2 shape (else the file as stored)
+
+    Returns:
+        Segmented output dict
+    """
+    with open(Path(path), "r", encoding="utf-8") as f:
+        data = json.load(f)
+    return materialize(data) if materialized else data
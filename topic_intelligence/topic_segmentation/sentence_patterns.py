@@ -0,0 +1,100 @@
+"""
+sentence_patterns.py — Compiled Sentence Pattern Features
+---------------------------------------------------------
+Filler, concept-anchor, definition and example patterns used by
+discourse_cleaner, concept_anchors and definition_filter, compiled once.
+
+Fillers are removed with one alternation instead of one re.sub each, and
+the anchor/definition/example patterns are found in a single scan of the
+sentence. Results are memoized per sentence text, so the segmenters,
+topic_text and the online segmenter classify each sentence only once per
+process.
+"""
+
+import re
+from functools import lru_cache
+from typing import NamedTuple
+
+# =========================
+# CONFIG
+# =========================
+
+FILLERS = [
+    r"\byou know\b", r"\bokay\b", r"\balright\b",
+    r"\buh\b", r"\bum\b", r"\byeah\b",
+    r"\bright\b", r"\bjust\b", r"\blike\b", r"\bi mean\b"
+]
+
+ANCHORS = [
+    r"\bnow\b", r"\bnext\b", r"\banother\b",
+    r"\bremember\b", r"\bimportant\b",
+    r"\bthe difference\b", r"\bthis is called\b",
+    r"\bthis means\b", r"\bin arabic\b", r"\bin english\b"
+]
+
+DEF_PATTERNS = [
+    r"\bis called\b", r"\bmeans\b", r"\brefers to\b",
+    r"\bwe use\b", r"\bis used\b",
+    r"\bthe difference\b", r"\bthis form\b", r"\bthis word\b"
+]
+
+EX_PATTERNS = [
+    r"\bfor example\b", r"\blet us say\b",
+    r"\bfor instance\b", r"\bexercise\b",
+    r"\bdrill\b", r"\bpage\b", r"\bwe say\b"
+]
+
+CACHE_SIZE = 65536
+
+
+class SentenceFlags(NamedTuple):
+    """Which pattern families occur in a sentence."""
+    anchor: bool
+    definition: bool
+    example: bool
+
+    @property
+    def is_definition(self) -> bool:
+        """Definition pattern present and not an example sentence."""
+        return self.definition and not self.example
+
+
+def _phrase_kinds():
+    """
+    Pattern families of every phrase, including the families of shorter
+    patterns inside it ("this is called" is an anchor and contains the
+    definition "is called"), since a match consumes its text.
+    """
+    families = [("anchor", ANCHORS), ("definition", DEF_PATTERNS), ("example", EX_PATTERNS)]
+    phrases = {p: p.replace(r"\b", "") for _, patterns in families for p in patterns}
+    return {
+        phrase: {kind for kind, patterns in families for p in patterns if re.search(p, phrase)}
+        for phrase in phrases.values()
+    }, list(phrases)
+
+
+# Patterns are literal phrases between word boundaries, so the matched
+# text identifies the pattern
+_PHRASE_KINDS, _FLAG_PATTERNS = _phrase_kinds()
+_FLAGS_RE = re.compile("|".join(_FLAG_PATTERNS))
+_FILLERS_RE = re.compile("|".join(FILLERS))
+_REPEATED_WORD_RE = re.compile(r"\b(\w+)\s+\1\b")
+_SPACES_RE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def sentence_flags(sentence: str) -> SentenceFlags:
+    """Anchor/definition/example flags of a sentence from one regex scan."""
+    found = set()
+    for phrase in _FLAGS_RE.findall(sentence.lower()):
+        found |= _PHRASE_KINDS[phrase]
+    return SentenceFlags("anchor" in found, "definition" in found, "example" in found)
+
+
+@lru_cache(maxsize=CACHE_SIZE)
+def clean_text(text: str) -> str:
+    """Lowercase, drop fillers and immediate word repeats, squeeze whitespace."""
+    t = _FILLERS_RE.sub(" ", text.lower())
+    t = _REPEATED_WORD_RE.sub(r"\1", t)
+    t = _SPACES_RE.sub(" ", t)
+    return t.strip()
@@ -0,0 +1,43 @@
+"""
+sentiment.py — Batched Sentiment Scoring
+----------------------------------------
+Polarity scores from TextBlob's default (pattern) analyzer without
+building a TextBlob per text: one PatternAnalyzer is shared by the
+process and analyzes raw strings directly, so no per-text tokenization,
+sentence splitting or blob objects are created. score_texts() scores a
+whole batch (every topic, or every sentence for a sentiment timeline)
+with that one analyzer.
+"""
+
+from typing import Sequence
+
+import numpy as np
+from textblob.en.sentiments import PatternAnalyzer
+
+# =========================
+# CONFIG
+# =========================
+
+POSITIVE_THRESHOLD = 0.1
+NEGATIVE_THRESHOLD = -0.1
+
+# The en-sentiment.xml lexicon is loaded on the first analysis
+_ANALYZER = PatternAnalyzer()
+
+
+def score_text(text: str) -> float:
+    """Polarity in [-1, 1], as TextBlob(text).sentiment.polarity."""
+    return _ANALYZER.analyze(text).polarity
+
+
+def score_texts(texts: Sequence[str]) -> np.ndarray:
+    """Polarity of every text with the shared analyzer."""
+    return np.fromiter((score_text(t) for t in texts), dtype=np.float64, count=len(texts))
+
+
+def sentiment_label(score: float) -> str:
+    if score > POSITIVE_THRESHOLD:
+        return "POSITIVE"
+    if score < NEGATIVE_THRESHOLD:
+        return "NEGATIVE"
+    return "NEUTRAL"
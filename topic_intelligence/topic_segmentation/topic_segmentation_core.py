@@ -2,38 +2,53 @@ import json
 import sys
 import re
 from pathlib import Path
-from sentence_transformers import SentenceTransformer
-from sklearn.metrics.pairwise import cosine_similarity
 
 from .utils.merge_segments import merge_short_segments
 from .utils.segment_mapper import map_sentences_to_segments
 from .discourse_cleaner import clean_text
-from .concept_anchors import has_concept_anchor
 from .definition_filter import is_definition
-from .keywords import extract_keywords
+from .keywords import extract_keywords, KeywordEngine
+from .sentiment import score_text, score_texts, sentiment_label
+from .feature_track import build_sentence_track
+from .segmented_output import transcription_output
 from .summaries import generate_summary
 from .topic_title_generator import generate_topic_title
-from textblob import TextBlob
+from .registry import (
+    SegmentationFeatures,
+    run_algorithm,
+    available_algorithms,
+    DEFAULT_ALGORITHM
+)
 
 # Import animation module
 import sys
 from pathlib import Path
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
 from topic_intelligence.animation.animation_state import generate_animation_states
+from topic_intelligence.indexing.idf_store import episode_id, load_idf_store
+from language_adaptation.translation_tier import (
+    init_translation_state,
+    needs_translation,
+    translate_artifact,
+    DEFAULT_TRANSLATION_POLICY
+)
+from pipeline.columnar_artifact import (
+    artifact_path,
+    export_json,
+    read_embeddings,
+    write_segmented_artifact
+)
 
 
 # =========================
 # CONFIG
 # =========================
 
-EMBED_MODEL = "all-MiniLM-L6-v2"
 SIM_THRESHOLD = 0.82
 MIN_DEF_SENTENCES = 2
 MAX_SENTENCES_PER_TOPIC = 10
 PROJECT_TITLE = "LEXARA: Automated Podcast Transcription & Insights"
 
-embedder = SentenceTransformer(EMBED_MODEL)
-
 
 def split_sentences(text: str):
     """Split text into sentences with minimum length."""
@@ -44,61 +59,70 @@ def split_sentences(text: str):
     ]
 
 
-def segment_topics(segments):
+def sentence_features(segments, artifact=None):
     """
-    Segment transcript into topic groups based on semantic similarity.
+    Split merged transcript segments into sentences for the segmenters.
     
     Args:
         segments: List of transcript segments from Whisper
+        artifact: Columnar artifact of an earlier run; its embeddings are
+                  reused when they were computed for the same sentences
         
     Returns:
-        Tuple of (topic_groups, sentences, timestamps)
+        SegmentationFeatures whose embeddings/TF-IDF are computed on first use
     """
     merged = merge_short_segments(segments)
 
     sentences = []
     timestamps = []
+    languages = []
 
     for seg in merged:
         for sent in split_sentences(seg["translation"]):
             sentences.append(sent)
             timestamps.append((seg["start"], seg["end"]))
+            languages.append(seg.get("language", "en"))
 
-    if not sentences:
-        return [], [], []
+    embeddings = read_embeddings(artifact, sentences) if artifact is not None else None
+    return SegmentationFeatures(sentences, timestamps, languages, embeddings=embeddings)
 
-    cleaned = [clean_text(s) for s in sentences]
-    embeddings = embedder.encode(cleaned)
 
-    groups = []
-    current = [0]
-    def_count = 1 if is_definition(sentences[0]) else 0
+def segment_topics(segments, algorithm=DEFAULT_ALGORITHM):
+    """
+    Segment transcript into topic groups with a registered algorithm.
+    
+    Args:
+        segments: List of transcript segments from Whisper
+        algorithm: Name of an algorithm in the segmentation registry
+        
+    Returns:
+        Tuple of (topic_groups, sentences, timestamps)
+    """
+    features = sentence_features(segments)
+    if not len(features):
+        return [], [], []
 
-    for i in range(1, len(sentences)):
-        sim = cosine_similarity(
-            [embeddings[i - 1]],
-            [embeddings[i]]
-        )[0][0]
+    result = run_algorithm(algorithm, features)
+    return result.groups(), features.sentences, features.timestamps
 
-        anchor = has_concept_anchor(sentences[i])
-        is_def = is_definition(sentences[i])
 
-        if (anchor and def_count >= MIN_DEF_SENTENCES) or len(current) >= MAX_SENTENCES_PER_TOPIC:
-            groups.append(current)
-            current = [i]
-            def_count = 1 if is_def else 0
-        else:
-            current.append(i)
-            if is_def:
-                def_count += 1
+def topic_text(ids, sentences):
+    """
+    Cleaned text a topic's summary, keywords and title are built from:
+    its definition sentences if there are enough, else all its sentences.
+    """
+    definition_sents = [sentences[i] for i in ids if is_definition(sentences[i])]
 
-    if current:
-        groups.append(current)
+    base_text = (
+        " ".join(definition_sents)
+        if len(definition_sents) >= MIN_DEF_SENTENCES
+        else " ".join(sentences[i] for i in ids)
+    )
 
-    return groups, sentences, timestamps
+    return clean_text(base_text)
 
 
-def build_topic(topic_id, ids, sentences, timestamps, original_segments):
+def build_topic(topic_id, ids, sentences, timestamps, original_segments, keyword_engine=None, sentiment_score=None):
     """
     Build a complete topic object with title, summary, keywords, and sentiment.
     
@@ -108,35 +132,25 @@ def build_topic(topic_id, ids, sentences, timestamps, original_segments):
         sentences: All sentences list
         timestamps: All timestamps list
         original_segments: Original Whisper segments
+        keyword_engine: KeywordEngine fitted on all topics of the episode
+        sentiment_score: Polarity from a batched score_texts pass
         
     Returns:
         Dictionary with topic data including topic_title
     """
-    definition_sents = [sentences[i] for i in ids if is_definition(sentences[i])]
     fallback_sents = [sentences[i] for i in ids]
 
-    base_text = (
-        " ".join(definition_sents)
-        if len(definition_sents) >= MIN_DEF_SENTENCES
-        else " ".join(fallback_sents)
-    )
-
-    cleaned = clean_text(base_text)
+    cleaned = topic_text(ids, sentences)
     summary = generate_summary(cleaned)
-    keywords = extract_keywords(cleaned, summary_text=summary)
+    keywords = extract_keywords(cleaned, summary_text=summary, engine=keyword_engine)
     
     # Generate context-aware topic title (max 8-10 words)
     topic_title = generate_topic_title(cleaned, keywords)
     
     # Add sentiment analysis
-    blob = TextBlob(cleaned)
-    sentiment_score = blob.sentiment.polarity
-    if sentiment_score > 0.1:
-        sentiment = "POSITIVE"
-    elif sentiment_score < -0.1:
-        sentiment = "NEGATIVE"
-    else:
-        sentiment = "NEUTRAL"
+    if sentiment_score is None:
+        sentiment_score = score_text(cleaned)
+    sentiment = sentiment_label(sentiment_score)
     
     topic_sentences = [sentences[i] for i in ids]
     topic_timestamps = [timestamps[i] for i in ids]
@@ -185,25 +199,55 @@ def validate_topics(topics):
     return len(errors) == 0, errors
 
 
-def main(input_path):
+def main(input_path, algorithm=DEFAULT_ALGORITHM):
     """
     Main entry point for topic segmentation.
     
     Args:
         input_path: Path to pipeline_output.json
+        algorithm: Name of an algorithm in the segmentation registry
     """
     input_path = Path(input_path)
     
     with open(input_path, "r", encoding="utf-8") as f:
         data = json.load(f)
 
-    topic_ids, sentences, timestamps = segment_topics(data["segments"])
+    # Segmentation works on English text: translate pending segments now
+    # unless the episode defers translation to the UI
+    init_translation_state(data["segments"])
+    policy = data.get("translation_policy", DEFAULT_TRANSLATION_POLICY)
+    if policy != "deferred" and needs_translation(data["segments"]):
+        # Persisted under the artifact lock through a temp file + os.replace,
+        # so a crash or a concurrent background translation cannot leave a
+        # truncated pipeline_output.json
+        data = translate_artifact(input_path)
+        init_translation_state(data["segments"])
 
-    topics = [
-        build_topic(i, ids, sentences, timestamps, data["segments"])
-        for i, ids in enumerate(topic_ids)
-        if len(ids) >= 3
-    ]
+    output_path = input_path.parent / "segmented_output.json"
+    artifact = artifact_path(output_path)
+
+    features = sentence_features(data["segments"], artifact)
+    result = run_algorithm(algorithm, features)
+    topic_ids, sentences, timestamps = result.groups(), features.sentences, features.timestamps
+    print(f"[INFO] Segmentation algorithm: {algorithm} ({len(result.boundaries)} boundaries)")
+
+    kept = [(i, ids) for i, ids in enumerate(topic_ids) if len(ids) >= 3]
+
+    texts = [topic_text(ids, sentences) for _, ids in kept]
+
+    # One vocabulary/IDF fit for the keywords of every topic, IDF blended
+    # with the episodes indexed so far; sentiment scored in one batch
+    keyword_engine = KeywordEngine(
+        idf_store=load_idf_store(),
+        episode_id=episode_id(data)
+    ).fit(texts)
+    sentiment_scores = score_texts(texts)
+
+    topics = []
+    for (i, ids), score in zip(kept, sentiment_scores):
+        topic = build_topic(i, ids, sentences, timestamps, data["segments"], keyword_engine, float(score))
+        topic["boundary_confidence"] = result.boundary_after(i)
+        topics.append(topic)
     
     # Validate topics
     is_valid, errors = validate_topics(topics)
@@ -213,41 +257,47 @@ def main(input_path):
     # Generate animation states for 3D visualization
     animation_states = generate_animation_states(topics)
 
-    output_path = input_path.parent / "segmented_output.json"
-    
+    # Per-sentence sentiment/keyword/speaking-rate columns for the timeline
+    sentence_track = build_sentence_track(
+        sentences,
+        timestamps,
+        kept,
+        [keyword for t in topics for keyword in t["keywords"]],
+        cleaned=features.cleaned
+    )
+
     # Format output according to LEXARA schema
     output_data = {
         "Project_Title": PROJECT_TITLE,
         "audio_file": data["audio_file"],
+        "audio_fingerprint": data.get("audio_fingerprint"),
         "topics": topics,
-        "Transcription_Output": [
-            {
-                "Segment_ID": t["segment_id"],
-                "Start_Time": t["start"],
-                "End_Time": t["end"],
-                "Topic_Title": t["topic_title"],
-                "Transcript_Text": t["text"]
-            }
-            for t in topics
-        ],
-        "3D_Animation_Output": animation_states
+        "Transcription_Output": transcription_output(topics),
+        "3D_Animation_Output": animation_states,
+        "sentence_track": sentence_track
     }
-    
-    with open(output_path, "w", encoding="utf-8") as f:
-        json.dump(
-            output_data,
-            f,
-            indent=2,
-            ensure_ascii=False
-        )
-
-    print(f"[SUCCESS] LEXARA topic segmentation completed: {output_path}")
+
+    # The columnar artifact is what indexing and the UI read; embeddings
+    # are stored only if an algorithm computed them
+    write_segmented_artifact(
+        artifact,
+        output_data,
+        segments=data["segments"],
+        embeddings=features.embeddings if features.has_embeddings else None,
+        embedded_sentences=features.sentences
+    )
+    print(f"[SUCCESS] LEXARA topic segmentation completed: {artifact}")
+
+    # JSON export in the v3 schema: each text once, topics reference sentences
+    export_json(artifact, output_path)
+    print(f"[INFO] Exported {output_path}")
     print(f"[INFO] Generated {len(topics)} topics with titles and animation states")
 
 
 if __name__ == "__main__":
-    if len(sys.argv) != 2:
-        print("Usage: python -m topic_intelligence.topic_segmentation.topic_segmentation_core <pipeline_output.json>")
+    if len(sys.argv) not in (2, 3):
+        print("Usage: python -m topic_intelligence.topic_segmentation.topic_segmentation_core <pipeline_output.json> [algorithm]")
+        print(f"       algorithm: {', '.join(available_algorithms())}")
         sys.exit(1)
 
-    main(sys.argv[1])
+    main(sys.argv[1], sys.argv[2] if len(sys.argv) > 2 else DEFAULT_ALGORITHM)
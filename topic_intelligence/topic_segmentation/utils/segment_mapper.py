@@ -34,15 +34,23 @@ def find_best_segment_match(sentence: str, segments: list) -> dict:
 def build_sentence_data(sentence: str, segment: dict, start: float, end: float) -> dict:
     
         
-    return {
+    sentence_data = {
         "text": sentence,
         "translation": segment.get("translation", sentence),
-        "romanized": segment.get("romanized", sentence),
+        "source_text": segment.get("text", sentence),
         "language": segment.get("language", "en"),
         "start": start,
         "end": end
     }
 
+    # Romanization and translation may be computed lazily; carry over what exists
+    if "romanized" in segment:
+        sentence_data["romanized"] = segment["romanized"]
+    if "translation_state" in segment:
+        sentence_data["translation_state"] = segment["translation_state"]
+
+    return sentence_data
+
 
 def map_sentences_to_segments(sentences: list, timestamps: list, segments: list) -> list:
     
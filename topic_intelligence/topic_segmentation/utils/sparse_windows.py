@@ -0,0 +1,77 @@
+from typing import Sequence
+import numpy as np
+from scipy import sparse
+
+
+def window_operator(n: int, window: int, side: str) -> sparse.csr_matrix:
+    """
+    Band matrix that sums a sliding window of rows at every gap.
+
+    Row g - 1 of the operator covers gap g (between rows g - 1 and g):
+    side "left" sums rows [g - window, g), side "right" rows [g, g + window),
+    both clipped to the matrix. Applying it to an (n, V) matrix gives all
+    n - 1 window vectors with one sparse product.
+    """
+    gaps = np.arange(1, n)
+    if side == "left":
+        cols = gaps[:, None] - 1 - np.arange(window)[None, :]
+    elif side == "right":
+        cols = gaps[:, None] + np.arange(window)[None, :]
+    else:
+        raise ValueError(f"side must be 'left' or 'right', got {side!r}")
+
+    rows = np.broadcast_to((gaps - 1)[:, None], cols.shape)
+    valid = (cols >= 0) & (cols < n)
+    return sparse.csr_matrix(
+        (np.ones(valid.sum()), (rows[valid], cols[valid])),
+        shape=(max(n - 1, 0), n)
+    )
+
+
+def window_sums(matrix, window: int, side: str) -> sparse.csr_matrix:
+    """Sum of `window` rows on one side of every gap, shape (n - 1, V)."""
+    matrix = sparse.csr_matrix(matrix)
+    return window_operator(matrix.shape[0], window, side) @ matrix
+
+
+def rowwise_cosine(a, b) -> np.ndarray:
+    """Cosine similarity of matching rows of two sparse matrices (0 for empty rows)."""
+    a = sparse.csr_matrix(a)
+    b = sparse.csr_matrix(b)
+    dots = np.asarray(a.multiply(b).sum(axis=1)).ravel()
+    norms = (
+        np.sqrt(np.asarray(a.multiply(a).sum(axis=1)).ravel())
+        * np.sqrt(np.asarray(b.multiply(b).sum(axis=1)).ravel())
+    )
+    out = np.zeros(len(dots))
+    np.divide(dots, norms, out=out, where=norms > 0)
+    return out
+
+
+def window_cosine(matrix, left_window: int, right_window: int) -> np.ndarray:
+    """
+    Similarity across every gap of a term matrix.
+
+    Returns:
+        Array of n - 1 scores; entry g - 1 compares the left_window rows
+        before gap g with the right_window rows after it
+    """
+    return rowwise_cosine(
+        window_sums(matrix, left_window, "left"),
+        window_sums(matrix, right_window, "right")
+    )
+
+
+
+def multiscale_window_cosine(matrix, windows: Sequence[int]) -> np.ndarray:
+    """
+    Symmetric window_cosine for several window sizes in one sparse product.
+
+    Returns:
+        Array of shape (len(windows), n - 1)
+    """
+    matrix = sparse.csr_matrix(matrix)
+    n = matrix.shape[0]
+    left = sparse.vstack([window_operator(n, w, "left") for w in windows], format="csr")
+    right = sparse.vstack([window_operator(n, w, "right") for w in windows], format="csr")
+    return rowwise_cosine(left @ matrix, right @ matrix).reshape(len(windows), max(n - 1, 0))
@@ -3,6 +3,7 @@ import sys
 import json
 import subprocess
 import io
+import shutil
 import matplotlib.pyplot as plt
 import matplotlib.patches as mpatches
 from pathlib import Path
@@ -24,14 +25,54 @@ if str(PROJECT_ROOT) not in sys.path:
     sys.path.insert(0, str(PROJECT_ROOT))
 
 from language_adaptation.translator import translate_auto
-from language_adaptation.romanizer import romanize_text
-from textblob import TextBlob
+from language_adaptation.romanizer import romanize_schemes
+from language_adaptation.romanization_engine import ROMANIZATION_SCHEMES, DEFAULT_SCHEME
+from language_adaptation.lazy_romanization import romanize_artifact
+from language_adaptation.translation_tier import (
+    TRANSLATION_POLICIES,
+    DEFAULT_TRANSLATION_POLICY,
+    needs_translation,
+    start_background_translation,
+    translate_artifact
+)
+from audio.audio_processing.audio_loader import audio_fingerprint, buffer_fingerprint, playback_source
+from ui.components.live_view import render_live_view
+from topic_intelligence.topic_segmentation.feature_track import track_arrays
+from pipeline.columnar_artifact import artifact_path, load_segmented
+from topic_intelligence.topic_segmentation.segmented_output import load_segmented_output, materialize
 
 PIPELINE_OUTPUT = PROJECT_ROOT / "outputs" / "pipeline_output.json"
 SEGMENTED_OUTPUT = PROJECT_ROOT / "outputs" / "segmented_output.json"
+LIVE_OUTPUT = PROJECT_ROOT / "outputs" / "live_output.json"
 CONFIG_FILE = PROJECT_ROOT / "config.json"
 
 
+def run_segmentation():
+    """Run topic segmentation on the pipeline output in a subprocess."""
+    return subprocess.run(
+        [str(VENV_PYTHON), "-m", "topic_intelligence.topic_segmentation.topic_segmentation_core",
+         str(PIPELINE_OUTPUT)],
+        cwd=str(PROJECT_ROOT),
+        capture_output=True,
+        text=True
+    )
+
+
+def resegment_after_translation(data):
+    """Background-translation callback: re-segment on the English text."""
+    result = run_segmentation()
+    if result.returncode != 0:
+        print(f"[WARNING] Re-segmentation after translation failed: {result.stderr}")
+
+
+def segmentation_is_stale():
+    """Whether the pipeline output (e.g. new translations) is newer than the topics."""
+    try:
+        return PIPELINE_OUTPUT.stat().st_mtime_ns > SEGMENTED_OUTPUT.stat().st_mtime_ns
+    except FileNotFoundError:
+        return False
+
+
 def generate_wordcloud(keywords, topic_id=None):
     """
     Generate a word cloud image from existing keywords for a specific topic.
@@ -571,6 +612,50 @@ def get_sentiment_color(sentiment):
         return "sentiment-neutral"
 
 
+def load_segmented_data():
+    """Segmented episode from its columnar artifact, else from the JSON export"""
+    try:
+        return load_segmented(SEGMENTED_OUTPUT, track_arrays=True)
+    except (OSError, ValueError):
+        # Unreadable artifact: fall back to the last JSON export
+        return load_segmented_output(SEGMENTED_OUTPUT)
+
+
+def render_sentence_track(track, total_duration):
+    """Heatmap rows for the stored per-sentence sentiment, keyword hits and speaking rate"""
+    columns = track_arrays(track)
+    if not len(columns["start"]):
+        return
+
+    rows = [
+        ("Sentiment", columns["sentiment"], plt.cm.RdYlGn, -1.0, 1.0),
+        ("Keywords", columns["keyword_hits"], plt.cm.Blues, 0, max(columns["keyword_hits"].max(), 1)),
+        ("Words/min", columns["words_per_minute"], plt.cm.Purples, 0, max(columns["words_per_minute"].max(), 1)),
+    ]
+
+    fig, ax = plt.subplots(figsize=(14, 1.2))
+    fig.patch.set_facecolor('#ffffff')
+    ax.set_facecolor('#f5f5f5')
+
+    widths = columns["end"] - columns["start"]
+    for row, (_, values, cmap, vmin, vmax) in enumerate(rows):
+        colors = cmap((values - vmin) / (vmax - vmin))
+        # One barh call per feature: every sentence is a cell of the row
+        ax.barh(y=row, width=widths, left=columns["start"], height=0.9, color=colors, linewidth=0)
+
+    ax.set_xlim(0, total_duration)
+    ax.set_ylim(len(rows) - 0.5, -0.5)
+    ax.set_yticks(range(len(rows)))
+    ax.set_yticklabels([label for label, *_ in rows], fontsize=8, color='#000000')
+    ax.set_xticks([])
+    for side in ('top', 'right', 'bottom', 'left'):
+        ax.spines[side].set_visible(False)
+
+    plt.tight_layout()
+    st.pyplot(fig)
+    plt.close(fig)
+
+
 def render_timeline(data):
     """Render interactive timeline visualization as a matplotlib horizontal bar graph"""
     if not data or "topics" not in data:
@@ -646,6 +731,10 @@ def render_timeline(data):
     # Render the figure using st.pyplot (NOT raw code)
     st.pyplot(fig)
     plt.close(fig)
+
+    # Sentence-level overlays, read from the artifact (older episodes have none)
+    if data.get("sentence_track"):
+        render_sentence_track(data["sentence_track"], total_duration)
     
     # === LEGEND ===
     st.markdown("<p style='color:#000000; font-weight:bold;'>Legend:</p>", unsafe_allow_html=True)
@@ -738,6 +827,41 @@ def display_topic_details(topic):
     full_text = sanitize_input(topic.get("text", ""))
     st.markdown(f"<div class='transcript-box'>{full_text}</div>", unsafe_allow_html=True)
 
+# === LIVE MODE ===
+with st.sidebar:
+    live_mode = st.toggle("🔴 Live Mode", value=False, help="Transcribe a growing file or named pipe as it is recorded")
+
+if live_mode:
+    st.markdown("---")
+    st.markdown('<div class="step-header"><h2> Live Podcast</h2></div>', unsafe_allow_html=True)
+
+    with st.sidebar:
+        stream_path = st.text_input("Stream path (growing file or named pipe)", value=str(DATA_DIR / "live.mp3"))
+        live_lang = st.text_input("Language code ('auto' to detect)", value="auto")
+        live_realtime = st.checkbox("Replay recorded file in real time", value=False)
+
+        live_process = st.session_state.get("live_process")
+        running = live_process is not None and live_process.poll() is None
+
+        if not running and st.button("▶️ Start Live Session", type="primary"):
+            if LIVE_OUTPUT.exists():
+                LIVE_OUTPUT.unlink()
+            cmd = [str(VENV_PYTHON), str(PROJECT_ROOT / "pipeline" / "live_pipeline.py"), stream_path, live_lang]
+            if live_realtime:
+                cmd.append("--realtime")
+            st.session_state.live_process = subprocess.Popen(
+                cmd, cwd=str(PROJECT_ROOT), stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL
+            )
+            st.rerun()
+
+        if running and st.button("⏹️ Stop Live Session"):
+            live_process.terminate()
+            st.session_state.live_process = None
+            st.rerun()
+
+    render_live_view(LIVE_OUTPUT)
+    st.stop()
+
 st.markdown("---")
 
 st.markdown('<div class="step-header"><h2> Upload Audio</h2></div>', unsafe_allow_html=True)
@@ -770,6 +894,7 @@ if audio_file and st.session_state.processed_file != audio_file.name:
     try:
         if SEGMENTED_OUTPUT.exists():
             SEGMENTED_OUTPUT.unlink()
+        shutil.rmtree(artifact_path(SEGMENTED_OUTPUT), ignore_errors=True)
     except PermissionError:
         pass  # File in use, skip cleanup
 
@@ -800,16 +925,23 @@ if audio_file:
         st.session_state.data_loaded = False
         
     audio_path = DATA_DIR / audio_file.name
-    with open(audio_path, "wb") as f:
-        f.write(audio_file.getbuffer())
+    # Streamlit reruns this script on every interaction; rewriting an
+    # unchanged upload would only churn the file, so write new content only
+    upload_bytes = audio_file.getbuffer()
+    if not audio_path.exists() or audio_fingerprint(audio_path) != buffer_fingerprint(upload_bytes):
+        with open(audio_path, "wb") as f:
+            f.write(upload_bytes)
     
     st.markdown("<br>", unsafe_allow_html=True)
-    st.audio(str(audio_path), format="audio/mp3")
+    # Reuse the decoded waveform from a previous run when it is the smaller file
+    playback_path, playback_format = playback_source(audio_path)
+    st.audio(str(playback_path), format=playback_format)
     
     # Language selection for transcription
     st.markdown("<br>", unsafe_allow_html=True)
     source_languages = {
         "auto": "🔍 Auto-Detect (Default)",
+        "mixed": "🔀 Mixed / Code-Switched (e.g. Hinglish)",
         "en": "🇬🇧 English",
         "te": "🇮🇳 Telugu (తెలుగు)",
         "hi": "🇮🇳 Hindi (हिंदी)",
@@ -835,6 +967,18 @@ if audio_file:
         help="Select the language spoken in the audio. Use this if auto-detect gives wrong results."
     )
     
+    translation_policy = st.selectbox(
+        "🌐 English Translation",
+        options=list(TRANSLATION_POLICIES),
+        index=TRANSLATION_POLICIES.index(DEFAULT_TRANSLATION_POLICY),
+        format_func=lambda x: {
+            "eager": "During transcription",
+            "segmentation": "Before topic segmentation (Default)",
+            "deferred": "In the background / on demand",
+        }[x],
+        help="Deferred translation finishes processing sooner; topics are re-segmented once translations arrive."
+    )
+    
     # Initialize processing state if needed
     if "processing" not in st.session_state:
         st.session_state.processing = False
@@ -848,7 +992,7 @@ if audio_file:
                 # Step 1: Run pipeline_core for transcription
                 st.info("Step 1/2: Transcribing audio...")
                 result = subprocess.run(
-                    [str(VENV_PYTHON), str(PROJECT_ROOT / "pipeline" / "pipeline_core.py"), str(audio_path), selected_source_lang],
+                    [str(VENV_PYTHON), str(PROJECT_ROOT / "pipeline" / "pipeline_core.py"), str(audio_path), selected_source_lang, translation_policy],
                     cwd=str(PROJECT_ROOT),
                     capture_output=True,
                     text=True
@@ -861,19 +1005,17 @@ if audio_file:
                 else:
                     # Step 2: Run topic segmentation directly as a module
                     st.info("Step 2/2: Segmenting topics...")
-                    result2 = subprocess.run(
-                        [str(VENV_PYTHON), "-m", "topic_intelligence.topic_segmentation.topic_segmentation_core", 
-                         str(PIPELINE_OUTPUT)],
-                        cwd=str(PROJECT_ROOT),
-                        capture_output=True,
-                        text=True
-                        # No timeout for segmentation
-                    )
+                    result2 = run_segmentation()  # No timeout for segmentation
                     
                     if result2.returncode != 0:
                         st.error(f"Segmentation error: {result2.stderr}")
                         st.session_state.processing = False
                     else:
+                        if translation_policy == "deferred":
+                            # Topics are rebuilt on the English text once it arrives
+                            st.session_state.translation_thread = start_background_translation(
+                                PIPELINE_OUTPUT, on_complete=resegment_after_translation
+                            )
                         st.session_state.processed_file = audio_file.name
                         st.session_state.data_loaded = True
                         st.session_state.processing = False
@@ -900,8 +1042,7 @@ if not st.session_state.data_loaded:
         st.stop()
 
 try:
-    with open(SEGMENTED_OUTPUT, "r", encoding="utf-8") as f:
-        segmented_data = json.load(f)
+    segmented_data = load_segmented_data()
 except FileNotFoundError:
     st.warning("⚠️ No processed data found. Please upload and process an audio file.")
     st.stop()
@@ -931,6 +1072,26 @@ full_transcript = " ".join(
 st.markdown("---")
 st.markdown('<div class="step-header"><h2> Full Transcript</h2></div>', unsafe_allow_html=True)
 
+show_romanized = st.toggle(
+    "Show romanized transcript",
+    value=False,
+    help="Romanizes the original-script transcript on first use and saves it with the episode"
+)
+
+if show_romanized:
+    with st.spinner("Romanizing transcript..."):
+        romanized_data = materialize(romanize_artifact(SEGMENTED_OUTPUT))
+    # Sentences split from the same segment share its romanized text
+    romanized_parts = []
+    for topic in sorted(romanized_data.get("topics", []), key=lambda t: t.get("start", 0)):
+        for s in topic.get("sentences", []):
+            part = s.get("romanized", "")
+            if part and (not romanized_parts or romanized_parts[-1] != part):
+                romanized_parts.append(part)
+    romanized_transcript = " ".join(romanized_parts)
+    if romanized_transcript.strip():
+        st.markdown(f'<div class="localization-box">{romanized_transcript}</div>', unsafe_allow_html=True)
+
 if full_transcript:
     if full_transcript.strip():
         st.markdown(f'<div class="transcript-box">{full_transcript}</div>', unsafe_allow_html=True)
@@ -1108,6 +1269,30 @@ for idx, topic in enumerate(topics):
 st.markdown("---")
 st.markdown('<div class="step-header"><h2> Translation</h2></div>', unsafe_allow_html=True)
 
+# Episodes processed with deferred translation were segmented on source text
+try:
+    with open(PIPELINE_OUTPUT, "r", encoding="utf-8") as f:
+        pending_translation = needs_translation(json.load(f).get("segments", []))
+except (FileNotFoundError, json.JSONDecodeError):
+    pending_translation = False
+
+translation_thread = st.session_state.get("translation_thread")
+if translation_thread is not None and translation_thread.is_alive():
+    st.info("Translating to English in the background; topics are re-segmented when it finishes.")
+elif pending_translation or segmentation_is_stale():
+    if pending_translation:
+        st.info("Some segments have not been translated to English yet.")
+    else:
+        st.info("Translations arrived after these topics were segmented.")
+    if st.button("Translate Pending Segments & Re-segment"):
+        with st.spinner("Translating pending segments..."):
+            translate_artifact(PIPELINE_OUTPUT)
+            result = run_segmentation()
+        if result.returncode != 0:
+            st.error(f"Segmentation error: {result.stderr}")
+        else:
+            st.rerun()
+
 st.markdown("""
 <div style="background: #d1fae5; padding: 1.25rem; border-radius: 10px; margin-bottom: 1.5rem; border-left: 4px solid #22c55e;">
     <p style="margin: 0; color: #065f46; font-size: 1.05rem; font-weight: 600;">Translation Feature: Select a target language and translate all topic transcripts.</p>
@@ -1146,6 +1331,13 @@ st.markdown("""
 </div>
 """, unsafe_allow_html=True)
 
+romanization_schemes = st.multiselect(
+    "Romanization Schemes",
+    list(ROMANIZATION_SCHEMES),
+    default=[DEFAULT_SCHEME],
+    format_func=str.upper
+)
+
 if st.button("Romanize Translations", type="primary"):
     with st.spinner("Romanizing..."):
         st.markdown(f"### Romanized Transcripts ({target_lang})")
@@ -1159,7 +1351,7 @@ if st.button("Romanize Translations", type="primary"):
                 try:
                     # Use the target_lang selected in the Translation section
                     translated = translate_auto(topic_text, "en", LANGUAGES[target_lang])
-                    romanized = romanize_text(translated, LANGUAGES[target_lang])
+                    romanized = romanize_schemes(translated, LANGUAGES[target_lang], romanization_schemes)
                     
                     st.markdown(f"**Topic {topic_display_id}:**")
                     st.markdown(f"""
@@ -1169,13 +1361,14 @@ if st.button("Romanize Translations", type="primary"):
                     </div>
                     """, unsafe_allow_html=True)
                     
-                    st.markdown(f"""
-                    <div>
-                        <strong>Romanization:</strong>
-                        <div class="localization-box" style="margin-top: 0.5rem;">{romanized}</div>
-                    </div>
-                    <hr style="margin: 2rem 0;">
-                    """, unsafe_allow_html=True)
+                    for scheme, romanized_text in romanized.items():
+                        st.markdown(f"""
+                        <div style="margin-bottom: 1rem;">
+                            <strong>Romanization ({scheme.upper()}):</strong>
+                            <div class="localization-box" style="margin-top: 0.5rem;">{romanized_text}</div>
+                        </div>
+                        """, unsafe_allow_html=True)
+                    st.markdown('<hr style="margin: 2rem 0;">', unsafe_allow_html=True)
                     
                 except Exception as e:
                     st.error(f"Romanization error for Topic {topic_display_id}: {str(e)}")
@@ -0,0 +1,67 @@
+"""
+live_view.py — Live Mode Panel
+------------------------------
+Polls outputs/live_output.json written by pipeline/live_pipeline.py and
+renders the rolling transcript, the topic currently being formed and the
+finalized topics. Only this fragment reruns on every poll, not the page.
+"""
+
+import json
+from pathlib import Path
+
+import streamlit as st
+
+LIVE_REFRESH_SECONDS = 2
+LIVE_TRANSCRIPT_SEGMENTS = 30  # most recent segments shown
+
+
+def load_live_snapshot(live_output: Path):
+    try:
+        with open(live_output, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return None
+
+
+@st.fragment(run_every=LIVE_REFRESH_SECONDS)
+def render_live_view(live_output: Path):
+    snapshot = load_live_snapshot(live_output)
+
+    if not snapshot:
+        st.info("Waiting for the live stream to start...")
+        return
+
+    status = snapshot.get("status", "live")
+    lag = snapshot.get("audio_seconds", 0) - snapshot.get("transcribed_seconds", 0)
+    col1, col2, col3 = st.columns(3)
+    labels = {"live": "🔴 LIVE", "failed": "❌ Failed"}
+    col1.metric("Status", labels.get(status, "✅ Finished"))
+    col2.metric("Audio received", f"{snapshot.get('audio_seconds', 0):.0f}s")
+    col3.metric("Transcription lag", f"{max(lag, 0):.0f}s")
+
+    if snapshot.get("error"):
+        st.error(f"Stream decoding failed: {snapshot['error']}")
+
+    segments = snapshot.get("segments", [])[-LIVE_TRANSCRIPT_SEGMENTS:]
+    if segments:
+        st.markdown("### Live Transcript")
+        transcript = " ".join(seg.get("translation") or seg.get("text", "") for seg in segments)
+        st.markdown(f'<div class="transcript-box">{transcript}</div>', unsafe_allow_html=True)
+
+    open_topic = snapshot.get("open_topic") or {}
+    if open_topic.get("sentences"):
+        st.markdown(
+            f"### Current Topic (since {open_topic.get('start', 0):.0f}s, "
+            f"{len(open_topic['sentences'])} sentences)"
+        )
+        st.markdown(f'<div class="topic-box">{" ".join(open_topic["sentences"])}</div>', unsafe_allow_html=True)
+
+    topics = snapshot.get("topics", [])
+    if topics:
+        st.markdown(f"### Topics ({len(topics)})")
+        st.caption(f"{len(snapshot.get('3D_Animation_Output', []))} animation nodes ready for the 3D view")
+        for topic in reversed(topics):
+            with st.expander(f"{topic.get('start', 0):.0f}s – {topic.get('end', 0):.0f}s · {topic.get('topic_title', '')}"):
+                st.write(topic.get("summary", ""))
+                if topic.get("keywords"):
+                    st.caption(", ".join(topic["keywords"]))